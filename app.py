@@ -7,13 +7,20 @@ the TalentSelectionFlow and HRConsultingCrew, and maintains a conversation
 history for follow-up Q&A.
 """
 
+import os
 from typing import Any
 
 import chainlit as cl
 import pymupdf4llm
 
 from src.talent_selection_flow.crews.hr_consultant_crew.crew import HRConsultingCrew
+from src.talent_selection_flow.crews.pool import CREW_POOL
 from src.talent_selection_flow.flow import TalentSelectionFlow
+from src.utils.metrics import kickoff_crew, serve_metrics
+
+# Expose the Prometheus endpoint when requested (e.g., `METRICS_PORT=9108 chainlit run app.py`)
+if os.getenv("METRICS_PORT"):
+    serve_metrics(int(os.environ["METRICS_PORT"]))
 
 
 def get_actions() -> list[Any]:
@@ -36,6 +43,7 @@ async def run_talent_flow() -> None:
 
     This function handles the initial user interaction (choosing input mode),
     processes the input (PDF or Text), triggers the multi-agent selection flow,
+    streams the report sections into the chat as soon as they are available,
     and stores results in the user session.
     """
 
@@ -66,10 +74,15 @@ async def run_talent_flow() -> None:
         input_doc = res["output"]
 
     # Visual Orchestration
+    msg = cl.Message(content="")
     async with cl.Step(name="Talent Selection Flow", type="run") as step:
         step.input = "⚙️ Orchestrating agents for evaluation..."
-        flow = TalentSelectionFlow(verbose=True)
-        result = await cl.make_async(flow.kickoff)(inputs={"raw_input": input_doc})
+        # Interactive use favours time-to-report over token spend
+        flow = TalentSelectionFlow(verbose=True, speculative_extraction=True, per_document_analysis=True)
+        # Show each section as soon as its data exists instead of waiting for the whole flow
+        async for section in flow.stream_report(inputs={"raw_input": input_doc}):
+            await msg.stream_token(f"{section}\n\n")
+        result = flow.state.report
         step.output = f"**Evaluation complete for** *{file_name}*:\n{input_doc}"
 
     # Store the user input in the session for the Q&A loop
@@ -82,11 +95,14 @@ async def run_talent_flow() -> None:
     context_note = (
         "\n\n*> 💡 Context: I'm currently tracking the last 6 messages to stay focused on our immediate conversation.*"
     )
-    await cl.Message(
-        content=f"### ✅ Evaluation Result\n\n{result}\n\n---\n💬 **You can now ask follow-up questions "
+    # Replace the streamed sections with the complete report, in reading order
+    await msg.stream_token(
+        f"### ✅ Evaluation Result\n\n{result}\n\n---\n💬 **You can now ask follow-up questions "
         f"about this candidate, or click the button above to reset.**{context_note}",
-        actions=get_actions(),
-    ).send()
+        is_sequence=True,
+    )
+    msg.actions = get_actions()
+    await msg.send()
 
 
 # --- EVENT HANDLERS ---
@@ -156,20 +172,26 @@ async def handle_chat(message: cl.Message) -> None:
 
     async with cl.Step(name="HR Consultant Flow", type="llm") as step:
         step.input = "⚙️ Orchestrating agents for evaluation..."
-        crew = HRConsultingCrew(verbose=True)
-        res = await cl.make_async(crew.crew().kickoff)(
-            inputs={
-                "report": report,
-                "context_summary": context_summary,
-                "message": message.content,
-            }
-        )
+        msg = cl.Message(content="")
+        with CREW_POOL.lease(HRConsultingCrew, verbose=True, stream=True) as crew:
+            res = await kickoff_crew(
+                crew,
+                inputs={
+                    "report": report,
+                    "context_summary": context_summary,
+                    "message": message.content,
+                },
+                on_token=msg.stream_token,
+            )
 
         # 3. Update history: Add current turn and save back to session
         history.append(f"User: {message.content}")
         history.append(f"Consultant: {res.raw}")
         cl.user_session.set("chat_history", history)
-        await cl.Message(content=res.raw, actions=get_actions()).send()
+        # The stream may include the agent's reasoning, so keep only the final answer
+        await msg.stream_token(res.raw, is_sequence=True)
+        msg.actions = get_actions()
+        await msg.send()
         step.output = "Evaluation complete."
 
 
@@ -0,0 +1,98 @@
+"""
+Chroma Handle Cache Latency Benchmark.
+
+Measures the per-query latency of the vector search when the ChromaDB client
+and collection are opened on every query (as `get_client` + `get_collection`
+do) and when they come from the process-wide `CHROMA_HANDLES` cache. The
+collection lives in a temporary directory and the Jina embedding function is
+replaced by a local hashing embedder, so the numbers isolate the
+open/initialize cost from the embedding API latency.
+
+Usage:
+    python -m benchmarks.chroma_handles --queries 200 --documents 500
+"""
+
+import argparse
+import hashlib
+import statistics
+import tempfile
+import time
+from collections.abc import Callable
+from typing import Any
+from unittest import mock
+
+from chromadb.api.types import Documents, EmbeddingFunction, Embeddings
+
+from src.db_ingestion import chroma_client
+from src.db_ingestion.chroma_client import ChromaHandleCache, get_client, get_collection
+
+
+class HashingEmbeddingFunction(EmbeddingFunction[Documents]):
+    """Deterministic local embedder: a bag of hashed words in 64 dimensions."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        """Accepts and ignores the Jina embedding function arguments."""
+
+    def __call__(self, input: Documents) -> Embeddings:
+        """Embeds each text as normalized counts of its hashed words."""
+        embeddings = []
+        for text in input:
+            vector = [0.0] * 64
+            for word in text.lower().split():
+                vector[int(hashlib.md5(word.encode()).hexdigest(), 16) % 64] += 1.0
+            norm = sum(v * v for v in vector) ** 0.5 or 1.0
+            embeddings.append([v / norm for v in vector])
+        return embeddings
+
+
+def measure(query: Callable[[str], Any], texts: list[str]) -> list[float]:
+    """Runs one query per text and returns the latencies in seconds."""
+    latencies = []
+    for text in texts:
+        start = time.perf_counter()
+        query(text)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main(queries: int, documents: int, top_k: int) -> None:
+    """Populates a temporary collection and prints the per-query latency with and without the handle cache."""
+    words = ["python", "java", "sql", "docker", "sales", "finance", "nurse", "teacher", "react", "aws", "excel"]
+    texts = [" ".join(words[(i * j) % len(words)] for j in range(1, 12)) for i in range(queries)]
+
+    with (
+        tempfile.TemporaryDirectory() as persist_dir,
+        mock.patch.object(chroma_client, "JinaEmbeddingFunction", HashingEmbeddingFunction),
+    ):
+        collection = get_collection(get_client(persist_dir), "jobs")
+        for start in range(0, documents, 100):
+            ids = [f"job_{i}" for i in range(start, min(start + 100, documents))]
+            collection.add(ids=ids, documents=[texts[i % queries] for i in range(start, start + len(ids))])
+
+        def uncached(text: str) -> Any:
+            handle = get_collection(get_client(persist_dir), "jobs")
+            return handle.query(query_texts=[text], n_results=top_k)
+
+        handles = ChromaHandleCache()
+
+        def cached(text: str) -> Any:
+            return handles.collection("jobs", persist_dir=persist_dir).query(query_texts=[text], n_results=top_k)
+
+        cached(texts[0])  # open the handles once, as the first flow of a process would
+        results = {"open per query": measure(uncached, texts), "cached handles": measure(cached, texts)}
+        handles.close()
+
+    print(f"Queries: {queries} | documents: {documents} | top_k: {top_k}")
+    print(f"{'strategy':>15} | {'mean (ms)':>10} | {'p95 (ms)':>9}")
+    for name, latencies in results.items():
+        p95 = statistics.quantiles(latencies, n=20)[-1]
+        print(f"{name:>15} | {statistics.mean(latencies) * 1e3:>10.3f} | {p95 * 1e3:>9.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--documents", type=int, default=500)
+    parser.add_argument("--top-k", type=int, default=3)
+    args = parser.parse_args()
+    main(args.queries, args.documents, args.top_k)
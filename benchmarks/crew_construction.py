@@ -0,0 +1,69 @@
+"""
+Crew Construction Micro-Benchmark.
+
+Measures the cost of obtaining a ready-to-run crew for every crew used by the
+flow, either by building it from its CrewBase class (YAML parsing, variable
+mapping, Agent/Task/Crew creation) as each flow step used to do, or by leasing
+it from the process-wide `CrewPool`, once warmed up. No LLM is called.
+
+Usage:
+    python -m benchmarks.crew_construction --repeats 50
+"""
+
+import argparse
+import statistics
+import time
+from collections.abc import Callable
+
+from src.talent_selection_flow.crews.classification_crew.crew import ClassificationCrew
+from src.talent_selection_flow.crews.cv_to_job_crew.crew import CVToJobCrew
+from src.talent_selection_flow.crews.job_to_cv_crew.crew import JobToCVCrew
+from src.talent_selection_flow.crews.metadata_extraction_crew.crews import (
+    CVMetadataExtractorCrew,
+    JobMetadataExtractorCrew,
+)
+from src.talent_selection_flow.crews.pool import CrewPool
+
+CREWS: list[tuple[type, str]] = [
+    (ClassificationCrew, "crew"),
+    (CVMetadataExtractorCrew, "crew"),
+    (JobMetadataExtractorCrew, "crew"),
+    (CVToJobCrew, "crew"),
+    (CVToJobCrew, "gap_analysis_crew"),
+    (JobToCVCrew, "crew"),
+]
+
+
+def time_ms(fn: Callable[[], object], repeats: int) -> tuple[float, float]:
+    """Runs `fn` `repeats` times and returns the mean and p95 latency in milliseconds."""
+    latencies = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - start) * 1e3)
+    return statistics.mean(latencies), statistics.quantiles(latencies, n=20)[-1]
+
+
+def main(repeats: int) -> None:
+    """Prints the construction cost per crew with and without the pool."""
+    pool = CrewPool()
+
+    def lease(crew_cls: type, factory: str) -> None:
+        with pool.lease(crew_cls, factory=factory, verbose=False):
+            pass
+
+    print(f"{'crew':>45} | {'build mean/p95 (ms)':>20} | {'pool mean/p95 (ms)':>19}")
+    for crew_cls, factory in CREWS:
+        build = time_ms(lambda c=crew_cls, f=factory: getattr(c(verbose=False), f)(), repeats)
+        lease(crew_cls, factory)  # warm up: parse the YAML once
+        pooled = time_ms(lambda c=crew_cls, f=factory: lease(c, f), repeats)
+        name = f"{crew_cls.__name__}.{factory}"
+        print(f"{name:>45} | {build[0]:>9.3f} / {build[1]:>8.3f} | {pooled[0]:>8.3f} / {pooled[1]:>8.3f}")
+
+    print(f"Crews built from YAML by the pool: {pool.built}, copies: {pool.copied}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeats", type=int, default=50, help="Constructions timed per crew.")
+    main(parser.parse_args().repeats)
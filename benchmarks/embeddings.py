@@ -0,0 +1,73 @@
+"""
+Embedding Backend Throughput and Latency Benchmark.
+
+Embeds the processed CV and job corpora with the local ONNX backend for each
+combination of batch size and thread count, and reports the bulk throughput
+(documents per second, as in an ingestion) and the single-query latency (as in
+the flow's vector search). Pass `--backends jina local` to compare with the
+Jina AI API (requires `EMBEDDING_API_KEY` and `EMBEDDING_MODEL`).
+
+Usage:
+    python -m benchmarks.embeddings --batch-sizes 8 32 64 --threads 1 4 --queries 20
+"""
+
+import argparse
+import statistics
+import time
+from typing import Any
+
+import pandas as pd
+
+from src.config.paths import CVS_PATH_PROCESSED, JOBS_PATH_PROCESSED
+from src.db_ingestion.chroma_client import get_embedding_function
+from src.db_ingestion.local_embeddings import EmbeddingBackend, LocalEmbeddingFunction
+
+
+def measure(embedding_fn: Any, docs: list[str], queries: int) -> tuple[float, float, float]:
+    """Returns the bulk throughput (docs/sec) and the mean and p95 single-query latencies (ms)."""
+    embedding_fn(docs[:1])  # load the model / open the connection outside the timings
+    start = time.perf_counter()
+    embedding_fn(docs)
+    throughput = len(docs) / (time.perf_counter() - start)
+
+    latencies = []
+    for doc in docs[:queries]:
+        start = time.perf_counter()
+        embedding_fn([doc])
+        latencies.append((time.perf_counter() - start) * 1e3)
+    return throughput, statistics.mean(latencies), statistics.quantiles(latencies, n=20)[-1]
+
+
+def main(backends: list[str], batch_sizes: list[int], threads: list[int], limit: int | None, queries: int) -> None:
+    """Embeds the corpora with every configuration and prints throughput and latency."""
+    docs = pd.read_csv(CVS_PATH_PROCESSED, sep=";")["content"].tolist()
+    docs += pd.read_csv(JOBS_PATH_PROCESSED, sep=";")["content"].tolist()
+    docs = docs[:limit]
+    print(f"Documents: {len(docs)} | single queries: {queries}")
+
+    configs: list[tuple[str, Any]] = []
+    for backend in map(EmbeddingBackend, backends):
+        if backend == EmbeddingBackend.LOCAL:
+            configs += [
+                (f"local batch={size} threads={n or 'auto'}", LocalEmbeddingFunction(batch_size=size, threads=n))
+                for size in batch_sizes
+                for n in threads
+            ]
+        else:
+            configs.append((str(backend), get_embedding_function(backend)))
+
+    print(f"{'backend':>32} | {'docs/sec':>9} | {'query mean (ms)':>15} | {'query p95 (ms)':>14}")
+    for name, embedding_fn in configs:
+        throughput, mean, p95 = measure(embedding_fn, docs, queries)
+        print(f"{name:>32} | {throughput:>9.1f} | {mean:>15.2f} | {p95:>14.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", nargs="+", choices=list(EmbeddingBackend), default=[EmbeddingBackend.LOCAL])
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[8, 32, 64])
+    parser.add_argument("--threads", type=int, nargs="+", default=[0], help="ONNX Runtime threads (0 = auto).")
+    parser.add_argument("--limit", type=int, default=None, help="Only embed the first N documents.")
+    parser.add_argument("--queries", type=int, default=20)
+    args = parser.parse_args()
+    main(args.backends, args.batch_sizes, args.threads, args.limit, args.queries)
@@ -0,0 +1,160 @@
+"""
+Flow Concurrency Benchmark.
+
+Measures how many TalentSelectionFlow evaluations per minute a single process
+can complete when many evaluations share one event loop. The LLM is mocked at
+the `Crew.akickoff` level (a fixed non-blocking sleep per task followed by
+canned, schema-valid outputs) and the vector search is mocked as well, so the
+numbers isolate the orchestration overhead from provider latency and quotas.
+Crews run natively on the event loop, so shrinking the default executor with
+`--max-threads` should not cap the throughput.
+
+Usage:
+    python -m benchmarks.flow_concurrency --evaluations 64 --concurrency 1 8 32 64 --llm-latency 0.5
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from unittest import mock
+
+from crewai import Crew, CrewOutput, TaskOutput
+
+from src.talent_selection_flow import flow as flow_module
+from src.talent_selection_flow.flow import TalentSelectionFlow
+
+CV_TEXT = "# CURRICULUM VITAE\n## EXPERIENCE\nSenior Python developer.\n## SKILLS\nPython, FastAPI, Docker"
+
+FAKE_RELATED_DOCS: dict[str, Any] = {
+    f"job_{i}": {
+        "title": f"Backend Engineer {i}",
+        "similarity": 0.8,
+        "skills": "Python, FastAPI",
+        "industries": "Software",
+        "experience_level": "senior",
+        "summary": "Backend role.",
+        "country": "US",
+    }
+    for i in range(3)
+}
+
+CANNED_OUTPUTS: dict[str, list[str]] = {
+    "Document classification crew": ["cv"],
+    "CV metadata extraction crew": [
+        json.dumps(
+            {
+                "skills": "Python, FastAPI, Docker",
+                "industries": "Software",
+                "experience_level": "senior",
+                "country": "US",
+                "summary": "Senior Python developer.",
+                "education_level": "bachelor",
+                "languages": "English",
+            }
+        )
+    ],
+    "CV to Job crew": [
+        json.dumps(
+            {
+                "docs": {
+                    k: {"matched_skills": ["Python"], "missing_must_have": ["Kubernetes"]} for k in FAKE_RELATED_DOCS
+                }
+            }
+        ),
+        json.dumps(
+            {
+                "docs": {
+                    k: {
+                        "matched_skill_questions": [{"question": "Q?", "response": "A."}],
+                        "gap_probing_questions": [{"question": "Q?", "response": "A."}],
+                        "ambiguity_clarification_questions": [{"question": "Q?", "response": "A."}],
+                        "seniority_questions": [{"question": "Q?", "response": "A."}],
+                    }
+                    for k in FAKE_RELATED_DOCS
+                }
+            }
+        ),
+    ],
+}
+
+
+def make_fake_kickoff(llm_latency: float):
+    """
+    Builds a replacement for `Crew.akickoff` that simulates one LLM call per task.
+
+    Args:
+        llm_latency (float): Seconds awaited per task to emulate provider latency.
+
+    Returns:
+        Callable: A drop-in `Crew.akickoff` implementation.
+    """
+
+    async def fake_kickoff(self: Crew, inputs: dict[str, Any] | None = None) -> CrewOutput:
+        outputs: list[TaskOutput] = []
+        for task, raw in zip(self.tasks, CANNED_OUTPUTS[self.name], strict=True):
+            await asyncio.sleep(llm_latency)
+            task.output = TaskOutput(
+                description=task.description,
+                agent=task.agent.role if task.agent else "",
+                raw=raw,
+                json_dict=json.loads(raw) if raw.startswith("{") else None,
+            )
+            outputs.append(task.output)
+        return CrewOutput(raw=outputs[-1].raw, tasks_output=outputs, json_dict=outputs[-1].json_dict)
+
+    return fake_kickoff
+
+
+async def fake_query(**kwargs: Any) -> dict[str, Any]:
+    """Mocked vector search returning a fixed set of matches."""
+    await asyncio.sleep(0.01)
+    return FAKE_RELATED_DOCS
+
+
+async def run_batch(evaluations: int, concurrency: int) -> float:
+    """
+    Runs `evaluations` flows with at most `concurrency` in flight.
+
+    Returns:
+        float: Elapsed wall time in seconds.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with semaphore:
+            # Caches would turn every evaluation after the first into a lookup
+            flow = TalentSelectionFlow(verbose=False, use_result_cache=False, use_metadata_cache=False)
+            await flow.kickoff_async(inputs={"raw_input": CV_TEXT})
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(evaluations)))
+    return time.perf_counter() - start
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Runs the benchmark for each concurrency level and prints a summary table."""
+    if args.max_threads:
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=args.max_threads))
+
+    print(f"{'concurrency':>12} | {'elapsed (s)':>12} | {'evaluations/min':>16}")
+    for concurrency in args.concurrency:
+        elapsed = await run_batch(args.evaluations, concurrency)
+        print(f"{concurrency:>12} | {elapsed:>12.2f} | {args.evaluations / elapsed * 60:>16.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--evaluations", type=int, default=64, help="Number of evaluations per concurrency level.")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 64])
+    parser.add_argument("--llm-latency", type=float, default=0.5, help="Mocked seconds per LLM task.")
+    parser.add_argument("--max-threads", type=int, default=None, help="Size of the default executor.")
+    cli_args = parser.parse_args()
+
+    with (
+        mock.patch.object(Crew, "akickoff", make_fake_kickoff(cli_args.llm_latency)),
+        mock.patch.object(flow_module, "query_to_collection_async", fake_query),
+    ):
+        asyncio.run(main(cli_args))
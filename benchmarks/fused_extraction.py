@@ -0,0 +1,80 @@
+"""
+Fused Extraction Latency Benchmark.
+
+Compares the latency of the two-call path (ClassificationCrew followed by the
+matching MetadataExtractorCrew) against the single-call FusedExtractionCrew on
+a sample of the processed CV and job corpora. This benchmark calls the real
+LLM provider configured in `.env`, so it consumes quota.
+
+Usage:
+    python -m benchmarks.fused_extraction --samples 5
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import pandas as pd
+
+from src.config.paths import CVS_PATH_PROCESSED, JOBS_PATH_PROCESSED
+from src.talent_selection_flow.crews.classification_crew.crew import ClassificationCrew
+from src.talent_selection_flow.crews.classification_crew.enums import DocumentType
+from src.talent_selection_flow.crews.fused_extraction_crew.crew import FusedExtractionCrew
+from src.talent_selection_flow.crews.metadata_extraction_crew.crews import (
+    CVMetadataExtractorCrew,
+    JobMetadataExtractorCrew,
+)
+from src.talent_selection_flow.crews.metadata_extraction_crew.enums import (
+    EducationLevel,
+    EmploymentType,
+    ExperienceLevel,
+)
+
+OPTIONS = {
+    "output_options": "/".join(DocumentType),
+    "educationlevel_options": "/".join(EducationLevel),
+    "employmenttype_options": "/".join(EmploymentType),
+    "experiencelevel_options": "/".join(ExperienceLevel),
+}
+
+
+async def two_call_path(text: str) -> str:
+    """Runs classification and then metadata extraction, returning the document type."""
+    result = await ClassificationCrew().crew().akickoff(inputs={"user_input": text, **OPTIONS})
+    if result.raw == DocumentType.CV:
+        await CVMetadataExtractorCrew().crew().akickoff(inputs={"content": text, **OPTIONS})
+    elif result.raw == DocumentType.JOB:
+        await JobMetadataExtractorCrew().crew().akickoff(inputs={"content": text, **OPTIONS})
+    return result.raw
+
+
+async def fused_path(text: str) -> str:
+    """Runs the fused crew, returning the document type."""
+    result = await FusedExtractionCrew().crew().akickoff(inputs={"user_input": text, **OPTIONS})
+    return result.json_dict["document_type"]
+
+
+async def main(samples: int) -> None:
+    """Times both paths on the same documents and prints a summary."""
+    docs = [(text, DocumentType.CV) for text in pd.read_csv(CVS_PATH_PROCESSED, sep=";")["content"][:samples]]
+    docs += [(text, DocumentType.JOB) for text in pd.read_csv(JOBS_PATH_PROCESSED, sep=";")["content"][:samples]]
+
+    for name, path in (("two-call", two_call_path), ("fused", fused_path)):
+        latencies: list[float] = []
+        correct = 0
+        for text, expected in docs:
+            start = time.perf_counter()
+            predicted = await path(text)
+            latencies.append(time.perf_counter() - start)
+            correct += predicted == expected
+        print(
+            f"{name:>9} | mean {statistics.mean(latencies):6.2f}s | p50 {statistics.median(latencies):6.2f}s | "
+            f"accuracy {correct / len(docs):.2%} over {len(docs)} documents"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=5, help="Documents sampled per corpus.")
+    asyncio.run(main(parser.parse_args().samples))
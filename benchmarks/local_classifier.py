@@ -0,0 +1,130 @@
+"""
+Local Classifier Accuracy and Latency Benchmark.
+
+Evaluates `classify_locally` on documents it was not tuned on, plus a few
+out-of-scope snippets. For each confidence threshold it reports the coverage
+(share of documents that skip the ClassificationCrew) and the accuracy on the
+covered documents, plus the per-document classification latency.
+
+Two sources of held-out documents are supported:
+    - Raw corpus rows that are not part of the processed samples, rendered as
+      plain text: the `### Title` headings added by `notebooks/data_process.ipynb`
+      are not real-world features and would inflate the confidence.
+    - Directories of real uploads (PDF, Markdown or text files), one per label.
+
+Usage:
+    python -m benchmarks.local_classifier --samples 500 --thresholds 0.7 0.8 0.9 0.95
+    python -m benchmarks.local_classifier --no-corpus --cv-dir uploads/cvs --job-dir uploads/jobs
+"""
+
+import argparse
+import statistics
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from src.config.paths import CVS_PATH_PROCESSED, CVS_PATH_RAW, JOBS_PATH_PROCESSED, JOBS_PATH_RAW
+from src.talent_selection_flow.batch import SUPPORTED_SUFFIXES, load_document
+from src.talent_selection_flow.crews.classification_crew.enums import DocumentType
+from src.talent_selection_flow.crews.classification_crew.local_classifier import classify_locally
+
+OTHER_SNIPPETS = [
+    "tot el camp és un clam, som la gent blaugrana",
+    "Preheat the oven to 180 degrees and whisk the eggs with the sugar until fluffy.",
+    "The quarterly revenue grew by 12% driven by strong demand in the APAC region.",
+]
+
+# Free-text fields of a raw job posting, in reading order
+JOB_TEXT_FIELDS = ["title", "company_profile", "description", "requirements", "benefits"]
+
+
+def _processed_ids(path: Path) -> set[str]:
+    """Returns the document IDs of a processed corpus, or an empty set if it was not generated."""
+    return set(pd.read_csv(path, sep=";")["doc_id"].astype(str)) if path.exists() else set()
+
+
+def holdout_documents(samples: int, seed: int) -> list[tuple[str, DocumentType]]:
+    """
+    Samples raw corpus documents that are not part of the processed corpora.
+
+    Args:
+        samples (int): Maximum number of documents per type.
+        seed (int): Random seed of the sample.
+
+    Returns:
+        list[tuple[str, DocumentType]]: The plain-text documents and their expected type.
+    """
+    cvs = pd.read_csv(CVS_PATH_RAW, sep=";")
+    cvs = cvs[~cvs["ID"].astype(str).isin(_processed_ids(CVS_PATH_PROCESSED))]
+    cvs = cvs.sample(min(samples, len(cvs)), random_state=seed)
+
+    jobs = pd.read_csv(JOBS_PATH_RAW, sep=";")
+    jobs = jobs[~jobs["job_id"].astype(str).isin(_processed_ids(JOBS_PATH_PROCESSED))]
+    jobs = jobs.sample(min(samples, len(jobs)), random_state=seed)
+
+    docs = [(text, DocumentType.CV) for text in cvs["Resume_str"].dropna()]
+    for _, row in jobs.iterrows():
+        text = "\n\n".join(str(row[field]) for field in JOB_TEXT_FIELDS if pd.notna(row[field]))
+        docs.append((text, DocumentType.JOB))
+    return docs
+
+
+def directory_documents(directory: Path, document_type: DocumentType) -> list[tuple[str, DocumentType]]:
+    """
+    Loads the supported documents of a directory, all labelled with `document_type`.
+
+    Args:
+        directory (Path): Directory scanned recursively.
+        document_type (DocumentType): The expected type of every document.
+
+    Returns:
+        list[tuple[str, DocumentType]]: The documents and their expected type.
+    """
+    files = [file for file in sorted(directory.rglob("*")) if file.suffix.lower() in SUPPORTED_SUFFIXES]
+    return [(load_document(file), document_type) for file in files]
+
+
+def main(args: argparse.Namespace) -> None:
+    """Classifies every held-out document and prints accuracy, coverage and latency."""
+    docs: list[tuple[str, DocumentType]] = []
+    if args.corpus:
+        docs += holdout_documents(args.samples, args.seed)
+    for directory in args.cv_dir:
+        docs += directory_documents(directory, DocumentType.CV)
+    for directory in args.job_dir:
+        docs += directory_documents(directory, DocumentType.JOB)
+    docs += [(text, DocumentType.OTHER) for text in OTHER_SNIPPETS]
+
+    predictions: list[tuple[DocumentType, float, DocumentType]] = []
+    latencies: list[float] = []
+    for text, expected in docs:
+        start = time.perf_counter()
+        predicted, confidence = classify_locally(text)
+        latencies.append(time.perf_counter() - start)
+        predictions.append((predicted, confidence, expected))
+
+    counts = {document_type: sum(e == document_type for _, _, e in predictions) for document_type in DocumentType}
+    overall = sum(p == e for p, _, e in predictions) / len(predictions)
+    print(f"Documents: {len(docs)} ({', '.join(f'{t}: {n}' for t, n in counts.items())})")
+    print(f"Overall accuracy (no threshold): {overall:.2%}")
+    print(f"Latency: mean {statistics.mean(latencies) * 1e3:.3f} ms | max {max(latencies) * 1e3:.3f} ms")
+    print(f"{'threshold':>10} | {'coverage':>9} | {'accuracy on covered':>20} | {'false positives':>15}")
+    for threshold in args.thresholds:
+        covered = [(p, e) for p, c, e in predictions if c >= threshold]
+        accuracy = sum(p == e for p, e in covered) / len(covered) if covered else float("nan")
+        false_positives = sum(p != e for p, e in covered)
+        print(
+            f"{threshold:>10.2f} | {len(covered) / len(predictions):>9.2%} | {accuracy:>20.2%} | {false_positives:>15}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--thresholds", type=float, nargs="+", default=[0.7, 0.8, 0.9, 0.95])
+    parser.add_argument("--samples", type=int, default=500, help="Held-out corpus documents per type.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-corpus", dest="corpus", action="store_false", help="Skip the held-out corpus rows.")
+    parser.add_argument("--cv-dir", type=Path, action="append", default=[], help="Directory of real CVs.")
+    parser.add_argument("--job-dir", type=Path, action="append", default=[], help="Directory of real job postings.")
+    main(parser.parse_args())
@@ -7,6 +7,11 @@ RAW_DIR = DATA_DIR / "raw"
 CHROMA_DIR = DATA_DIR / "chroma"
 PROCESSED_DIR = DATA_DIR / "processed"
 REPORTS_DIR = DATA_DIR / "reports"
+CACHE_DIR = DATA_DIR / "cache"
+CHECKPOINTS_DIR = DATA_DIR / "checkpoints"
+METRICS_DIR = DATA_DIR / "metrics"
+CREWS_DIR = BASE_DIR / "src" / "talent_selection_flow" / "crews"
+SKILLS_DIR = BASE_DIR / "src" / "skills"
 
 JOBS_PATH_RAW = RAW_DIR / "vacantes_dataset.csv"
 CVS_PATH_RAW = RAW_DIR / "cvs_dataset.csv"
@@ -14,4 +19,11 @@ CVS_PATH_RAW = RAW_DIR / "cvs_dataset.csv"
 JOBS_PATH_PROCESSED = PROCESSED_DIR / "jobs_processed.csv"
 CVS_PATH_PROCESSED = PROCESSED_DIR / "cvs_processed.csv"
 
-REPORT_OUTPUT_PATH = REPORTS_DIR / "latest_report.md"
+
+FLOW_CACHE_PATH = CACHE_DIR / "flow_results.sqlite3"
+METADATA_CACHE_PATH = CACHE_DIR / "metadata.sqlite3"
+
+FLOW_CHECKPOINTS_PATH = CHECKPOINTS_DIR / "flow_states.sqlite3"
+INGESTION_JOURNAL_PATH = CHECKPOINTS_DIR / "ingestion_journal.sqlite3"
+
+RUN_METRICS_PATH = METRICS_DIR / "runs.jsonl"
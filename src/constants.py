@@ -1 +1,21 @@
 GUARDRAIL_MAX_RETRIES = 3
+BATCH_MAX_CONCURRENCY = 4
+LOCAL_CLASSIFIER_THRESHOLD = None
+FLOW_CACHE_TTL_SECONDS = 7 * 24 * 3600
+FLOW_CACHE_MAX_ENTRIES = 1000
+METRICS_WINDOW = 1024
+METRICS_PORT = 9108
+QUERY_TOP_K = 3
+QUERY_MIN_SIMILARITY = None
+INPUT_TOKEN_BUDGET = None
+SKILL_FUZZY_THRESHOLD = 0.88
+SKILL_MATCHING_MODE = "refine"
+RECANONICALIZE_BATCH_SIZE = 500
+EMBEDDING_CACHE_MAX_ENTRIES = 1024
+LOCAL_EMBEDDING_BATCH_SIZE = 32
+LOCAL_EMBEDDING_THREADS = 0
+INGESTION_CONCURRENCY = 8
+INGESTION_BATCH_SIZE = 64
+COLLECTION_SCAN_BATCH_SIZE = 1000
+INGESTION_RETRY_MAX_ATTEMPTS = 3
+INGESTION_RETRY_BACKOFF_SECONDS = 30
@@ -6,9 +6,10 @@ client initialization, collection management, document ingestion with
 automated metadata extraction, and semantic search with fallback strategies.
 """
 
-import json
+import asyncio
 import os
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -19,6 +20,21 @@ from dotenv import load_dotenv
 from tqdm import tqdm
 
 from src.config.paths import CHROMA_DIR
+from src.constants import (
+    INGESTION_BATCH_SIZE,
+    INGESTION_CONCURRENCY,
+    LOCAL_EMBEDDING_BATCH_SIZE,
+    LOCAL_EMBEDDING_THREADS,
+    QUERY_MIN_SIMILARITY,
+    QUERY_TOP_K,
+    RECANONICALIZE_BATCH_SIZE,
+)
+from src.db_ingestion.local_embeddings import EmbeddingBackend, LocalEmbeddingFunction
+from src.db_ingestion.pipeline import IngestionStats, ingest_corpus
+from src.skills.canonicalizer import SKILL_CANONICALIZER
+from src.storage.embedding_cache import EmbeddingCache
+from src.storage.flow_cache import FlowResultCache
+from src.storage.metadata_cache import MetadataCache
 from src.utils.logger import logger
 
 # Load environment variables from .env file
@@ -40,46 +56,212 @@ def get_client(persist_dir: str = str(CHROMA_DIR)) -> Any:
     return chromadb.PersistentClient(path=persist_dir)
 
 
-def get_collection(client: Any, collection_name: str) -> Any:
+def get_embedding_function(backend: str | None = None) -> Any:
     """
-    Get an existing collection or create a new one with specific distance metrics.
+    Builds the embedding function of the configured backend from the environment settings.
 
-    Uses Jina AI embeddings and configures the HNSW space for cosine similarity.
+    The backend is read from `EMBEDDING_BACKEND` ('jina' by default, or 'local'
+    to embed offline on CPU, see `LocalEmbeddingFunction`). The local backend
+    reads its batch size and thread count from `EMBEDDING_BATCH_SIZE` and
+    `EMBEDDING_THREADS`. Collections must be queried with the backend they were
+    ingested with.
 
     Args:
-        client (Any): The initialized ChromaDB client.
-        collection_name (str): The name of the collection to access or create.
+        backend (str, optional): The embedding backend. Defaults to the `EMBEDDING_BACKEND` setting.
 
     Returns:
-        chromadb.Collection: The requested ChromaDB collection object.
+        Any: The embedding function used by the collections and the query embeddings.
     """
-    embedding_fn = JinaEmbeddingFunction(
+    backend = EmbeddingBackend(backend or os.getenv("EMBEDDING_BACKEND", EmbeddingBackend.JINA))
+    if backend == EmbeddingBackend.LOCAL:
+        return LocalEmbeddingFunction(
+            batch_size=int(os.getenv("EMBEDDING_BATCH_SIZE", LOCAL_EMBEDDING_BATCH_SIZE)),
+            threads=int(os.getenv("EMBEDDING_THREADS", LOCAL_EMBEDDING_THREADS)),
+        )
+    return JinaEmbeddingFunction(
         api_key=os.getenv("EMBEDDING_API_KEY"),  # https://jina.ai/
         model_name=os.getenv("EMBEDDING_MODEL", ""),
     )
 
+
+def get_collection(client: Any, collection_name: str, embedding_fn: Any | None = None) -> Any:
+    """
+    Get an existing collection or create a new one with specific distance metrics.
+
+    Uses the configured embedding backend (Jina AI by default) and configures
+    the HNSW space for cosine similarity.
+
+    Args:
+        client (Any): The initialized ChromaDB client.
+        collection_name (str): The name of the collection to access or create.
+        embedding_fn (Any, optional): The embedding function to attach. If None, a new
+            one is built from the environment settings.
+
+    Returns:
+        chromadb.Collection: The requested ChromaDB collection object.
+    """
     collection = client.get_or_create_collection(
         name=collection_name,
-        embedding_function=embedding_fn,
+        embedding_function=embedding_fn or get_embedding_function(),
         metadata={"hnsw:space": "cosine"},
     )
     return collection
 
 
+class ChromaHandleCache:
+    """
+    Thread-safe, process-wide cache of ChromaDB clients and collection handles.
+
+    Opening a persistent client and building the collection's embedding
+    function (which reads the embedding settings from the environment) is done
+    once per `(persist_dir, collection_name)`, or per `(client, collection_name)`
+    for clients opened by the caller, instead of on every query.
+
+    Attributes:
+        clients (dict[str, Any]): Open clients keyed by persist directory.
+        collections (dict[tuple[Any, str], Any]): Collection handles keyed by persist directory
+            (or explicit client) and name.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty cache."""
+        self.clients: dict[str, Any] = {}
+        self.collections: dict[tuple[Any, str], Any] = {}
+        self._embedding_fn: Any | None = None
+        self._lock = threading.Lock()
+
+    def embedding_function(self) -> Any:
+        """
+        Returns the embedding function shared by the cached collections, building it on first use.
+
+        Returns:
+            Any: The shared embedding function.
+        """
+        # A concurrent `refresh` may reset the shared function: return the one read or built here
+        embedding_fn = self._embedding_fn
+        if embedding_fn is None:
+            with self._lock:
+                if self._embedding_fn is None:
+                    self._embedding_fn = get_embedding_function()
+                embedding_fn = self._embedding_fn
+        return embedding_fn
+
+    def client(self, persist_dir: str = str(CHROMA_DIR)) -> Any:
+        """
+        Returns the client of a persist directory, opening it on first use.
+
+        Args:
+            persist_dir (str): The directory where ChromaDB data is stored.
+
+        Returns:
+            chromadb.PersistentClient: The shared client.
+        """
+        persist_dir = str(persist_dir)
+        client = self.clients.get(persist_dir)
+        if client is None:
+            with self._lock:
+                client = self.clients.get(persist_dir)
+                if client is None:
+                    client = self.clients[persist_dir] = get_client(persist_dir=persist_dir)
+        return client
+
+    def collection(self, collection_name: str, persist_dir: str = str(CHROMA_DIR), client: Any | None = None) -> Any:
+        """
+        Returns a collection handle, opening its client and collection on first use.
+
+        Args:
+            collection_name (str): The name of the collection to access or create.
+            persist_dir (str): The directory where ChromaDB data is stored.
+            client (Any, optional): A client opened by the caller, used instead of the one of `persist_dir`.
+
+        Returns:
+            chromadb.Collection: The shared collection handle.
+        """
+        key = (client if client is not None else str(persist_dir), collection_name)
+        collection = self.collections.get(key)
+        if collection is None:
+            client = client if client is not None else self.client(persist_dir)
+            # The embedding function and the handle are set together, so a concurrent `refresh` cannot split them
+            with self._lock:
+                collection = self.collections.get(key)
+                if collection is None:
+                    if self._embedding_fn is None:
+                        self._embedding_fn = get_embedding_function()
+                    collection = self.collections[key] = get_collection(
+                        client, collection_name, embedding_fn=self._embedding_fn
+                    )
+                    logger.debug(f"Opened ChromaDB collection handle `{collection_name}` on `{key[0]}`")
+        return collection
+
+    def refresh(self, collection_name: str, persist_dir: str = str(CHROMA_DIR), client: Any | None = None) -> Any:
+        """
+        Reopens a collection handle, e.g. after the collection was recreated or the embedding settings changed.
+
+        Args:
+            collection_name (str): The name of the collection.
+            persist_dir (str): The directory where ChromaDB data is stored.
+            client (Any, optional): The caller's client the handle was opened with, if any.
+
+        Returns:
+            chromadb.Collection: The new collection handle.
+        """
+        with self._lock:
+            self.collections.pop((client if client is not None else str(persist_dir), collection_name), None)
+            self._embedding_fn = None
+        return self.collection(collection_name, persist_dir, client=client)
+
+    def close(self, persist_dir: str | None = None) -> None:
+        """
+        Drops the cached handles, so the next access opens new ones.
+
+        Args:
+            persist_dir (str, optional): Only drop the handles of this directory. None drops all of them.
+        """
+        with self._lock:
+            if persist_dir is None:
+                self.clients.clear()
+                self.collections.clear()
+                self._embedding_fn = None
+                return
+            self.clients.pop(str(persist_dir), None)
+            for key in [key for key in self.collections if key[0] == str(persist_dir)]:
+                del self.collections[key]
+
+
+CHROMA_HANDLES = ChromaHandleCache()
+"""ChromaHandleCache: Process-wide handles used by the vector search when no client is given."""
+
+QUERY_EMBEDDINGS = EmbeddingCache()
+"""EmbeddingCache: Process-wide LRU cache of the query embeddings of the vector search."""
+
+
 def add_to_collection(
     metadata_extractor: Any,
     corpus: pd.DataFrame,
     collection: Any,
     max_rpm: int | None = None,
     verbose: bool = False,
+    metadata_cache: MetadataCache | None = None,
+    max_tpm: int | None = None,
+    concurrency: int = INGESTION_CONCURRENCY,
+    batch_size: int = INGESTION_BATCH_SIZE,
+    incremental: bool = False,
+    delete_missing: bool = False,
+    resume: bool = False,
     **kwargs,
-) -> None:
+) -> IngestionStats:
     """
     Extracts metadata from documents and adds them to the vector collection.
 
-    This function iterates through a DataFrame, uses an AI crew to extract
-    structured metadata from the text content, and performs rate-limited
-    uploads to the database.
+    Synchronous entry point of the ingestion pipeline (see `ingest_corpus`):
+    an AI crew extracts structured metadata from the text content with
+    `concurrency` workers under the RPM/TPM limits, the extracted skills are
+    canonicalized, and the documents are upserted in batches of `batch_size`.
+    Documents whose metadata was already extracted (by a previous ingestion or
+    a flow evaluation) are read from the metadata cache without calling the
+    crew. Written documents are journaled and failed ones are kept as dead
+    letters (see `retry_dead_letters`). Cached flow results that queried the
+    collection are invalidated afterwards.
 
     Args:
         metadata_extractor (Any): The CrewAI-based agent or crew responsible
@@ -89,45 +271,81 @@ def add_to_collection(
         collection (Any): The ChromaDB collection object to receive the data.
         max_rpm (int, optional): Maximum Requests Per Minute for the AI extractor.
         verbose (bool): If True, enables detailed logging for the extraction process.
+        metadata_cache (MetadataCache, optional): Cache of validated extractions. If None,
+            the default on-disk cache is used.
+        max_tpm (int, optional): Maximum LLM Tokens Per Minute for the AI extractor.
+        concurrency (int): Number of concurrent extraction workers.
+        batch_size (int): Number of documents written (and embedded) per request.
+        incremental (bool): If True, only extract and write the documents that are new or
+            whose content changed since they were stored.
+        delete_missing (bool): If True, delete the documents of the collection that are not in the corpus.
+        resume (bool): If True, continue the last interrupted ingestion of the collection, skipping
+            the documents it already wrote.
         **kwargs: Additional context passed to the metadata extractor.
-    """
-    # Precompute delay if a limit is provided
-    min_delay: float = 60 / max_rpm if max_rpm else 0
-    last_call: float = 0
-
-    logger.info(f"Adding {len(corpus)} documents to `{collection.name}` collection.")
-    for _, row in tqdm(corpus.iterrows(), total=len(corpus)):
-        # Conditional rate limiting
-        if max_rpm:
-            now = time.time()
-            elapsed = now - last_call
 
-            if elapsed < min_delay:
-                time.sleep(min_delay - elapsed)
+    Returns:
+        IngestionStats: Counts and wall time of the run.
+    """
+    ingestion = ingest_corpus(
+        metadata_extractor,
+        corpus,
+        collection,
+        max_rpm=max_rpm,
+        max_tpm=max_tpm,
+        concurrency=concurrency,
+        batch_size=batch_size,
+        verbose=verbose,
+        metadata_cache=metadata_cache,
+        incremental=incremental,
+        delete_missing=delete_missing,
+        resume=resume,
+        **kwargs,
+    )
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(ingestion)
 
-            last_call = time.time()
+    # Called from a running event loop (e.g., a notebook): run the pipeline on its own loop
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, ingestion).result()
 
-        # Extract metadata
-        inputs = {"content": row["content"], **kwargs}
-        metadata_extractor._verbose = verbose
-        crew = metadata_extractor.crew()
 
-        try:
-            metadata = crew.kickoff(inputs=inputs)
-            logger.debug(f"Metadata:\n{json.loads(metadata.raw)}")
-        except Exception as e:
-            logger.error(f"Failed extraction for `doc_id={row.get('doc_id')}` due to error: {e}")
-            continue
+def recanonicalize_collection(collection: Any, batch_size: int = RECANONICALIZE_BATCH_SIZE) -> int:
+    """
+    Rewrites the skills of every document already in a collection with their canonical names.
 
-        # Remove None values before sending to Chroma
-        metadata_dict = {k: v for k, v in metadata.json_dict.items() if v is not None}
-        null_keys = [k for k, v in metadata.json_dict.items() if v is None]
+    Collections ingested before the skill taxonomy (or before new aliases were
+    added to it) are paged through, and only the documents whose skills change
+    are updated. Their embeddings are left untouched. Cached flow results that
+    queried the collection are invalidated if anything changed.
 
-        if null_keys:
-            logger.warning(f"Null metadata keys for `doc_id={row['doc_id']}`: {null_keys}")
+    Args:
+        collection (Any): The ChromaDB collection to update.
+        batch_size (int): Number of documents read and updated per request.
 
-        # Add to ChromaDB
-        collection.add(ids=[str(row["doc_id"])], documents=[row["content"]], metadatas=[metadata_dict])
+    Returns:
+        int: The number of updated documents.
+    """
+    total = collection.count()
+    updated = 0
+    logger.info(f"Canonicalizing the skills of {total} documents in `{collection.name}` collection.")
+    for offset in tqdm(range(0, total, batch_size)):
+        batch = collection.get(limit=batch_size, offset=offset, include=["metadatas"])
+        ids, metadatas = [], []
+        for doc_id, metadata in zip(batch["ids"], batch["metadatas"], strict=True):
+            canonical = SKILL_CANONICALIZER.canonicalize_metadata(metadata or {})
+            if canonical != (metadata or {}):
+                ids.append(doc_id)
+                metadatas.append(canonical)
+        if ids:
+            collection.update(ids=ids, metadatas=metadatas)
+            updated += len(ids)
+
+    logger.info(f"Canonicalized the skills of {updated}/{total} documents in `{collection.name}` collection.")
+    if updated:
+        FlowResultCache().invalidate_collection(collection.name)
+    return updated
 
 
 def reshape_chroma_results(chroma_output: dict[str, Any]) -> dict[str, Any]:
@@ -166,19 +384,63 @@ def reshape_chroma_results(chroma_output: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+def filter_by_similarity(
+    results: dict[str, Any],
+    min_similarity: float | None = None,
+    max_similarity_gap: float | None = None,
+) -> dict[str, Any]:
+    """
+    Drops the weak matches of a reshaped search result.
+
+    Matches below `min_similarity` are removed. In adaptive mode
+    (`max_similarity_gap` set), the results are walked from the most similar
+    one and cut at the first drop in similarity larger than the gap, so a tail
+    of much weaker matches never reaches the analysis crews.
+
+    Args:
+        results (dict[str, Any]): The output of `reshape_chroma_results`.
+        min_similarity (float, optional): Minimum similarity score in [0, 1] to keep a match.
+        max_similarity_gap (float, optional): Largest similarity drop allowed between
+            consecutive matches. None disables the adaptive cutoff.
+
+    Returns:
+        dict[str, Any]: The kept matches, most similar first.
+    """
+    ranked = sorted(results.items(), key=lambda item: item[1]["similarity"], reverse=True)
+    kept: dict[str, Any] = {}
+    previous = None
+    for doc_id, doc in ranked:
+        similarity = doc["similarity"]
+        if min_similarity is not None and similarity < min_similarity:
+            break
+        if max_similarity_gap is not None and previous is not None and previous - similarity > max_similarity_gap:
+            break
+        kept[doc_id] = doc
+        previous = similarity
+
+    if len(kept) < len(results):
+        logger.info(f"Kept {len(kept)}/{len(results)} matches after the similarity cutoff")
+    return kept
+
+
 def query_to_collection(
     collection_name: str,
     query_text: str,
     country: str,
     persist_dir: str = str(CHROMA_DIR),
-    top_k: int = 3,
+    top_k: int = QUERY_TOP_K,
+    client: Any | None = None,
+    min_similarity: float | None = QUERY_MIN_SIMILARITY,
+    max_similarity_gap: float | None = None,
 ) -> dict[str, Any]:
     """
     Performs a semantic search in a collection with an optional geographical filter.
 
     Strategy:
-    1. Attempt search filtered by country.
-    2. If no results found or no country provided, perform a global search.
+    1. Embed the query text once (or reuse its cached embedding).
+    2. Attempt search filtered by country, and drop its weak matches (see `filter_by_similarity`).
+    3. If no match is left or no country provided, perform a global search with the same embedding,
+       filtered the same way.
 
     Args:
         collection_name (str): The name of the collection to query.
@@ -186,32 +448,85 @@ def query_to_collection(
         country (str): The country name for strict metadata filtering.
         persist_dir (str): Path to the ChromaDB storage.
         top_k (int): Number of most relevant documents to return.
+        client (Any, optional): An already initialized ChromaDB client to use instead of
+            the one of `persist_dir`. Its collection handle is cached in `CHROMA_HANDLES` too.
+        min_similarity (float, optional): Minimum similarity score in [0, 1] to keep a match.
+            None keeps the `top_k` matches whatever their score.
+        max_similarity_gap (float, optional): Cut the results at the first similarity drop
+            larger than this gap. None disables the adaptive cutoff.
 
     Returns:
         dict[str, Any]: The reshaped search results including metadata and similarity.
     """
-    # Initialize client and access collection
-    client = get_client(persist_dir=persist_dir)
-    collection = get_collection(client=client, collection_name=collection_name)
+    # Reuse the cached handle, of the given client if any
+    collection = CHROMA_HANDLES.collection(collection_name, persist_dir=persist_dir, client=client)
+    embedding_fn = CHROMA_HANDLES.embedding_function()
 
     logger.info(f"Initiating vector search in collection '{collection_name}' (Top K: {top_k})")
+    query_embedding = QUERY_EMBEDDINGS.embed(query_text, embedding_fn)
+
+    def search(where: dict[str, Any] | None = None) -> dict[str, Any]:
+        results = collection.query(query_embeddings=[query_embedding], n_results=top_k, where=where)
+        return filter_by_similarity(
+            reshape_chroma_results(chroma_output=results),
+            min_similarity=min_similarity,
+            max_similarity_gap=max_similarity_gap,
+        )
 
     # Primary Search: Strict filtering by country
-    if country:
-        results = collection.query(query_texts=[query_text], n_results=top_k, where={"country": country})
+    formatted_results = search(where={"country": country}) if country else {}
 
-    # Fallback Strategy: If no results found with country filter, widen the search
-    if (not country) or (results["ids"] == [[]]):
+    # Fallback Strategy: If no match passed the cutoffs with the country filter, widen the search
+    if not formatted_results:
         logger.warning(
             f"No matches found for country '{country}'. "
             "Broadening search to all regions to ensure candidate visibility."
         )
-        results = collection.query(
-            query_texts=[query_text],
-            n_results=top_k,
-        )
-
-    formatted_results = reshape_chroma_results(chroma_output=results)
+        formatted_results = search()
     logger.debug(f"Final formatted results:\n{formatted_results}")
 
     return formatted_results
+
+
+async def query_to_collection_async(
+    collection_name: str,
+    query_text: str,
+    country: str,
+    persist_dir: str = str(CHROMA_DIR),
+    top_k: int = QUERY_TOP_K,
+    client: Any | None = None,
+    min_similarity: float | None = QUERY_MIN_SIMILARITY,
+    max_similarity_gap: float | None = None,
+) -> dict[str, Any]:
+    """
+    Non-blocking variant of `query_to_collection` for use inside the event loop.
+
+    The ChromaDB persistent client and the embedding request are synchronous,
+    so the whole search is offloaded to a worker thread. This keeps the event
+    loop free to drive other flows while the vector step is in progress.
+
+    Args:
+        collection_name (str): The name of the collection to query.
+        query_text (str): The natural language query or document text.
+        country (str): The country name for strict metadata filtering.
+        persist_dir (str): Path to the ChromaDB storage.
+        top_k (int): Number of most relevant documents to return.
+        client (Any, optional): An already initialized ChromaDB client to reuse.
+        min_similarity (float, optional): Minimum similarity score in [0, 1] to keep a match.
+        max_similarity_gap (float, optional): Cut the results at the first similarity drop
+            larger than this gap. None disables the adaptive cutoff.
+
+    Returns:
+        dict[str, Any]: The reshaped search results including metadata and similarity.
+    """
+    return await asyncio.to_thread(
+        query_to_collection,
+        collection_name=collection_name,
+        query_text=query_text,
+        country=country,
+        persist_dir=persist_dir,
+        top_k=top_k,
+        client=client,
+        min_similarity=min_similarity,
+        max_similarity_gap=max_similarity_gap,
+    )
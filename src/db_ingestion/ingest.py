@@ -0,0 +1,126 @@
+"""
+Corpus Ingestion Entry Point.
+
+This module ingests the processed CV and job corpora into their ChromaDB
+collections with `add_to_collection`. With `--incremental`, only the new and
+changed documents are extracted and written, so it can run as a nightly
+refresh; `--delete-missing` also removes the documents that left the corpus.
+`--resume` continues an interrupted ingestion, and `--retry-dead-letters`
+only reprocesses the documents whose extraction failed, with backoff.
+
+Usage:
+    python -m src.db_ingestion.ingest --collections cvs jobs --incremental --delete-missing --max-rpm 10
+    python -m src.db_ingestion.ingest --collections cvs --retry-dead-letters --max-attempts 3
+"""
+
+import argparse
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from src.config.paths import CHROMA_DIR, CVS_PATH_PROCESSED, JOBS_PATH_PROCESSED
+from src.constants import (
+    GUARDRAIL_MAX_RETRIES,
+    INGESTION_BATCH_SIZE,
+    INGESTION_CONCURRENCY,
+    INGESTION_RETRY_BACKOFF_SECONDS,
+    INGESTION_RETRY_MAX_ATTEMPTS,
+)
+from src.db_ingestion.chroma_client import CHROMA_HANDLES, add_to_collection
+from src.db_ingestion.pipeline import retry_dead_letters
+from src.talent_selection_flow.crews.metadata_extraction_crew.crews import (
+    CVMetadataExtractorCrew,
+    JobMetadataExtractorCrew,
+)
+from src.talent_selection_flow.crews.metadata_extraction_crew.enums import (
+    EducationLevel,
+    EmploymentType,
+    ExperienceLevel,
+)
+
+# Collection name -> (processed corpus, extractor crew class, extractor inputs)
+INGESTION_SOURCES: dict[str, tuple[Path, type, dict[str, Any]]] = {
+    "cvs": (
+        CVS_PATH_PROCESSED,
+        CVMetadataExtractorCrew,
+        {
+            "educationlevel_options": "/".join(EducationLevel),
+            "experiencelevel_options": "/".join(ExperienceLevel),
+        },
+    ),
+    "jobs": (
+        JOBS_PATH_PROCESSED,
+        JobMetadataExtractorCrew,
+        {
+            "employmenttype_options": "/".join(EmploymentType),
+            "experiencelevel_options": "/".join(ExperienceLevel),
+        },
+    ),
+}
+
+
+def main() -> None:
+    """Parses the command line arguments and ingests each collection's corpus."""
+    parser = argparse.ArgumentParser(description="Ingest the processed corpora into ChromaDB.")
+    parser.add_argument("--collections", nargs="+", choices=list(INGESTION_SOURCES), default=list(INGESTION_SOURCES))
+    parser.add_argument("--persist-dir", default=str(CHROMA_DIR), help="Path to the ChromaDB storage.")
+    parser.add_argument("--incremental", action="store_true", help="Only ingest new and changed documents.")
+    parser.add_argument("--delete-missing", action="store_true", help="Delete documents no longer in the corpus.")
+    parser.add_argument("--resume", action="store_true", help="Continue the last interrupted ingestion.")
+    parser.add_argument("--retry-dead-letters", action="store_true", help="Only reprocess failed documents.")
+    parser.add_argument("--max-attempts", type=int, default=INGESTION_RETRY_MAX_ATTEMPTS, help="Retries per document.")
+    parser.add_argument(
+        "--backoff-seconds",
+        type=float,
+        default=INGESTION_RETRY_BACKOFF_SECONDS,
+        help="Wait before the second retry round, doubled for each next round.",
+    )
+    parser.add_argument("--max-rpm", type=int, default=None, help="Maximum extraction requests per minute.")
+    parser.add_argument("--max-tpm", type=int, default=None, help="Maximum extraction tokens per minute.")
+    parser.add_argument("--concurrency", type=int, default=INGESTION_CONCURRENCY, help="Extraction workers.")
+    parser.add_argument("--batch-size", type=int, default=INGESTION_BATCH_SIZE, help="Documents per upsert.")
+    parser.add_argument("--guardrail-max-retries", type=int, default=GUARDRAIL_MAX_RETRIES)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    for collection_name in args.collections:
+        corpus_path, extractor_cls, extractor_inputs = INGESTION_SOURCES[collection_name]
+        metadata_extractor = extractor_cls(guardrail_max_retries=args.guardrail_max_retries)
+        collection = CHROMA_HANDLES.collection(collection_name, persist_dir=args.persist_dir)
+        options = {
+            "max_rpm": args.max_rpm,
+            "max_tpm": args.max_tpm,
+            "concurrency": args.concurrency,
+            "batch_size": args.batch_size,
+            "verbose": args.verbose,
+        }
+
+        if args.retry_dead_letters:
+            asyncio.run(
+                retry_dead_letters(
+                    metadata_extractor,
+                    collection,
+                    max_attempts=args.max_attempts,
+                    backoff_seconds=args.backoff_seconds,
+                    **options,
+                    **extractor_inputs,
+                )
+            )
+            continue
+
+        add_to_collection(
+            metadata_extractor=metadata_extractor,
+            corpus=pd.read_csv(corpus_path, sep=";"),
+            collection=collection,
+            incremental=args.incremental,
+            delete_missing=args.delete_missing,
+            resume=args.resume,
+            **options,
+            **extractor_inputs,
+        )
+
+
+if __name__ == "__main__":
+    main()
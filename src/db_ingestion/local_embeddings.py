@@ -0,0 +1,89 @@
+"""
+Local Embedding Backend Module.
+
+This module provides an offline alternative to the Jina AI embedding API: the
+`all-MiniLM-L6-v2` sentence embedding model run on CPU with ONNX Runtime, as
+bundled with ChromaDB (the model is downloaded once to the ChromaDB cache
+directory). Documents are encoded in batches of a configurable size, with a
+configurable number of ONNX Runtime threads. The model truncates its input to
+256 tokens.
+"""
+
+import os
+from enum import StrEnum
+from functools import cached_property
+from typing import Any
+
+from chromadb.api.types import Documents, Embeddings
+from chromadb.utils.embedding_functions import ONNXMiniLM_L6_V2
+
+from src.constants import LOCAL_EMBEDDING_BATCH_SIZE, LOCAL_EMBEDDING_THREADS
+
+
+class EmbeddingBackend(StrEnum):
+    """
+    Embedding backend used by the ChromaDB collections and the query embeddings.
+
+    Attributes:
+        JINA: The Jina AI embedding API (`EMBEDDING_API_KEY`, `EMBEDDING_MODEL`).
+        LOCAL: The offline ONNX model of `LocalEmbeddingFunction`.
+    """
+
+    JINA = "jina"
+    LOCAL = "local"
+
+
+class LocalEmbeddingFunction(ONNXMiniLM_L6_V2):
+    """
+    ChromaDB embedding function running `all-MiniLM-L6-v2` locally with ONNX Runtime.
+
+    Attributes:
+        model_name (str): Identifier of the model, used in the query embedding cache key.
+        batch_size (int): Number of documents encoded per model call.
+        threads (int): ONNX Runtime intra-op threads (0 lets ONNX Runtime decide).
+    """
+
+    def __init__(
+        self,
+        batch_size: int = LOCAL_EMBEDDING_BATCH_SIZE,
+        threads: int = LOCAL_EMBEDDING_THREADS,
+        preferred_providers: list[str] | None = None,
+    ) -> None:
+        """
+        Initializes the embedding function; the model is loaded on the first call.
+
+        Args:
+            batch_size (int): Number of documents encoded per model call.
+            threads (int): ONNX Runtime intra-op threads (0 lets ONNX Runtime decide).
+            preferred_providers (list[str], optional): ONNX Runtime execution providers. Defaults to CPU.
+        """
+        super().__init__(preferred_providers=preferred_providers or ["CPUExecutionProvider"])
+        self.model_name = f"local/{self.MODEL_NAME}"
+        self.batch_size = batch_size
+        self.threads = threads
+
+    @cached_property
+    def model(self) -> Any:
+        """Loads the ONNX Runtime session with the configured number of threads."""
+        options = self.ort.SessionOptions()
+        options.log_severity_level = 3
+        options.graph_optimization_level = self.ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = self.threads
+        return self.ort.InferenceSession(
+            os.path.join(self.DOWNLOAD_PATH, self.EXTRACTED_FOLDER_NAME, "model.onnx"),
+            providers=self._preferred_providers,
+            sess_options=options,
+        )
+
+    def __call__(self, input: Documents) -> Embeddings:
+        """
+        Embeds documents in batches of `batch_size`.
+
+        Args:
+            input (Documents): The documents to embed.
+
+        Returns:
+            Embeddings: One normalized vector per document.
+        """
+        self._download_model_if_not_exists()
+        return list(self._forward(list(input), batch_size=self.batch_size))
@@ -0,0 +1,549 @@
+"""
+Ingestion Pipeline Module.
+
+This module ingests a corpus into a ChromaDB collection with concurrent
+metadata extraction: a pool of workers runs one copy of the extraction crew
+each, under a token-bucket limiter on requests and tokens per minute, and the
+extracted documents are buffered and written with `collection.upsert` in large
+batches, so their embeddings are also requested in batches. Progress is shown
+with a progress bar, and throughput and per-document outcomes are logged and
+exported as Prometheus metrics.
+
+Every stored document carries the hash of its content in its metadata. In
+incremental mode the corpus is diffed against these hashes in bulk, so only
+new and changed documents are extracted and written, and documents missing
+from the corpus can be deleted: a refresh costs time proportional to the delta.
+
+Each run is recorded in the `IngestionJournal`: an interrupted run can be
+resumed without writing its documents again, and documents whose extraction
+fails are kept as dead letters, with the error and the guardrail feedback,
+until `retry_dead_letters` ingests them successfully.
+"""
+
+import asyncio
+import json
+import time
+from typing import Any
+
+import pandas as pd
+from pydantic import BaseModel
+from tqdm import tqdm
+
+from src.constants import (
+    COLLECTION_SCAN_BATCH_SIZE,
+    INGESTION_BATCH_SIZE,
+    INGESTION_CONCURRENCY,
+    INGESTION_RETRY_BACKOFF_SECONDS,
+    INGESTION_RETRY_MAX_ATTEMPTS,
+)
+from src.llm.token_budget import count_tokens
+from src.skills.canonicalizer import SKILL_CANONICALIZER
+from src.storage.flow_cache import FlowResultCache
+from src.storage.ingestion_journal import IngestionJournal
+from src.storage.metadata_cache import MetadataCache
+from src.utils.hashing import content_hash
+from src.utils.logger import logger
+from src.utils.metrics import REGISTRY, collect_guardrail_feedback, kickoff_crew
+
+CONTENT_HASH_KEY = "content_hash"
+"""str: Metadata key holding the hash of the normalized document content."""
+
+
+class TokenBucket:
+    """
+    Asynchronous token bucket refilled continuously at a per-minute rate.
+
+    Attributes:
+        rate_per_minute (float): Refill rate, which is also the bucket capacity (one minute of burst).
+        tokens (float): Tokens currently available. May go negative after a `debit`.
+    """
+
+    def __init__(self, rate_per_minute: float) -> None:
+        """
+        Initializes a full bucket.
+
+        Args:
+            rate_per_minute (float): Refill rate and capacity.
+        """
+        self.rate_per_minute = rate_per_minute
+        self.tokens = float(rate_per_minute)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Adds the tokens accrued since the last update, up to the capacity."""
+        now = time.monotonic()
+        self.tokens = min(self.rate_per_minute, self.tokens + (now - self._updated) * self.rate_per_minute / 60)
+        self._updated = now
+
+    async def acquire(self, amount: float = 1) -> None:
+        """
+        Waits until `amount` tokens are available and consumes them.
+
+        Requests larger than the capacity wait for a full bucket instead of blocking forever.
+
+        Args:
+            amount (float): Tokens to consume.
+        """
+        amount = min(amount, self.rate_per_minute)
+        async with self._lock:
+            self._refill()
+            while self.tokens < amount:
+                await asyncio.sleep((amount - self.tokens) * 60 / self.rate_per_minute)
+                self._refill()
+            self.tokens -= amount
+
+    def debit(self, amount: float) -> None:
+        """
+        Consumes tokens without waiting, e.g. to settle an underestimated request.
+
+        Args:
+            amount (float): Tokens to consume (negative values give tokens back).
+        """
+        self._refill()
+        self.tokens = min(self.rate_per_minute, self.tokens - amount)
+
+
+class RateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute limits shared by the extraction workers.
+
+    Attributes:
+        requests (TokenBucket | None): Bucket of crew kickoffs per minute, if limited.
+        tokens (TokenBucket | None): Bucket of LLM tokens per minute, if limited.
+    """
+
+    def __init__(self, max_rpm: int | None = None, max_tpm: int | None = None) -> None:
+        """
+        Initializes the limiter.
+
+        Args:
+            max_rpm (int, optional): Maximum crew kickoffs per minute. None disables the limit.
+            max_tpm (int, optional): Maximum LLM tokens per minute. None disables the limit.
+        """
+        self.requests = TokenBucket(max_rpm) if max_rpm else None
+        self.tokens = TokenBucket(max_tpm) if max_tpm else None
+
+    def estimate(self, content: str) -> int:
+        """
+        Estimates the tokens of the extraction of a document (0 when tokens are not limited).
+
+        Args:
+            content (str): The document text.
+
+        Returns:
+            int: The prompt tokens of the document.
+        """
+        return count_tokens(content) if self.tokens else 0
+
+    async def acquire(self, estimated_tokens: int = 0) -> None:
+        """
+        Waits for a request slot and the estimated tokens.
+
+        Args:
+            estimated_tokens (int): Tokens the request is expected to use.
+        """
+        if self.requests:
+            await self.requests.acquire()
+        if self.tokens:
+            await self.tokens.acquire(estimated_tokens)
+
+    def settle(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """
+        Corrects the token bucket with the tokens a request actually used.
+
+        Args:
+            estimated_tokens (int): Tokens consumed by `acquire`.
+            actual_tokens (int): Prompt and completion tokens reported by the crew.
+        """
+        if self.tokens:
+            self.tokens.debit(actual_tokens - estimated_tokens)
+
+
+class CorpusDiff(BaseModel):
+    """
+    Differences between a corpus and the documents already in a collection.
+
+    Attributes:
+        new (list[str]): IDs of the corpus documents not in the collection.
+        changed (list[str]): IDs whose content hash differs from the stored one.
+        unchanged (list[str]): IDs whose content is already stored.
+        missing (list[str]): IDs in the collection that are no longer in the corpus.
+    """
+
+    new: list[str] = []
+    changed: list[str] = []
+    unchanged: list[str] = []
+    missing: list[str] = []
+
+
+def collection_hashes(collection: Any, batch_size: int = COLLECTION_SCAN_BATCH_SIZE) -> dict[str, str | None]:
+    """
+    Reads the content hash of every document in a collection, without their documents or embeddings.
+
+    Args:
+        collection (Any): The ChromaDB collection.
+        batch_size (int): Number of documents read per request.
+
+    Returns:
+        dict[str, str | None]: The stored content hash per document ID (None for documents
+            ingested before hashes were stored).
+    """
+    hashes: dict[str, str | None] = {}
+    for offset in range(0, collection.count(), batch_size):
+        batch = collection.get(limit=batch_size, offset=offset, include=["metadatas"])
+        for doc_id, metadata in zip(batch["ids"], batch["metadatas"], strict=True):
+            hashes[doc_id] = (metadata or {}).get(CONTENT_HASH_KEY)
+    return hashes
+
+
+def diff_corpus(corpus_hashes: dict[str, str], stored_hashes: dict[str, str | None]) -> CorpusDiff:
+    """
+    Compares the documents of a corpus with the ones stored in a collection.
+
+    Args:
+        corpus_hashes (dict[str, str]): Content hash per document ID of the corpus.
+        stored_hashes (dict[str, str | None]): Content hash per document ID of the collection.
+
+    Returns:
+        CorpusDiff: The new, changed, unchanged and missing document IDs.
+    """
+    diff = CorpusDiff()
+    for doc_id, digest in corpus_hashes.items():
+        if doc_id not in stored_hashes:
+            diff.new.append(doc_id)
+        elif stored_hashes[doc_id] != digest:
+            diff.changed.append(doc_id)
+        else:
+            diff.unchanged.append(doc_id)
+    diff.missing = [doc_id for doc_id in stored_hashes if doc_id not in corpus_hashes]
+    return diff
+
+
+class IngestionStats(BaseModel):
+    """
+    Outcome of an ingestion run.
+
+    Attributes:
+        collection (str): Name of the target collection.
+        run_id (str): The journal run ID (reused when the run is resumed).
+        documents (int): Documents in the corpus.
+        cache_hits (int): Documents whose metadata came from the metadata cache.
+        extracted (int): Documents whose metadata was extracted by the crew.
+        failed (int): Documents whose extraction failed.
+        written (int): Documents written to the collection.
+        skipped (int): Documents already stored with the same content (incremental mode).
+        resumed (int): Documents already written by the interrupted run being resumed.
+        deleted (int): Documents deleted because they are no longer in the corpus.
+        seconds (float): Wall time of the run.
+    """
+
+    collection: str
+    run_id: str = ""
+    documents: int = 0
+    cache_hits: int = 0
+    extracted: int = 0
+    failed: int = 0
+    written: int = 0
+    skipped: int = 0
+    resumed: int = 0
+    deleted: int = 0
+    seconds: float = 0.0
+
+    @property
+    def docs_per_second(self) -> float:
+        """Documents written per second of wall time."""
+        return self.written / self.seconds if self.seconds else 0.0
+
+
+async def ingest_corpus(
+    metadata_extractor: Any,
+    corpus: pd.DataFrame,
+    collection: Any,
+    max_rpm: int | None = None,
+    max_tpm: int | None = None,
+    concurrency: int = INGESTION_CONCURRENCY,
+    batch_size: int = INGESTION_BATCH_SIZE,
+    verbose: bool = False,
+    metadata_cache: MetadataCache | None = None,
+    incremental: bool = False,
+    delete_missing: bool = False,
+    journal: IngestionJournal | None = None,
+    resume: bool = False,
+    **kwargs,
+) -> IngestionStats:
+    """
+    Extracts metadata from documents concurrently and writes them to the collection in batches.
+
+    Documents whose metadata was already extracted are read from the metadata
+    cache without calling the crew. Extracted skills are canonicalized and the
+    content hash is added before writing. Written documents are journaled and
+    failed ones are stored as dead letters. Cached flow results that queried
+    the collection are invalidated afterwards.
+
+    Args:
+        metadata_extractor (Any): The CrewAI-based crew responsible for extracting JSON metadata.
+        corpus (pd.DataFrame): A DataFrame containing at least 'doc_id' and 'content' columns.
+        collection (Any): The ChromaDB collection object to receive the data.
+        max_rpm (int, optional): Maximum crew kickoffs per minute, across all workers.
+        max_tpm (int, optional): Maximum LLM tokens per minute, across all workers.
+        concurrency (int): Number of concurrent extraction workers.
+        batch_size (int): Number of documents per `collection.upsert` (and embedding request).
+        verbose (bool): If True, enables detailed logging for the extraction process.
+        metadata_cache (MetadataCache, optional): Cache of validated extractions. If None,
+            the default on-disk cache is used.
+        incremental (bool): If True, skip the documents already stored with the same content.
+        delete_missing (bool): If True, delete the documents of the collection that are not in the corpus.
+        journal (IngestionJournal, optional): Journal of the run and dead-letter store. If None,
+            the default on-disk journal is used.
+        resume (bool): If True, continue the last unfinished run of the collection, skipping
+            the documents it already wrote.
+        **kwargs: Additional context passed to the metadata extractor.
+
+    Returns:
+        IngestionStats: Counts and wall time of the run.
+
+    Raises:
+        Exception: If a batch cannot be written to the collection or the journal. The batch is
+            stored as dead letters, the other workers are cancelled and the run stays resumable.
+    """
+    if concurrency < 1 or batch_size < 1:
+        raise ValueError("`concurrency` and `batch_size` must be positive integers.")
+
+    start = time.perf_counter()
+    metadata_cache = metadata_cache or MetadataCache()
+    journal = journal or IngestionJournal()
+    crew_type = type(metadata_extractor).__name__
+    limiter = RateLimiter(max_rpm=max_rpm, max_tpm=max_tpm)
+    stats = IngestionStats(collection=collection.name, documents=len(corpus))
+
+    # Assemble the crew once; each worker runs its own copy
+    metadata_extractor._verbose = verbose
+    template = metadata_extractor.crew()
+
+    documents = dict(zip(corpus["doc_id"].astype(str), corpus["content"], strict=True))
+    hashes = {doc_id: content_hash(content) for doc_id, content in documents.items()}
+    pending = list(documents)
+    if incremental or delete_missing:
+        diff = diff_corpus(hashes, await asyncio.to_thread(collection_hashes, collection))
+        logger.info(
+            f"`{collection.name}` diff: {len(diff.new)} new, {len(diff.changed)} changed, "
+            f"{len(diff.unchanged)} unchanged, {len(diff.missing)} not in the corpus."
+        )
+        if incremental:
+            pending = diff.new + diff.changed
+            stats.skipped = len(diff.unchanged)
+        if delete_missing and diff.missing:
+            for offset in range(0, len(diff.missing), batch_size):
+                await asyncio.to_thread(collection.delete, ids=diff.missing[offset : offset + batch_size])
+            stats.deleted = len(diff.missing)
+
+    run_id, written = await asyncio.to_thread(journal.start_run, collection.name, resume)
+    stats.run_id = run_id
+    if written:
+        remaining = [doc_id for doc_id in pending if written.get(doc_id) != hashes[doc_id]]
+        stats.resumed = len(pending) - len(remaining)
+        pending = remaining
+        logger.info(f"Resuming ingestion run `{run_id}`: {stats.resumed} documents already written.")
+
+    rows: asyncio.Queue[tuple[str, str] | None] = asyncio.Queue()
+    for doc_id in pending:
+        rows.put_nowait((doc_id, documents[doc_id]))
+    for _ in range(concurrency):
+        rows.put_nowait(None)
+
+    buffer: list[tuple[str, str, dict[str, Any]]] = []
+    flush_lock = asyncio.Lock()
+    progress = tqdm(total=len(pending))
+
+    def count(outcome: str) -> None:
+        REGISTRY.inc(
+            "talent_flow_ingested_documents_total",
+            "Documents processed by the ingestion.",
+            collection=collection.name,
+            outcome=outcome,
+        )
+        progress.update()
+
+    def dead_letter_batch(batch: list[tuple[str, str, dict[str, Any]]], error: str) -> None:
+        """Stores the documents of a batch that could not be written as dead letters."""
+        for doc_id, content, _ in batch:
+            journal.add_dead_letter(collection.name, doc_id, hashes[doc_id], content, error)
+
+    async def flush() -> None:
+        """Writes the buffered documents to the collection in one batch."""
+        async with flush_lock:
+            if not buffer:
+                return
+            batch = buffer.copy()
+            buffer.clear()
+            flush_start = time.perf_counter()
+            try:
+                await asyncio.to_thread(
+                    collection.upsert,
+                    ids=[doc_id for doc_id, _, _ in batch],
+                    documents=[content for _, content, _ in batch],
+                    metadatas=[metadata for _, _, metadata in batch],
+                )
+                await asyncio.to_thread(
+                    journal.mark_written, run_id, collection.name, [(doc_id, hashes[doc_id]) for doc_id, _, _ in batch]
+                )
+            except Exception as e:
+                logger.error(f"Failed to write a batch of {len(batch)} documents to `{collection.name}`: {e}")
+                stats.failed += len(batch)
+                REGISTRY.inc(
+                    "talent_flow_ingested_documents_total",
+                    "Documents processed by the ingestion.",
+                    len(batch),
+                    collection=collection.name,
+                    outcome="write_failed",
+                )
+                await asyncio.to_thread(dead_letter_batch, batch, str(e))
+                raise
+            stats.written += len(batch)
+            REGISTRY.observe(
+                "talent_flow_ingestion_flush_seconds",
+                "Wall time of batched collection writes.",
+                time.perf_counter() - flush_start,
+                collection=collection.name,
+            )
+
+    async def extract(crew: Any, doc_id: str, content: str) -> dict[str, Any] | None:
+        """Returns the metadata of a document, from the cache or the crew."""
+        metadata_json = await asyncio.to_thread(metadata_cache.get, content, crew_type)
+        if metadata_json is not None:
+            stats.cache_hits += 1
+            return metadata_json
+
+        estimated = limiter.estimate(content)
+        await limiter.acquire(estimated)
+        error = None
+        async with collect_guardrail_feedback() as feedback:
+            try:
+                metadata = await kickoff_crew(crew, {"content": content, **kwargs})
+                logger.debug(f"Metadata:\n{json.loads(metadata.raw)}")
+            except Exception as e:
+                error = e
+        if error is not None:
+            logger.error(f"Failed extraction for `doc_id={doc_id}` due to error: {error}")
+            stats.failed += 1
+            await asyncio.to_thread(
+                journal.add_dead_letter, collection.name, doc_id, hashes[doc_id], content, str(error), feedback
+            )
+            return None
+        # `token_usage` is the usage of this kickoff only (see `kickoff_crew`)
+        limiter.settle(estimated, metadata.token_usage.prompt_tokens + metadata.token_usage.completion_tokens)
+
+        stats.extracted += 1
+        await asyncio.to_thread(metadata_cache.put, content, crew_type, metadata.json_dict)
+        return metadata.json_dict
+
+    async def worker() -> None:
+        crew = template.copy()
+        while (row := await rows.get()) is not None:
+            doc_id, content = row
+            metadata_json = await extract(crew, doc_id, content)
+            if metadata_json is None:
+                count("failed")
+                continue
+
+            # Remove None values before sending to Chroma, with canonical skill names
+            metadata_dict = {k: v for k, v in metadata_json.items() if v is not None}
+            null_keys = [k for k, v in metadata_json.items() if v is None]
+            if null_keys:
+                logger.warning(f"Null metadata keys for `doc_id={doc_id}`: {null_keys}")
+
+            metadata_dict = SKILL_CANONICALIZER.canonicalize_metadata(metadata_dict)
+            buffer.append((doc_id, content, {**metadata_dict, CONTENT_HASH_KEY: hashes[doc_id]}))
+            count("ok")
+            if len(buffer) >= batch_size:
+                await flush()
+
+    logger.info(
+        f"Adding {len(pending)} documents to `{collection.name}` collection "
+        f"({concurrency} workers, batches of {batch_size})."
+    )
+    tasks = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    try:
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # A failed write aborts the run: stop the other workers before propagating the error.
+            # Their buffered documents stay unwritten, and resuming the run ingests them again.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        await flush()
+        # An interrupted run stays unfinished, so it can be resumed
+        await asyncio.to_thread(journal.finish_run, run_id)
+    finally:
+        progress.close()
+        stats.seconds = round(time.perf_counter() - start, 3)
+
+    logger.info(
+        f"Ingested {stats.written}/{stats.documents} documents into `{collection.name}` in {stats.seconds}s "
+        f"({stats.docs_per_second:.2f} docs/s): {stats.cache_hits} cached, {stats.extracted} extracted, "
+        f"{stats.failed} failed, {stats.skipped} unchanged, {stats.resumed} resumed, {stats.deleted} deleted."
+    )
+
+    # Cached flow results may no longer reflect the collection's content
+    if stats.written or stats.deleted:
+        FlowResultCache().invalidate_collection(collection.name)
+    return stats
+
+
+async def retry_dead_letters(
+    metadata_extractor: Any,
+    collection: Any,
+    journal: IngestionJournal | None = None,
+    max_attempts: int = INGESTION_RETRY_MAX_ATTEMPTS,
+    backoff_seconds: float = INGESTION_RETRY_BACKOFF_SECONDS,
+    **ingest_kwargs,
+) -> IngestionStats:
+    """
+    Ingests the dead letters of a collection again, with exponential backoff between rounds.
+
+    Each round re-ingests the dead letters that failed fewer than `max_attempts`
+    times; the documents that succeed leave the dead-letter table, and the
+    others record one more attempt. Rounds stop when no retryable dead letter is
+    left, waiting `backoff_seconds`, then twice as long, and so on in between.
+
+    Args:
+        metadata_extractor (Any): The CrewAI-based crew responsible for extracting JSON metadata.
+        collection (Any): The ChromaDB collection the dead letters belong to.
+        journal (IngestionJournal, optional): The journal holding the dead letters. If None,
+            the default on-disk journal is used.
+        max_attempts (int): Total failed attempts after which a document is no longer retried.
+        backoff_seconds (float): Wait before the second round, doubled before each next round.
+        **ingest_kwargs: Additional options and extractor context forwarded to `ingest_corpus`.
+
+    Returns:
+        IngestionStats: The cumulated counts of the rounds; `failed` is the number of
+            dead letters left.
+    """
+    journal = journal or IngestionJournal()
+    total = IngestionStats(collection=collection.name)
+    for attempt in range(max_attempts):
+        letters = await asyncio.to_thread(journal.dead_letters, collection.name, max_attempts)
+        if not letters:
+            break
+        if attempt:
+            delay = backoff_seconds * 2 ** (attempt - 1)
+            logger.info(f"Retrying {len(letters)} dead letters of `{collection.name}` in {delay:g}s")
+            await asyncio.sleep(delay)
+
+        corpus = pd.DataFrame([{"doc_id": letter.doc_id, "content": letter.content} for letter in letters])
+        # The dead letters are not the whole corpus: nothing is deleted or resumed
+        stats = await ingest_corpus(
+            metadata_extractor, corpus, collection, journal=journal, delete_missing=False, resume=False, **ingest_kwargs
+        )
+        total.documents = total.documents or stats.documents
+        total.cache_hits += stats.cache_hits
+        total.extracted += stats.extracted
+        total.written += stats.written
+        total.seconds += stats.seconds
+
+    total.failed = len(await asyncio.to_thread(journal.dead_letters, collection.name))
+    logger.info(f"Dead letters of `{collection.name}`: {total.written} recovered, {total.failed} left.")
+    return total
@@ -0,0 +1,34 @@
+"""
+Skill Re-Canonicalization Entry Point.
+
+This module rewrites the skills stored in existing ChromaDB collections with
+their canonical names (see `src.skills.canonicalizer`), e.g. after the
+collections were ingested with an older alias table.
+
+Usage:
+    python -m src.db_ingestion.recanonicalize --collections cvs jobs
+"""
+
+import argparse
+
+from src.config.paths import CHROMA_DIR
+from src.constants import RECANONICALIZE_BATCH_SIZE
+from src.db_ingestion.chroma_client import get_client, get_collection, recanonicalize_collection
+
+
+def main() -> None:
+    """Parses the command line arguments and canonicalizes the skills of each collection."""
+    parser = argparse.ArgumentParser(description="Canonicalize the skills stored in ChromaDB collections.")
+    parser.add_argument("--collections", nargs="+", default=["cvs", "jobs"], help="Collections to update.")
+    parser.add_argument("--persist-dir", default=str(CHROMA_DIR), help="Path to the ChromaDB storage.")
+    parser.add_argument("--batch-size", type=int, default=RECANONICALIZE_BATCH_SIZE, help="Documents per update.")
+    args = parser.parse_args()
+
+    client = get_client(persist_dir=args.persist_dir)
+    for collection_name in args.collections:
+        collection = get_collection(client=client, collection_name=collection_name)
+        recanonicalize_collection(collection, batch_size=args.batch_size)
+
+
+if __name__ == "__main__":
+    main()
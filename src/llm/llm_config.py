@@ -47,3 +47,8 @@ openrouter_llm = LLM(
     temperature=0.6,
 )
 """LLM: OpenRouter instance used as a gateway for diverse model selection."""
+
+
+# Part of the version stamps of the caches of LLM outputs: switching a model invalidates them
+CONFIGURED_MODELS: tuple[str, ...] = tuple(sorted({groq_llm.model, gemini_llm.model, openrouter_llm.model}))
+"""tuple[str, ...]: Model names of the configured LLMs."""
@@ -0,0 +1,184 @@
+"""
+Prompt Token Budget Module.
+
+This module counts prompt tokens with the tokenizer of the configured model
+and compacts crew inputs to fit a token budget. Documents converted from PDF
+by `pymupdf4llm` are cleaned of layout boilerplate (page separators, image
+placeholders, table rules, repeated headers and footers, page numbers) and
+whitespace. Only if a budget is given and the document is still over it, its
+lowest-priority sections (references, hobbies, company boilerplate...) are
+dropped before the tail is truncated. Related documents are reduced to the
+fields the analysis tasks use.
+"""
+
+import re
+from collections import Counter
+from typing import Any
+
+import litellm
+
+from src.llm.llm_config import openrouter_llm
+
+DEFAULT_MODEL = openrouter_llm.model
+"""str: Model whose tokenizer is used when none is given (every crew uses the OpenRouter LLM)."""
+
+# Fields of a related document read by the gap analysis and interview question tasks
+ANALYSIS_DOC_FIELDS = ("title", "skills", "industries", "experience_level", "summary")
+
+# Section headings whose content matters least for classification, extraction and matching
+LOW_PRIORITY_SECTIONS = (
+    "reference",
+    "hobb",
+    "interest",
+    "volunteer",
+    "publication",
+    "award",
+    "about us",
+    "about the company",
+    "who we are",
+    "benefit",
+    "perks",
+    "we offer",
+    "equal opportunit",
+    "privacy",
+    "disclaimer",
+    "declaration",
+)
+
+_BOILERPLATE_PATTERNS = [
+    re.compile(r"!\[[^\]]*\]\([^)]*\)"),  # images
+    re.compile(r"\*\*==> picture \[[^\]]*\] intentionally omitted <==\*\*"),
+    re.compile(r"^-{3,}\s*(Start|End) of picture text\s*-{3,}(<br>)?$", re.MULTILINE),
+    re.compile(r"^\s*-{3,}\s*$", re.MULTILINE),  # page separators
+    re.compile(r"^\s*\|?(\s*:?-{3,}:?\s*\|)+\s*:?-*:?\s*$", re.MULTILINE),  # table rules
+    re.compile(r"^\s*(page\s*)?\d{1,3}(\s*(/|of)\s*\d{1,3})?\s*$", re.MULTILINE | re.IGNORECASE),  # page numbers
+    re.compile(r"<!--.*?-->", re.DOTALL),
+]
+_HEADING = re.compile(r"^(#{1,6}\s+\S.*|\*\*[^*\n]{1,80}\*\*:?)$")
+
+
+def count_tokens(text: str, model: str | None = None) -> int:
+    """
+    Counts the tokens of a text with the model's tokenizer.
+
+    Args:
+        text (str): The text to count.
+        model (str, optional): The LiteLLM model name. Defaults to the configured model.
+
+    Returns:
+        int: The number of tokens.
+    """
+    return litellm.token_counter(model=model or DEFAULT_MODEL, text=text)
+
+
+def clean_markdown(text: str) -> str:
+    """
+    Removes layout boilerplate and redundant whitespace from a Markdown document.
+
+    Args:
+        text (str): The document, e.g., as converted by `pymupdf4llm`.
+
+    Returns:
+        str: The cleaned document.
+    """
+    text = text.replace("<br>", " ")
+    for pattern in _BOILERPLATE_PATTERNS:
+        text = pattern.sub("", text)
+
+    lines = [re.sub(r"[ \t]+", " ", line).strip() for line in text.splitlines()]
+    # Short lines repeated on several pages are running headers or footers
+    counts = Counter(line for line in lines if line and len(line) <= 80)
+    seen: set[str] = set()
+    kept = []
+    for line in lines:
+        if counts[line] >= 3:
+            if line in seen:
+                continue
+            seen.add(line)
+        kept.append(line)
+
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(kept)).strip()
+
+
+def _split_sections(text: str) -> list[str]:
+    """Splits a Markdown document at its heading lines, keeping each heading with its body."""
+    sections: list[list[str]] = [[]]
+    for line in text.splitlines():
+        if _HEADING.match(line) and sections[-1]:
+            sections.append([])
+        sections[-1].append(line)
+    return ["\n".join(section) for section in sections]
+
+
+def _is_low_priority(section: str) -> bool:
+    """Whether the section's heading marks content that can be dropped first."""
+    heading = section.split("\n", 1)[0]
+    return bool(_HEADING.match(heading)) and any(key in heading.lower() for key in LOW_PRIORITY_SECTIONS)
+
+
+def truncate_to_budget(text: str, budget: int, model: str | None = None) -> str:
+    """
+    Shortens a document to at most `budget` tokens, dropping the least useful content first.
+
+    Low-priority sections are removed from the end of the document backwards;
+    if the document is still over budget, its tail is truncated.
+
+    Args:
+        text (str): The document.
+        budget (int): Maximum number of tokens.
+        model (str, optional): The LiteLLM model name. Defaults to the configured model.
+
+    Returns:
+        str: The document, unchanged if it already fits.
+    """
+    if count_tokens(text, model) <= budget:
+        return text
+
+    sections = _split_sections(text)
+    for i in reversed(range(len(sections))):
+        if _is_low_priority(sections[i]):
+            del sections[i]
+            text = "\n".join(sections)
+            if count_tokens(text, model) <= budget:
+                return text
+
+    # Keep the head: the profile, skills and requirements usually come first
+    tokens = count_tokens(text, model)
+    while tokens > budget:
+        text = text[: int(len(text) * budget / tokens * 0.95)]
+        tokens = count_tokens(text, model)
+    return text
+
+
+def compact_document(text: str, budget: int | None, model: str | None = None) -> tuple[str, int, int]:
+    """
+    Cleans a document and fits it into a token budget.
+
+    Args:
+        text (str): The raw document.
+        budget (int | None): Maximum number of tokens. None only cleans the document.
+        model (str, optional): The LiteLLM model name. Defaults to the configured model.
+
+    Returns:
+        tuple[str, int, int]: The compacted document and its token counts before and after.
+    """
+    compacted = clean_markdown(text)
+    if budget is not None:
+        compacted = truncate_to_budget(compacted, budget, model)
+    return compacted, count_tokens(text, model), count_tokens(compacted, model)
+
+
+def select_fields(docs: dict[str, dict[str, Any]], fields: tuple[str, ...] = ANALYSIS_DOC_FIELDS) -> dict[str, Any]:
+    """
+    Keeps only the fields of each related document that the analysis tasks read.
+
+    Args:
+        docs (dict[str, dict[str, Any]]): Related documents keyed by ID, as returned by the vector query.
+        fields (tuple[str, ...]): The fields to keep.
+
+    Returns:
+        dict[str, Any]: The reduced documents, keyed by the same IDs.
+    """
+    return {
+        doc_id: {k: v for k, v in doc.items() if k in fields and v not in ("", None)} for doc_id, doc in docs.items()
+    }
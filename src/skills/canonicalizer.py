@@ -0,0 +1,149 @@
+"""
+Skill Canonicalizer Module.
+
+This module rewrites free-text skills fields ("Python, python3, Py, k8s/Docker")
+into canonical, deduplicated ones ("Python, Kubernetes, Docker") before they
+are stored in ChromaDB or used by the flow. The aliases of `SKILL_ALIASES` are
+compiled into a token trie, so every known skill in an item is found in a
+single left-to-right pass (longest match first) whatever the size of the
+alias table. An item made only of known skills and connectors ("Python and
+SQL", "Django/Flask") is split into those skills; any other item keeps its
+wording, as resolved by `canonical_skill`.
+"""
+
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any
+
+from src.skills.taxonomy import ALIAS_INDEX, canonical_skill, normalize_skill, split_skills
+
+_TOKEN = re.compile(r"[\w+#.\-]+")
+_CONNECTORS = frozenset({"and", "or", "&", "with", "plus", "including", "incl", "e.g", "eg", "etc"})
+_END = ""
+
+
+def _tokenize(text: str) -> list[str]:
+    """Splits a normalized skill into trie tokens ('/' and spaces separate tokens)."""
+    return [token.strip(".") for token in _TOKEN.findall(text) if token.strip(".")]
+
+
+class SkillCanonicalizer:
+    """
+    Multi-pattern skill lookup over a token trie of known aliases.
+
+    Attributes:
+        trie (dict): Nested token -> child mapping; the empty-string key holds the canonical name.
+    """
+
+    def __init__(self, aliases: dict[str, str] = ALIAS_INDEX) -> None:
+        """
+        Compiles the alias table into a token trie.
+
+        Args:
+            aliases (dict[str, str]): Canonical name per normalized alias.
+        """
+        self.trie: dict[str, Any] = {}
+        for alias, canonical in aliases.items():
+            node = self.trie
+            for token in _tokenize(alias):
+                node = node.setdefault(token, {})
+            node[_END] = canonical
+
+    def find(self, text: str) -> list[tuple[int, int, str]]:
+        """
+        Finds the known skills in a normalized text, longest match first.
+
+        Args:
+            text (str): A normalized skill or phrase.
+
+        Returns:
+            list[tuple[int, int, str]]: Start token, end token (exclusive) and canonical name of each match.
+        """
+        tokens = _tokenize(text)
+        matches = []
+        i = 0
+        while i < len(tokens):
+            node, longest = self.trie, None
+            for j in range(i, len(tokens)):
+                node = node.get(tokens[j])
+                if node is None:
+                    break
+                if _END in node:
+                    longest = (i, j + 1, node[_END])
+            if longest is None:
+                i += 1
+            else:
+                matches.append(longest)
+                i = longest[1]
+        return matches
+
+    @lru_cache(maxsize=65536)  # noqa: B019 - the canonicalizer is a long-lived singleton
+    def canonical_items(self, item: str) -> tuple[tuple[str, str], ...]:
+        """
+        Resolves one item of a skills field to its canonical skills.
+
+        Args:
+            item (str): A single comma-separated item (e.g., 'Python3', 'Django/Flask').
+
+        Returns:
+            tuple[tuple[str, str], ...]: Comparison key and display name of each skill in the item.
+        """
+        key, display = canonical_skill(item)
+        if key in ALIAS_INDEX:
+            return ((key, display),)
+
+        tokens = _tokenize(key)
+        matches = self.find(key)
+        covered = {position for start, end, _ in matches for position in range(start, end)}
+        leftovers = [token for position, token in enumerate(tokens) if position not in covered]
+        # Only split items made of known skills and connectors, e.g. 'Python and SQL'
+        if matches and all(token in _CONNECTORS for token in leftovers):
+            return tuple((normalize_skill(canonical), canonical) for _, _, canonical in matches)
+        return ((key, display),) if key else ()
+
+    def canonical_skills(self, skills: str | Iterable[str] | None) -> dict[str, str]:
+        """
+        Resolves a skills field to its canonical skills.
+
+        Args:
+            skills (str | Iterable[str] | None): A metadata `skills` string, or already split skills.
+
+        Returns:
+            dict[str, str]: Display name per comparison key, in first-seen order, without duplicates.
+        """
+        resolved: dict[str, str] = {}
+        for item in split_skills(skills):
+            for key, display in self.canonical_items(item):
+                resolved.setdefault(key, display)
+        return resolved
+
+    def canonicalize(self, skills: str | Iterable[str] | None) -> str:
+        """
+        Rewrites a skills field with canonical, deduplicated skills.
+
+        Args:
+            skills (str | Iterable[str] | None): A metadata `skills` string, or already split skills.
+
+        Returns:
+            str: The comma-flattened canonical skills (empty if there are none).
+        """
+        return ", ".join(self.canonical_skills(skills).values())
+
+    def canonicalize_metadata(self, metadata: dict[str, Any]) -> dict[str, Any]:
+        """
+        Returns a copy of document metadata with its `skills` field canonicalized.
+
+        Args:
+            metadata (dict[str, Any]): CV or job metadata (e.g., a validated `CVMetadata` dump).
+
+        Returns:
+            dict[str, Any]: The metadata, unchanged if it has no skills.
+        """
+        if not metadata.get("skills"):
+            return metadata
+        return {**metadata, "skills": self.canonicalize(metadata["skills"])}
+
+
+SKILL_CANONICALIZER = SkillCanonicalizer()
+"""SkillCanonicalizer: Process-wide canonicalizer shared by the ingestion, the flow and the skill matcher."""
@@ -0,0 +1,175 @@
+"""
+Local Skill Matcher Module.
+
+This module computes the matched and missing skills between a job and one or
+more CVs without calling an LLM, from the comma-flattened `skills` fields of
+their metadata. Skills are compared through their canonical form (see
+`src.skills.canonicalizer`), by the related skills of `SKILL_EVIDENCE` (e.g., a
+required 'Git' is evidenced by 'GitHub'), then by fuzzy spelling and by word
+containment (e.g., 'Python' is evidenced by 'Python scripting').
+
+To match one job against thousands of CVs, `SkillIndex` holds the CVs as a
+boolean document x skill matrix: each required skill is resolved once against
+the index vocabulary, and the matches of every document come from a single
+matrix product.
+"""
+
+import difflib
+import re
+from collections.abc import Iterable
+from enum import StrEnum
+
+import numpy as np
+
+from src.constants import SKILL_FUZZY_THRESHOLD
+from src.skills.canonicalizer import SKILL_CANONICALIZER
+from src.skills.taxonomy import EVIDENCE_INDEX
+from src.talent_selection_flow.crews.schemas import GapAnalysis
+
+SkillsField = str | Iterable[str] | None
+
+
+class SkillMatchingMode(StrEnum):
+    """
+    How the flow uses the local skill matcher in the gap analysis.
+
+    Attributes:
+        OFF: The gap analysis is produced by the LLM alone.
+        REFINE: The local match is given to the LLM, which confirms or corrects it.
+        FAST: The local match is the gap analysis; only the interview questions use the LLM.
+    """
+
+    OFF = "off"
+    REFINE = "refine"
+    FAST = "fast"
+
+
+def canonical_skills(skills: SkillsField) -> dict[str, str]:
+    """
+    Resolves a skills field to its canonical skills.
+
+    Args:
+        skills (SkillsField): A metadata `skills` string, or already split skills.
+
+    Returns:
+        dict[str, str]: Display name per comparison key, in first-seen order, without duplicates.
+    """
+    return SKILL_CANONICALIZER.canonical_skills(skills)
+
+
+class SkillIndex:
+    """
+    Boolean document x skill matrix of a set of documents, for vectorized matching.
+
+    Attributes:
+        doc_ids (list[str]): The indexed documents, in row order.
+        vocabulary (dict[str, int]): Column of each skill comparison key.
+        matrix (np.ndarray): `matrix[i, j]` is True if document `i` lists skill `j`.
+        fuzzy_threshold (float): Minimum spelling similarity in [0, 1] for a fuzzy match.
+    """
+
+    def __init__(self, docs: dict[str, SkillsField], fuzzy_threshold: float = SKILL_FUZZY_THRESHOLD) -> None:
+        """
+        Indexes the skills of a set of documents.
+
+        Args:
+            docs (dict[str, SkillsField]): The skills field of each document, keyed by document ID.
+            fuzzy_threshold (float): Minimum spelling similarity in [0, 1] for a fuzzy match.
+        """
+        self.doc_ids = list(docs)
+        self.fuzzy_threshold = fuzzy_threshold
+        self.vocabulary: dict[str, int] = {}
+        rows, cols = [], []
+        for row, skills in enumerate(docs.values()):
+            for key in canonical_skills(skills):
+                rows.append(row)
+                cols.append(self.vocabulary.setdefault(key, len(self.vocabulary)))
+
+        self.matrix = np.zeros((len(self.doc_ids), len(self.vocabulary)), dtype=bool)
+        self.matrix[rows, cols] = True
+        self._keys = list(self.vocabulary)
+
+    def _columns(self, key: str) -> list[int]:
+        """Finds the vocabulary columns evidencing a required skill: exact, related, contained or fuzzy matches."""
+        # Related skills evidence the required one (e.g., 'github' for 'git'), see `SKILL_EVIDENCE`
+        related = [self.vocabulary[skill] for skill in EVIDENCE_INDEX.get(key, ()) if skill in self.vocabulary]
+        if key in self.vocabulary:
+            return [self.vocabulary[key], *related]
+
+        # A more specific skill evidences the required one (e.g., 'python scripting' for 'python')
+        pattern = re.compile(rf"(?<![\w+#]){re.escape(key)}(?![\w+#])")
+        columns = [col for col, candidate in enumerate(self._keys) if pattern.search(candidate)]
+        for candidate in difflib.get_close_matches(key, self._keys, n=3, cutoff=self.fuzzy_threshold):
+            columns.append(self.vocabulary[candidate])
+        return columns + related
+
+    def hits(self, required: SkillsField) -> tuple[list[str], np.ndarray]:
+        """
+        Computes which required skills each indexed document evidences.
+
+        Args:
+            required (SkillsField): The required skills (e.g., a job's `skills` field).
+
+        Returns:
+            tuple[list[str], np.ndarray]: The display names of the required skills and a
+                documents x required-skills boolean matrix.
+        """
+        required_skills = canonical_skills(required)
+        selector = np.zeros((len(self.vocabulary), len(required_skills)), dtype=bool)
+        for j, key in enumerate(required_skills):
+            selector[self._columns(key), j] = True
+
+        hits = (self.matrix.astype(np.int32) @ selector.astype(np.int32)) > 0
+        return list(required_skills.values()), hits
+
+    def coverage(self, required: SkillsField) -> dict[str, float]:
+        """
+        Computes the share of required skills evidenced by each document.
+
+        Args:
+            required (SkillsField): The required skills.
+
+        Returns:
+            dict[str, float]: Coverage in [0, 1] per document ID (1.0 when nothing is required).
+        """
+        _, hits = self.hits(required)
+        scores = hits.mean(axis=1) if hits.shape[1] else np.ones(len(self.doc_ids))
+        return dict(zip(self.doc_ids, scores.round(4).tolist(), strict=True))
+
+    def match(self, required: SkillsField) -> dict[str, GapAnalysis]:
+        """
+        Computes the gap analysis of every indexed document against the required skills.
+
+        Args:
+            required (SkillsField): The required skills.
+
+        Returns:
+            dict[str, GapAnalysis]: The matched and missing required skills per document ID.
+        """
+        names, hits = self.hits(required)
+        return {
+            doc_id: GapAnalysis(
+                matched_skills=[name for name, hit in zip(names, row, strict=True) if hit],
+                missing_must_have=[name for name, hit in zip(names, row, strict=True) if not hit],
+            )
+            for doc_id, row in zip(self.doc_ids, hits, strict=True)
+        }
+
+
+def match_skills(
+    candidate: SkillsField,
+    required: SkillsField,
+    fuzzy_threshold: float = SKILL_FUZZY_THRESHOLD,
+) -> GapAnalysis:
+    """
+    Computes the matched and missing required skills of a single candidate.
+
+    Args:
+        candidate (SkillsField): The candidate's skills (e.g., a CV's `skills` field).
+        required (SkillsField): The required skills (e.g., a job's `skills` field).
+        fuzzy_threshold (float): Minimum spelling similarity in [0, 1] for a fuzzy match.
+
+    Returns:
+        GapAnalysis: The required skills evidenced by the candidate, and the missing ones.
+    """
+    return SkillIndex({"candidate": candidate}, fuzzy_threshold=fuzzy_threshold).match(required)["candidate"]
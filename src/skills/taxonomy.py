@@ -0,0 +1,186 @@
+"""
+Skill Taxonomy Module.
+
+This module normalizes the free-text skills extracted into `CVMetadata` and
+`JobMetadata` (comma-flattened strings such as "Python, python3, Py") and
+maps known spellings, abbreviations and versions to one canonical name
+through the `SKILL_ALIASES` table. Aliases are strict synonyms: related but
+distinct skills (Git and GitHub, Docker and containerization) stay separate,
+and `SKILL_EVIDENCE` tells the matcher which ones evidence a required skill.
+"""
+
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+
+# Canonical skill name -> alternative spellings (matched after normalization)
+SKILL_ALIASES: dict[str, tuple[str, ...]] = {
+    "Python": ("py", "python3", "python 3", "cpython"),
+    "Java": ("java se", "java ee", "j2ee", "core java"),
+    "JavaScript": ("js", "ecmascript", "es6", "vanilla js"),
+    "TypeScript": (),
+    "C++": ("cpp", "c plus plus"),
+    "C#": ("c sharp", "csharp"),
+    "Go": ("golang",),
+    "Rust": ("rust lang", "rustlang"),
+    "R": ("r language", "r programming"),
+    "SQL": ("structured query language", "sql language"),
+    "PostgreSQL": ("postgres", "postgre", "psql"),
+    "MySQL": ("my sql",),
+    "Microsoft SQL Server": ("sql server", "mssql", "ms sql"),
+    "MongoDB": ("mongo",),
+    "Redis": ("redis cache",),
+    "Elasticsearch": ("elastic search",),
+    "ELK Stack": ("elk", "elastic stack"),
+    "Node.js": ("node", "nodejs", "node js"),
+    "React": ("react.js", "reactjs", "react js"),
+    "Angular": ("angular.js", "angularjs", "angular js"),
+    "Vue.js": ("vue", "vuejs", "vue js"),
+    "Django": ("django framework",),
+    "Flask": ("flask framework",),
+    "FastAPI": ("fast api",),
+    "Spring": ("spring framework",),
+    "Spring Boot": ("springboot",),
+    ".NET": ("dotnet", "dot net", ".net core", "asp.net", "asp.net core"),
+    "HTML": ("html5",),
+    "CSS": ("css3",),
+    "Amazon Web Services": ("aws", "amazon aws"),
+    "Microsoft Azure": ("azure", "ms azure"),
+    "Google Cloud Platform": ("gcp", "google cloud"),
+    "Docker": ("docker containers",),
+    "Containerization": ("containers",),
+    "Kubernetes": ("k8s", "kube"),
+    "Terraform": ("hashicorp terraform",),
+    "CI/CD": ("ci cd", "cicd"),
+    "Git": (),
+    "GitHub": (),
+    "GitLab": (),
+    "Version Control": ("version control systems", "vcs"),
+    "Linux": ("gnu/linux",),
+    "Unix": (),
+    "Machine Learning": ("ml", "machine-learning"),
+    "Deep Learning": ("dl", "deep-learning"),
+    "Natural Language Processing": ("nlp",),
+    "Computer Vision": (),
+    "Image Processing": (),
+    "Large Language Models": ("llm", "llms"),
+    "Generative AI": ("genai", "gen ai"),
+    "TensorFlow": ("tensor flow",),
+    "PyTorch": ("torch", "py torch"),
+    "scikit-learn": ("sklearn", "scikit learn", "scikit"),
+    "pandas": ("python pandas",),
+    "NumPy": ("numpy",),
+    "Apache Spark": ("spark", "pyspark"),
+    "Apache Kafka": ("kafka",),
+    "Apache Airflow": ("airflow",),
+    "Power BI": ("powerbi", "microsoft power bi"),
+    "Tableau": ("tableau desktop",),
+    "Microsoft Excel": ("excel", "ms excel", "advanced excel"),
+    "Microsoft Office": ("ms office", "office 365", "microsoft 365"),
+    "REST APIs": ("rest", "restful", "rest api", "restful apis", "restful services"),
+    "GraphQL": ("graph ql",),
+    "Agile": ("agile methodologies", "agile methodology"),
+    "Scrum": ("scrum methodology",),
+    "Project Management": (),
+    "Data Analysis": ("data analytics",),
+    "Data Visualization": ("data viz", "dataviz"),
+    "Communication": ("communication skills", "verbal communication", "written communication"),
+    "Leadership": ("team leadership",),
+    "Customer Service": ("customer support", "client service"),
+    "Salesforce": ("sfdc", "salesforce crm"),
+    "SAP": ("sap erp",),
+}
+
+# Canonical skill -> skills that evidence it when it is required (canonical names, or the spelling of skills that
+# are broader, narrower or only related, hence not aliases). Only the matcher uses this table: the stored skills keep
+# their own meaning (GitHub is not rewritten to Git, nor analytics to data analysis)
+SKILL_EVIDENCE: dict[str, tuple[str, ...]] = {
+    "Git": ("GitHub", "GitLab"),
+    "Version Control": ("Git", "GitHub", "GitLab"),
+    "Spring": ("Spring Boot",),
+    "Containerization": ("Docker", "Kubernetes"),
+    "Unix": ("Linux",),
+    "Elasticsearch": ("ELK Stack",),
+    "Generative AI": ("Large Language Models",),
+    "Microsoft SQL Server": ("T-SQL", "TSQL"),
+    "CI/CD": ("Continuous Integration", "Continuous Delivery", "Continuous Deployment"),
+    "Deep Learning": ("Neural Networks",),
+    "Scrum": ("Scrum Master",),
+    "Project Management": ("Project Planning",),
+    "Data Analysis": ("Analytics",),
+    "Leadership": ("People Management",),
+}
+
+_VERSION_SUFFIX = re.compile(r"\s*v?\d+(?:\.\d+)*$")
+_SEPARATORS = re.compile(r"[,;|\n•]+")
+
+
+def normalize_skill(skill: str) -> str:
+    """
+    Normalizes a skill for comparison: lowercase, no qualifiers, single spaces.
+
+    Characters meaningful in skill names ('+', '#', '.', '/', '-') are kept,
+    so 'C++', 'C#' and 'Node.js' stay distinct from 'C' and 'Node'.
+
+    Args:
+        skill (str): A single skill as written in a document.
+
+    Returns:
+        str: The normalized skill, empty if nothing meaningful is left.
+    """
+    text = re.sub(r"\([^)]*\)", " ", skill.lower())  # e.g., "python (advanced)"
+    text = re.sub(r"[^\w+#./ -]", " ", text)
+    return re.sub(r"\s+", " ", text).strip(" ./-")
+
+
+# Normalized spelling -> canonical name, including the canonical names themselves
+ALIAS_INDEX: dict[str, str] = {
+    normalize_skill(alias): canonical for canonical, aliases in SKILL_ALIASES.items() for alias in (canonical, *aliases)
+}
+
+
+# Normalized required skill -> normalized skills evidencing it
+EVIDENCE_INDEX: dict[str, tuple[str, ...]] = {
+    normalize_skill(required): tuple(normalize_skill(skill) for skill in evidence)
+    for required, evidence in SKILL_EVIDENCE.items()
+}
+
+
+def split_skills(skills: str | Iterable[str] | None) -> list[str]:
+    """
+    Splits a comma-flattened skills field into individual skills.
+
+    Args:
+        skills (str | Iterable[str] | None): A metadata `skills` string, or already split skills.
+
+    Returns:
+        list[str]: The non-empty skills, stripped, in their original order.
+    """
+    if not skills:
+        return []
+    parts = _SEPARATORS.split(skills) if isinstance(skills, str) else skills
+    return [part.strip() for part in parts if part and part.strip()]
+
+
+@lru_cache(maxsize=65536)
+def canonical_skill(skill: str) -> tuple[str, str]:
+    """
+    Resolves a skill to its comparison key and display name.
+
+    Known skills (including version-suffixed spellings such as 'python3.11')
+    resolve to their canonical name; unknown ones keep their own spelling.
+
+    Args:
+        skill (str): A single skill as written in a document.
+
+    Returns:
+        tuple[str, str]: The comparison key (normalized canonical name) and the display name.
+    """
+    key = normalize_skill(skill)
+    canonical = ALIAS_INDEX.get(key)
+    if canonical is None:
+        unversioned = _VERSION_SUFFIX.sub("", key)
+        canonical = ALIAS_INDEX.get(unversioned) if unversioned != key else None
+    if canonical is None:
+        return key, re.sub(r"\s+", " ", skill).strip()
+    return normalize_skill(canonical), canonical
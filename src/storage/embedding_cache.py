@@ -0,0 +1,80 @@
+"""
+Query Embedding Cache Module.
+
+This module provides a bounded, in-memory LRU cache of query embeddings, so a
+document is sent to the embedding API once per process: the country-filtered
+search and its global fallback reuse the same vector, and re-evaluating a
+document skips the embedding call entirely. Entries are keyed by the hash of
+the normalized text and the embedding model.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from src.constants import EMBEDDING_CACHE_MAX_ENTRIES
+from src.utils.hashing import content_hash
+from src.utils.logger import logger
+
+
+class EmbeddingCache:
+    """
+    Thread-safe LRU cache of query embeddings.
+
+    Attributes:
+        max_entries (int): Maximum number of cached embeddings; the least recently used are evicted first.
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups that called the embedding function.
+    """
+
+    def __init__(self, max_entries: int = EMBEDDING_CACHE_MAX_ENTRIES) -> None:
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_entries (int): Maximum number of cached embeddings.
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str], Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Returns the number of cached embeddings."""
+        return len(self._entries)
+
+    def embed(self, text: str, embedding_fn: Any) -> Any:
+        """
+        Returns the embedding of a text, calling `embedding_fn` only on a cache miss.
+
+        Args:
+            text (str): The query text (e.g., a full CV or job description).
+            embedding_fn (Any): A ChromaDB embedding function; its `model_name` is part of the key.
+
+        Returns:
+            Any: The embedding vector, as returned by `embedding_fn`.
+        """
+        key = (content_hash(text), getattr(embedding_fn, "model_name", type(embedding_fn).__name__))
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return embedding
+
+        # Embed outside the lock: the API call must not serialize concurrent flows
+        embedding = embedding_fn([text])[0]
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = embedding
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        logger.debug(f"Embedded query text ({self.hits} hits / {self.misses} misses so far)")
+        return embedding
+
+    def clear(self) -> None:
+        """Drops every cached embedding, e.g. after changing the embedding model settings."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,200 @@
+"""
+Flow Result Cache Module.
+
+This module provides a persistent, content-addressed cache for complete
+TalentSelectionFlow results. Entries are keyed by the hash of the normalized
+input document, the version stamp of the crews (YAML prompts, guardrails,
+schemas and report rendering) and of the skill matcher, the configured LLM
+models, the flow options that affect the output (including the Chroma persist
+directory) and the version stamps of the Chroma collections. A hit returns the
+stored report and state without calling any LLM. The cache is bounded by a TTL
+and a maximum number of entries (least recently used entries are evicted
+first).
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from contextlib import closing
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from src.config.paths import CREWS_DIR, FLOW_CACHE_PATH, SKILLS_DIR
+from src.constants import FLOW_CACHE_MAX_ENTRIES, FLOW_CACHE_TTL_SECONDS
+from src.llm.llm_config import CONFIGURED_MODELS
+from src.utils.hashing import content_hash, files_fingerprint
+from src.utils.logger import logger
+
+COLLECTIONS: tuple[str, ...] = ("cvs", "jobs")
+"""tuple[str, ...]: Chroma collections whose content a flow result depends on."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS flow_results (
+    key TEXT PRIMARY KEY,
+    collection_name TEXT NOT NULL,
+    report TEXT NOT NULL,
+    state TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_flow_results_collection ON flow_results (collection_name);
+CREATE INDEX IF NOT EXISTS idx_flow_results_last_accessed ON flow_results (last_accessed);
+CREATE TABLE IF NOT EXISTS collection_versions (
+    name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+);
+"""
+
+
+@lru_cache(maxsize=1)
+def crews_version() -> str:
+    """
+    Returns the version stamp of the prompts and code that shape a flow result.
+
+    Returns:
+        str: A short fingerprint of every crew's YAML configuration and Python modules
+            (agents, guardrails, schemas and report rendering) and of the skill matcher and taxonomy.
+    """
+    return files_fingerprint([*CREWS_DIR.rglob("*.yaml"), *CREWS_DIR.rglob("*.py"), *SKILLS_DIR.glob("*.py")])
+
+
+class FlowResultCache:
+    """
+    SQLite-backed cache of rendered reports and flow states.
+
+    Each operation opens its own short-lived connection, so a single cache
+    instance can be shared across threads and concurrent flows.
+
+    Attributes:
+        path (Path): Location of the SQLite database.
+        ttl_seconds (float): Time after which an entry is considered stale.
+        max_entries (int): Maximum number of entries kept after each write.
+    """
+
+    def __init__(
+        self,
+        path: Path = FLOW_CACHE_PATH,
+        ttl_seconds: float = FLOW_CACHE_TTL_SECONDS,
+        max_entries: int = FLOW_CACHE_MAX_ENTRIES,
+    ) -> None:
+        """
+        Initializes the cache and creates its schema if needed.
+
+        Args:
+            path (Path): Location of the SQLite database.
+            ttl_seconds (float): Time after which an entry is considered stale.
+            max_entries (int): Maximum number of entries kept after each write.
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Opens a new connection to the cache database."""
+        return sqlite3.connect(self.path, timeout=30)
+
+    def make_key(self, raw_input: str, options: dict[str, Any] | None = None) -> str:
+        """
+        Builds the cache key of a flow run.
+
+        Args:
+            raw_input (str): The raw document evaluated by the flow.
+            options (dict[str, Any], optional): Flow options that change the result (e.g., the
+                Chroma persist directory the related documents are retrieved from).
+
+        Returns:
+            str: The SHA-256 hex digest identifying the run.
+        """
+        with closing(self._connect()) as conn:
+            versions = dict(conn.execute("SELECT name, version FROM collection_versions").fetchall())
+
+        key_parts = {
+            "content": content_hash(raw_input),
+            "crews": crews_version(),
+            "models": list(CONFIGURED_MODELS),
+            "collections": {name: versions.get(name, 0) for name in COLLECTIONS},
+            "options": options or {},
+        }
+        return hashlib.sha256(json.dumps(key_parts, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> tuple[str, dict[str, Any]] | None:
+        """
+        Looks up a flow result.
+
+        Args:
+            key (str): The key returned by `make_key`.
+
+        Returns:
+            tuple[str, dict[str, Any]] | None: The report and the state fields, or
+                None if the entry is missing or expired.
+        """
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute("SELECT report, state, created_at FROM flow_results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+
+            report, state, created_at = row
+            if now - created_at > self.ttl_seconds:
+                conn.execute("DELETE FROM flow_results WHERE key = ?", (key,))
+                return None
+
+            conn.execute("UPDATE flow_results SET last_accessed = ? WHERE key = ?", (now, key))
+        return report, json.loads(state)
+
+    def put(self, key: str, collection_name: str, report: str, state: dict[str, Any]) -> None:
+        """
+        Stores a flow result and enforces the TTL and size bounds.
+
+        Args:
+            key (str): The key returned by `make_key`.
+            collection_name (str): The Chroma collection the flow queried.
+            report (str): The rendered Markdown report.
+            state (dict[str, Any]): JSON-serializable state fields to restore on a hit.
+        """
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO flow_results VALUES (?, ?, ?, ?, ?, ?)",
+                (key, collection_name, report, json.dumps(state), now, now),
+            )
+            conn.execute("DELETE FROM flow_results WHERE created_at < ?", (now - self.ttl_seconds,))
+            conn.execute(
+                "DELETE FROM flow_results WHERE key IN "
+                "(SELECT key FROM flow_results ORDER BY last_accessed DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def invalidate_collection(self, collection_name: str) -> int:
+        """
+        Invalidates every result that depends on a collection.
+
+        Bumps the collection's version stamp, so keys built afterwards no longer
+        match, and deletes the entries that queried it.
+
+        Args:
+            collection_name (str): The Chroma collection that changed.
+
+        Returns:
+            int: The number of deleted entries.
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT INTO collection_versions VALUES (?, 1) ON CONFLICT(name) DO UPDATE SET version = version + 1",
+                (collection_name,),
+            )
+            deleted = conn.execute("DELETE FROM flow_results WHERE collection_name = ?", (collection_name,)).rowcount
+
+        logger.info(f"Invalidated {deleted} cached flow results for collection `{collection_name}`")
+        return deleted
+
+    def clear(self) -> None:
+        """Deletes every cached flow result."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM flow_results")
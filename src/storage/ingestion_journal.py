@@ -0,0 +1,222 @@
+"""
+Ingestion Journal Module.
+
+This module records the progress of ChromaDB ingestions in SQLite, so an
+interrupted ingestion can resume where it stopped and failed documents are
+not lost. Each run journals the documents it wrote to the collection (with
+their content hash); documents whose extraction failed are kept in a
+dead-letter table with their content, the error and the feedback of the
+guardrails that rejected their outputs, until a retry succeeds.
+"""
+
+import json
+import sqlite3
+import time
+import uuid
+from contextlib import closing
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from src.config.paths import INGESTION_JOURNAL_PATH
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ingestion_runs (
+    run_id TEXT PRIMARY KEY,
+    collection_name TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_ingestion_runs_collection ON ingestion_runs (collection_name, started_at);
+CREATE TABLE IF NOT EXISTS ingested_documents (
+    run_id TEXT NOT NULL,
+    doc_id TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    written_at REAL NOT NULL,
+    PRIMARY KEY (run_id, doc_id)
+);
+CREATE TABLE IF NOT EXISTS dead_letters (
+    collection_name TEXT NOT NULL,
+    doc_id TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    content TEXT NOT NULL,
+    error TEXT NOT NULL,
+    guardrail_feedback TEXT NOT NULL,
+    attempts INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (collection_name, doc_id)
+);
+"""
+
+
+class DeadLetter(BaseModel):
+    """
+    A document whose metadata extraction failed.
+
+    Attributes:
+        collection_name (str): The collection the document was ingested into.
+        doc_id (str): The document ID.
+        content_hash (str): Hash of the normalized document content.
+        content (str): The document text, so it can be retried without the source corpus.
+        error (str): The last extraction error.
+        guardrail_feedback (list[str]): Feedback of the guardrails that rejected the last attempt's outputs.
+        attempts (int): Number of failed attempts.
+        created_at (float): When the document first failed (epoch seconds).
+        updated_at (float): When the document last failed (epoch seconds).
+    """
+
+    collection_name: str
+    doc_id: str
+    content_hash: str
+    content: str
+    error: str
+    guardrail_feedback: list[str] = []
+    attempts: int = 1
+    created_at: float
+    updated_at: float
+
+
+class IngestionJournal:
+    """
+    SQLite-backed journal of ingestion runs and dead-letter store.
+
+    Each operation opens its own short-lived connection, so a single journal
+    instance can be shared across threads.
+
+    Attributes:
+        path (Path): Location of the SQLite database.
+    """
+
+    def __init__(self, path: Path = INGESTION_JOURNAL_PATH) -> None:
+        """
+        Initializes the journal and creates its schema if needed.
+
+        Args:
+            path (Path): Location of the SQLite database.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Opens a new connection to the journal database."""
+        return sqlite3.connect(self.path, timeout=30)
+
+    def start_run(self, collection_name: str, resume: bool = False) -> tuple[str, dict[str, str]]:
+        """
+        Starts an ingestion run, or resumes the last unfinished run of the collection.
+
+        Args:
+            collection_name (str): The collection being ingested.
+            resume (bool): If True, continue the last run of the collection that did not finish.
+
+        Returns:
+            tuple[str, dict[str, str]]: The run ID and the content hash of each document the
+                run already wrote (empty for a new run).
+        """
+        with closing(self._connect()) as conn, conn:
+            if resume:
+                row = conn.execute(
+                    "SELECT run_id FROM ingestion_runs WHERE collection_name = ? AND finished_at IS NULL "
+                    "ORDER BY started_at DESC LIMIT 1",
+                    (collection_name,),
+                ).fetchone()
+                if row:
+                    written = conn.execute(
+                        "SELECT doc_id, content_hash FROM ingested_documents WHERE run_id = ?", (row[0],)
+                    ).fetchall()
+                    return row[0], dict(written)
+
+            run_id = uuid.uuid4().hex
+            conn.execute(
+                "INSERT INTO ingestion_runs VALUES (?, ?, ?, NULL)",
+                (run_id, collection_name, time.time()),
+            )
+        return run_id, {}
+
+    def finish_run(self, run_id: str) -> None:
+        """
+        Marks a run as finished, so it is not resumed.
+
+        Args:
+            run_id (str): The run ID.
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.execute("UPDATE ingestion_runs SET finished_at = ? WHERE run_id = ?", (time.time(), run_id))
+
+    def mark_written(self, run_id: str, collection_name: str, docs: list[tuple[str, str]]) -> None:
+        """
+        Records documents written to the collection and clears their dead letters.
+
+        Args:
+            run_id (str): The run ID.
+            collection_name (str): The collection the documents were written to.
+            docs (list[tuple[str, str]]): The ID and content hash of each written document.
+        """
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO ingested_documents VALUES (?, ?, ?, ?)",
+                [(run_id, doc_id, digest, now) for doc_id, digest in docs],
+            )
+            conn.executemany(
+                "DELETE FROM dead_letters WHERE collection_name = ? AND doc_id = ?",
+                [(collection_name, doc_id) for doc_id, _ in docs],
+            )
+
+    def add_dead_letter(
+        self,
+        collection_name: str,
+        doc_id: str,
+        content_hash: str,
+        content: str,
+        error: str,
+        guardrail_feedback: list[str] | None = None,
+    ) -> None:
+        """
+        Stores a failed document, or records one more failed attempt of an existing dead letter.
+
+        Args:
+            collection_name (str): The collection the document was ingested into.
+            doc_id (str): The document ID.
+            content_hash (str): Hash of the normalized document content.
+            content (str): The document text.
+            error (str): The extraction error.
+            guardrail_feedback (list[str], optional): Feedback of the guardrails that rejected the outputs.
+        """
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT INTO dead_letters VALUES (?, ?, ?, ?, ?, ?, 1, ?, ?) "
+                "ON CONFLICT (collection_name, doc_id) DO UPDATE SET content_hash = excluded.content_hash, "
+                "content = excluded.content, error = excluded.error, "
+                "guardrail_feedback = excluded.guardrail_feedback, attempts = attempts + 1, "
+                "updated_at = excluded.updated_at",
+                (collection_name, doc_id, content_hash, content, error, json.dumps(guardrail_feedback or []), now, now),
+            )
+
+    def dead_letters(self, collection_name: str, max_attempts: int | None = None) -> list[DeadLetter]:
+        """
+        Lists the dead letters of a collection, oldest first.
+
+        Args:
+            collection_name (str): The collection.
+            max_attempts (int, optional): Only return documents that failed fewer times than this.
+
+        Returns:
+            list[DeadLetter]: The failed documents.
+        """
+        query = "SELECT * FROM dead_letters WHERE collection_name = ?"
+        params: list = [collection_name]
+        if max_attempts is not None:
+            query += " AND attempts < ?"
+            params.append(max_attempts)
+
+        with closing(self._connect()) as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(query + " ORDER BY created_at", params).fetchall()
+        return [
+            DeadLetter(**{**dict(row), "guardrail_feedback": json.loads(row["guardrail_feedback"])}) for row in rows
+        ]
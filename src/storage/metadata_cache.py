@@ -0,0 +1,124 @@
+"""
+Metadata Extraction Cache Module.
+
+This module provides a persistent cache of validated `CVMetadata` and
+`JobMetadata` outputs, shared by the flow's `extract_metadata` step and the
+ChromaDB ingestion. Entries are keyed by the hash of the normalized document,
+the extractor crew type and the version stamp of that crew (its YAML prompts,
+schemas, enums and guardrails, and the configured LLM models), so editing any
+of them or switching models invalidates the stored metadata automatically. The
+fused classify-and-extract crew keeps its outputs under its own crew type and
+version.
+"""
+
+import json
+import sqlite3
+import time
+from contextlib import closing
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from src.config.paths import CREWS_DIR, METADATA_CACHE_PATH
+from src.llm.llm_config import CONFIGURED_MODELS
+from src.utils.hashing import content_hash, files_fingerprint
+
+METADATA_CREW_DIR = CREWS_DIR / "metadata_extraction_crew"
+
+# Crew directories whose files shape the output of each crew type (the metadata extraction crew by default)
+CREW_TYPE_DIRS: dict[str, tuple[Path, ...]] = {
+    # The fused guardrail reuses the metadata extraction guardrails
+    "FusedExtractionCrew": (CREWS_DIR / "fused_extraction_crew", METADATA_CREW_DIR),
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS extracted_metadata (
+    content_hash TEXT NOT NULL,
+    crew_type TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (content_hash, crew_type, prompt_version)
+);
+"""
+
+
+@lru_cache
+def extractor_version(crew_type: str) -> str:
+    """
+    Returns the version stamp of an extractor crew.
+
+    Args:
+        crew_type (str): Name of the extractor crew class (e.g., 'CVMetadataExtractorCrew').
+
+    Returns:
+        str: A short fingerprint of the crew's YAML configuration and Python modules and of the LLM models.
+    """
+    crew_dirs = CREW_TYPE_DIRS.get(crew_type, (METADATA_CREW_DIR,))
+    return files_fingerprint(
+        (path for crew_dir in crew_dirs for pattern in ("config/*.yaml", "*.py") for path in crew_dir.glob(pattern)),
+        extra=CONFIGURED_MODELS,
+    )
+
+
+class MetadataCache:
+    """
+    SQLite-backed cache of validated metadata extractions.
+
+    Each operation opens its own short-lived connection, so a single cache
+    instance can be shared across threads and concurrent flows.
+
+    Attributes:
+        path (Path): Location of the SQLite database.
+    """
+
+    def __init__(self, path: Path = METADATA_CACHE_PATH) -> None:
+        """
+        Initializes the cache and creates its schema if needed.
+
+        Args:
+            path (Path): Location of the SQLite database.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Opens a new connection to the cache database."""
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get(self, content: str, crew_type: str) -> dict[str, Any] | None:
+        """
+        Looks up the metadata extracted from a document.
+
+        Args:
+            content (str): The raw document text.
+            crew_type (str): Name of the extractor crew class (e.g., 'CVMetadataExtractorCrew').
+
+        Returns:
+            dict[str, Any] | None: The validated metadata, or None if it was never extracted
+                with the current extractor version.
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT metadata FROM extracted_metadata "
+                "WHERE content_hash = ? AND crew_type = ? AND prompt_version = ?",
+                (content_hash(content), crew_type, extractor_version(crew_type)),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, content: str, crew_type: str, metadata: dict[str, Any]) -> None:
+        """
+        Stores the validated metadata extracted from a document.
+
+        Args:
+            content (str): The raw document text.
+            crew_type (str): Name of the extractor crew class.
+            metadata (dict[str, Any]): The validated metadata JSON.
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO extracted_metadata VALUES (?, ?, ?, ?, ?)",
+                (content_hash(content), crew_type, extractor_version(crew_type), json.dumps(metadata), time.time()),
+            )
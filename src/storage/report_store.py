@@ -0,0 +1,217 @@
+"""
+Report Store Module.
+
+This module persists the rendered report of every flow run, keyed by run id,
+so concurrent flows never overwrite each other's output. Reports are written
+atomically (temporary file plus rename) under a date-partitioned directory,
+optionally gzip-compressed, and indexed in SQLite by run id, document hash,
+document type and creation date, so past reports can be listed and fetched
+without scanning the directory.
+"""
+
+import asyncio
+import gzip
+import os
+import sqlite3
+import tempfile
+from contextlib import closing
+from datetime import UTC, datetime
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from src.config.paths import REPORTS_DIR
+from src.utils.hashing import content_hash
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    run_id TEXT PRIMARY KEY,
+    doc_hash TEXT NOT NULL,
+    input_type TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    path TEXT NOT NULL,
+    compressed INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_reports_doc_hash ON reports (doc_hash);
+CREATE INDEX IF NOT EXISTS idx_reports_type_date ON reports (input_type, created_at);
+"""
+
+
+class ReportRecord(BaseModel):
+    """
+    Index entry of a stored report.
+
+    Attributes:
+        run_id (str): The flow run that produced the report.
+        doc_hash (str): Content hash of the evaluated document.
+        input_type (str): The document type (cv, job or other).
+        created_at (datetime): When the report was stored (UTC).
+        path (str): Location of the report, relative to the store root.
+        compressed (bool): Whether the file is gzip-compressed.
+        size (int): Size of the stored file in bytes.
+    """
+
+    run_id: str
+    doc_hash: str
+    input_type: str
+    created_at: datetime
+    path: str
+    compressed: bool
+    size: int
+
+
+class ReportStore:
+    """
+    Run-keyed, indexed store of Markdown reports.
+
+    Each operation opens its own short-lived SQLite connection, so a single
+    store can be shared across threads and concurrent flows.
+
+    Attributes:
+        root (Path): Directory holding the reports and the index.
+        compress (bool): Whether new reports are gzip-compressed.
+    """
+
+    def __init__(self, root: Path = REPORTS_DIR, compress: bool = False) -> None:
+        """
+        Initializes the store and creates its index if needed.
+
+        Args:
+            root (Path): Directory holding the reports and the index.
+            compress (bool): If True, store new reports as `.md.gz` files.
+        """
+        self.root = Path(root)
+        self.compress = compress
+        self.root.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Opens a new connection to the index database."""
+        return sqlite3.connect(self.root / "index.sqlite3", timeout=30)
+
+    def save(self, run_id: str, report: str, raw_input: str, input_type: str) -> ReportRecord:
+        """
+        Atomically writes a report and indexes it.
+
+        Saving again under the same run id (e.g., a resumed run) replaces the report.
+
+        Args:
+            run_id (str): The flow run id.
+            report (str): The rendered Markdown report.
+            raw_input (str): The evaluated document, used to compute its hash.
+            input_type (str): The document type.
+
+        Returns:
+            ReportRecord: The index entry of the stored report.
+        """
+        created_at = datetime.now(UTC)
+        suffix = ".md.gz" if self.compress else ".md"
+        relative_path = Path(created_at.strftime("%Y/%m/%d")) / f"{run_id}{suffix}"
+        data = report.encode("utf-8")
+        if self.compress:
+            data = gzip.compress(data)
+
+        target = self.root / relative_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # Readers never see a partially written file: the rename is atomic
+        fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix=f".{run_id}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, target)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        record = ReportRecord(
+            run_id=run_id,
+            doc_hash=content_hash(raw_input),
+            input_type=str(input_type),
+            created_at=created_at,
+            path=relative_path.as_posix(),
+            compressed=self.compress,
+            size=len(data),
+        )
+        with closing(self._connect()) as conn, conn:
+            previous = conn.execute("SELECT path FROM reports WHERE run_id = ?", (run_id,)).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO reports VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    record.run_id,
+                    record.doc_hash,
+                    record.input_type,
+                    record.created_at.isoformat(),
+                    record.path,
+                    int(record.compressed),
+                    record.size,
+                ),
+            )
+        if previous and previous[0] != record.path:
+            (self.root / previous[0]).unlink(missing_ok=True)
+        return record
+
+    async def asave(self, run_id: str, report: str, raw_input: str, input_type: str) -> ReportRecord:
+        """Runs `save` in a worker thread, so the event loop is not blocked by the file and index writes."""
+        return await asyncio.to_thread(self.save, run_id, report, raw_input, input_type)
+
+    def get(self, run_id: str) -> str | None:
+        """
+        Fetches the report of a run.
+
+        Args:
+            run_id (str): The flow run id.
+
+        Returns:
+            str | None: The Markdown report, or None if the run has no stored report.
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT path, compressed FROM reports WHERE run_id = ?", (run_id,)).fetchone()
+        if row is None:
+            return None
+
+        data = (self.root / row[0]).read_bytes()
+        return (gzip.decompress(data) if row[1] else data).decode("utf-8")
+
+    def list(
+        self,
+        doc_hash: str | None = None,
+        input_type: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int = 100,
+    ) -> list[ReportRecord]:
+        """
+        Lists stored reports from the index, most recent first.
+
+        Args:
+            doc_hash (str, optional): Only reports of this document (see `content_hash`).
+            input_type (str, optional): Only reports of this document type.
+            since (datetime, optional): Only reports created at or after this time (UTC).
+            until (datetime, optional): Only reports created before this time (UTC).
+            limit (int): Maximum number of records returned.
+
+        Returns:
+            list[ReportRecord]: The matching index entries.
+        """
+        clauses, params = [], []
+        for clause, value in (
+            ("doc_hash = ?", doc_hash),
+            ("input_type = ?", str(input_type) if input_type else None),
+            ("created_at >= ?", since.isoformat() if since else None),
+            ("created_at < ?", until.isoformat() if until else None),
+        ):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f"SELECT * FROM reports {where} ORDER BY created_at DESC LIMIT ?",
+                (*params, limit),
+            ).fetchall()
+
+        fields = list(ReportRecord.model_fields)
+        return [ReportRecord(**dict(zip(fields, row, strict=True))) for row in rows]
@@ -0,0 +1,199 @@
+"""
+Batch Evaluation Entry Point.
+
+This module exposes a command line interface around
+`TalentSelectionFlow.evaluate_many`. It loads every supported document found
+in the given paths (PDF, Markdown or plain text), evaluates them with bounded
+concurrency and streams one JSON line per document to the output file as soon
+as its flow finishes.
+
+Usage:
+    python -m src.talent_selection_flow.batch data/uploads --output data/reports/batch.jsonl --concurrency 8
+"""
+
+import argparse
+import asyncio
+from collections.abc import Callable, Iterator
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+import pymupdf4llm
+
+from src.constants import (
+    BATCH_MAX_CONCURRENCY,
+    GUARDRAIL_MAX_RETRIES,
+    INPUT_TOKEN_BUDGET,
+    LOCAL_CLASSIFIER_THRESHOLD,
+    QUERY_MIN_SIMILARITY,
+    QUERY_TOP_K,
+    SKILL_MATCHING_MODE,
+)
+from src.skills.matcher import SkillMatchingMode
+from src.talent_selection_flow.flow import TalentSelectionFlow
+from src.utils.logger import logger
+from src.utils.metrics import serve_metrics
+
+SUPPORTED_SUFFIXES = {".pdf", ".md", ".txt"}
+
+
+def load_document(file: Path) -> str:
+    """
+    Loads a document as text (blocking).
+
+    PDFs are converted to Markdown with `pymupdf4llm`, other supported files
+    are read as UTF-8 text.
+
+    Args:
+        file (Path): The document file.
+
+    Returns:
+        str: The document text.
+    """
+    if file.suffix.lower() == ".pdf":
+        return pymupdf4llm.to_markdown(str(file))
+    return file.read_text(encoding="utf-8")
+
+
+def iter_documents(paths: list[Path]) -> Iterator[tuple[str, Callable[[], str]]]:
+    """
+    Lazily lists the supported documents of files and directories.
+
+    Directories are scanned recursively. Files are not read here: each one comes
+    with a loader that `evaluate_many` runs in a worker thread, so converting PDFs
+    does not block the event loop, and an unreadable file only fails its own result.
+
+    Args:
+        paths (list[Path]): Files or directories to load.
+
+    Yields:
+        tuple[str, Callable[[], str]]: `(doc_id, loader)` pairs, where `doc_id` is the file path.
+    """
+    for path in paths:
+        files = sorted(path.rglob("*")) if path.is_dir() else [path]
+        for file in files:
+            if file.suffix.lower() in SUPPORTED_SUFFIXES:
+                yield str(file), partial(load_document, file)
+
+
+async def run_batch(
+    paths: list[Path],
+    output: Path,
+    max_concurrency: int = BATCH_MAX_CONCURRENCY,
+    guardrail_max_retries: int = GUARDRAIL_MAX_RETRIES,
+    verbose: bool = False,
+    **flow_kwargs: Any,
+) -> None:
+    """
+    Evaluates all documents under `paths` and streams the results to `output`.
+
+    Args:
+        paths (list[Path]): Files or directories containing the documents.
+        output (Path): JSONL file receiving one `BatchResult` per line.
+        max_concurrency (int): Maximum number of flows running at the same time.
+        guardrail_max_retries (int): Retries for agentic guardrails.
+        verbose (bool): Enable/disable detailed logging.
+        **flow_kwargs: Additional options forwarded to every flow.
+    """
+    output.parent.mkdir(parents=True, exist_ok=True)
+    succeeded = failed = 0
+
+    with output.open("w", encoding="utf-8") as f:
+        async for result in TalentSelectionFlow.evaluate_many(
+            iter_documents(paths),
+            max_concurrency=max_concurrency,
+            guardrail_max_retries=guardrail_max_retries,
+            verbose=verbose,
+            **flow_kwargs,
+        ):
+            f.write(result.model_dump_json() + "\n")
+            f.flush()
+
+            if result.error:
+                failed += 1
+                logger.warning(f"[{succeeded + failed}] `{result.doc_id}` failed: {result.error}")
+            else:
+                succeeded += 1
+                logger.info(f"[{succeeded + failed}] `{result.doc_id}` evaluated in {result.elapsed_seconds}s")
+
+    logger.info(f"Batch finished: {succeeded} succeeded, {failed} failed. Results written to `{output}`.")
+
+
+def main() -> None:
+    """Parses the command line arguments and runs the batch evaluation."""
+    parser = argparse.ArgumentParser(description="Evaluate a batch of CVs or job descriptions.")
+    parser.add_argument("paths", type=Path, nargs="+", help="Files or directories with PDF/Markdown/text documents.")
+    parser.add_argument("--output", type=Path, required=True, help="Destination JSONL file for the results.")
+    parser.add_argument("--concurrency", type=int, default=BATCH_MAX_CONCURRENCY, help="Maximum flows in flight.")
+    parser.add_argument("--guardrail-max-retries", type=int, default=GUARDRAIL_MAX_RETRIES)
+    parser.add_argument("--verbose", action="store_true")
+    parser.add_argument("--fused-extraction", action="store_true", help="Classify and extract in one LLM call.")
+    parser.add_argument("--speculative-extraction", action="store_true", help="Extract alongside classification.")
+    parser.add_argument("--per-document-analysis", action="store_true", help="Analyse each match in its own crew.")
+    parser.add_argument("--top-k", type=int, default=QUERY_TOP_K, help="Related documents retrieved per input.")
+    parser.add_argument(
+        "--min-similarity",
+        type=float,
+        default=QUERY_MIN_SIMILARITY,
+        help="Matches below this similarity are not analysed. By default, the top-k matches are all analysed.",
+    )
+    parser.add_argument(
+        "--max-similarity-gap",
+        type=float,
+        default=None,
+        help="Drop the matches after the first similarity drop larger than this gap (adaptive cutoff).",
+    )
+    parser.add_argument(
+        "--skill-matching",
+        choices=list(SkillMatchingMode),
+        default=SKILL_MATCHING_MODE,
+        help="Use of the local skill matcher: LLM refines it, replaces the gap analysis LLM (fast), or off.",
+    )
+    parser.add_argument(
+        "--input-token-budget",
+        type=int,
+        default=INPUT_TOKEN_BUDGET,
+        help="Truncate documents to this many tokens in the classification and extraction prompts (default: never).",
+    )
+    parser.add_argument("--no-compaction", action="store_true", help="Pass documents to the crews verbatim.")
+    parser.add_argument("--no-result-cache", action="store_true", help="Re-run documents evaluated before.")
+    parser.add_argument("--no-metadata-cache", action="store_true", help="Re-extract metadata seen before.")
+    parser.add_argument("--compress-reports", action="store_true", help="Gzip the stored reports.")
+    parser.add_argument("--metrics-port", type=int, default=None, help="Serve Prometheus metrics on this port.")
+    parser.add_argument(
+        "--local-classifier-threshold",
+        type=float,
+        default=LOCAL_CLASSIFIER_THRESHOLD,
+        help="Confidence above which the LLM classification is skipped. By default, the LLM always classifies.",
+    )
+    args = parser.parse_args()
+
+    if args.metrics_port is not None:
+        serve_metrics(args.metrics_port)
+
+    asyncio.run(
+        run_batch(
+            paths=args.paths,
+            output=args.output,
+            max_concurrency=args.concurrency,
+            guardrail_max_retries=args.guardrail_max_retries,
+            verbose=args.verbose,
+            fused_extraction=args.fused_extraction,
+            speculative_extraction=args.speculative_extraction,
+            per_document_analysis=args.per_document_analysis,
+            top_k=args.top_k,
+            min_similarity=args.min_similarity,
+            max_similarity_gap=args.max_similarity_gap,
+            skill_matching=args.skill_matching,
+            compact_inputs=not args.no_compaction,
+            input_token_budget=args.input_token_budget,
+            use_result_cache=not args.no_result_cache,
+            use_metadata_cache=not args.no_metadata_cache,
+            compress_reports=args.compress_reports,
+            local_classifier_threshold=args.local_classifier_threshold,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
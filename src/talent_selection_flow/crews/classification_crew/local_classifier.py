@@ -0,0 +1,99 @@
+"""
+Local Document Classifier.
+
+This module provides a fast, deterministic alternative to the ClassificationCrew.
+It scores a document against weighted keyword and heading features typical of
+CVs and job postings and turns the score difference into a confidence. The
+features only describe real-world documents: placeholders and headings added by
+the bundled corpora or their processing are left out, so they do not inflate
+the confidence measured on those corpora. The flow only falls back to the LLM
+crew when the confidence is below a configurable threshold.
+"""
+
+import math
+import re
+
+from src.talent_selection_flow.crews.classification_crew.enums import DocumentType
+
+
+def _heading(words: str) -> str:
+    """Builds a pattern matching a Markdown and/or bold (e.g., '# **Skills**') or plain line starting with `words`."""
+    return rf"^\s*(?:#+\s*)?(?:\*\*)?(?:{words})\b"
+
+
+# Weighted features, each counted at most once per document
+CV_FEATURES: dict[str, float] = {
+    r"\bcurriculum vitae\b": 3.0,
+    r"\b(?:resume|résumé)\b": 1.0,
+    _heading(r"(?:professional |career )?(?:summary|profile|objective)"): 1.5,
+    _heading(r"(?:work |professional )?experience|employment history|work history"): 1.5,
+    _heading(r"education(?: and training)?"): 1.5,
+    _heading(r"(?:technical |core )?skills|qualifications summary"): 1.0,
+    _heading(r"certifications?|languages|references|accomplishments|highlights|interests"): 1.0,
+    r"\b(?:19|20)\d\d\s*(?:-|–|to)\s*(?:present|current|(?:19|20)\d\d)\b": 1.0,
+    r"linkedin\.com/in/": 1.0,
+    r"\b(?:i am|i have|my (?:experience|skills|role))\b": 0.5,
+}
+
+JOB_FEATURES: dict[str, float] = {
+    r"\bjob (?:posting|description|title|summary)\b": 3.0,
+    _heading(r"about (?:us|the company|the role)"): 2.0,
+    _heading(r"(?:key )?responsibilities|what you(?:'ll| will) do|position overview"): 2.0,
+    _heading(r"(?:technical )?requirements|qualifications|what we(?:'re| are) looking for"): 1.5,
+    _heading(r"benefits|what we offer|perks"): 2.0,
+    r"\bwe are (?:seeking|looking for|hiring)\b": 2.0,
+    r"\b(?:the ideal candidate|you will|you'll|join our)\b": 1.5,
+    r"\b(?:apply now|applicants?|equal opportunity employer)\b": 1.5,
+    r"\b(?:salary|compensation)\b": 1.0,
+}
+
+_CV_PATTERNS = [(re.compile(p, re.IGNORECASE | re.MULTILINE), w) for p, w in CV_FEATURES.items()]
+_JOB_PATTERNS = [(re.compile(p, re.IGNORECASE | re.MULTILINE), w) for p, w in JOB_FEATURES.items()]
+
+SCORE_SCALE = 0.8
+"""float: Slope of the logistic function applied to the job-vs-cv score difference."""
+
+EVIDENCE_SATURATION = 4.0
+"""float: Total feature weight above which the evidence is considered complete."""
+
+
+def score_document(text: str) -> tuple[float, float]:
+    """
+    Computes the total weight of CV and job features present in a document.
+
+    Args:
+        text (str): The raw document text.
+
+    Returns:
+        tuple[float, float]: The CV score and the job score.
+    """
+    cv_score = sum(w for pattern, w in _CV_PATTERNS if pattern.search(text))
+    job_score = sum(w for pattern, w in _JOB_PATTERNS if pattern.search(text))
+    return cv_score, job_score
+
+
+def classify_locally(text: str) -> tuple[DocumentType, float]:
+    """
+    Classifies a document as CV or job description without calling an LLM.
+
+    The probability of each class is the logistic of the scaled score
+    difference. It is then discounted when little evidence was found, so
+    short or unusual documents get a low confidence and fall back to the LLM.
+    Documents without any feature are reported as OTHER with zero confidence:
+    the local classifier never rejects an input on its own.
+
+    Args:
+        text (str): The raw document text.
+
+    Returns:
+        tuple[DocumentType, float]: The predicted document type and its confidence in [0, 1].
+    """
+    cv_score, job_score = score_document(text)
+    evidence = cv_score + job_score
+    if evidence == 0:
+        return DocumentType.OTHER, 0.0
+
+    p_job = 1 / (1 + math.exp(-SCORE_SCALE * (job_score - cv_score)))
+    document_type = DocumentType.JOB if p_job >= 0.5 else DocumentType.CV
+    confidence = max(p_job, 1 - p_job) * min(1.0, evidence / EVIDENCE_SATURATION)
+    return document_type, round(confidence, 4)
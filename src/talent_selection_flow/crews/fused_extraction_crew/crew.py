@@ -0,0 +1,87 @@
+# type: ignore
+"""
+Fused Classification and Extraction Crew.
+
+This module defines the FusedExtractionCrew, an optional replacement for the
+ClassificationCrew + MetadataExtractorCrew pair. It returns the document type
+and the matching metadata in one structured response, saving one full LLM
+round trip over the same raw input.
+"""
+
+from crewai import Agent, Crew, Task
+from crewai.project import CrewBase, agent, crew, task
+
+from src.constants import GUARDRAIL_MAX_RETRIES
+from src.llm.llm_config import openrouter_llm
+from src.talent_selection_flow.crews.fused_extraction_crew.guardrails import validate_fused_extraction_output
+from src.talent_selection_flow.crews.fused_extraction_crew.schemas import FusedExtractionOutput
+
+
+@CrewBase
+class FusedExtractionCrew:
+    """
+    Orchestrates classification and metadata extraction in a single task.
+
+    The output is validated by a guardrail that reuses the CV and Job
+    metadata guardrails, so the extracted fields follow the same rules as
+    the two-call path.
+
+    Attributes:
+        agents_config (str): Path to the YAML file defining the agent.
+        tasks_config (str): Path to the YAML file defining the fused task.
+        _guardrail_max_retries (int): Attempts for the LLM to fix schema errors.
+        _verbose (bool): Whether to output execution logs to the console.
+    """
+
+    agents_config = "config/agents.yaml"
+    tasks_config = "config/tasks.yaml"
+
+    def __init__(
+        self,
+        guardrail_max_retries: int = GUARDRAIL_MAX_RETRIES,
+        verbose: bool = False,
+    ) -> None:
+        """
+        Initializes the FusedExtractionCrew with runtime configurations.
+
+        Args:
+            guardrail_max_retries (int): Maximum attempts for the guardrail loop.
+            verbose (bool): Enable or disable detailed logging.
+        """
+        self._guardrail_max_retries = guardrail_max_retries
+        self._verbose = verbose
+
+    @agent
+    def classifier_extractor_agent(self) -> Agent:
+        """
+        Agent: Document Classifier and Metadata Extractor.
+        Uses the 'classifier_extractor_agent' configuration from YAML.
+        """
+        return Agent(
+            config=self.agents_config["classifier_extractor_agent"],
+            llm=openrouter_llm,
+        )
+
+    @task
+    def classify_and_extract_task(self) -> Task:
+        """
+        Task: Classify the document and map it to CVMetadata or JobMetadata.
+        Uses 'validate_fused_extraction_output' as guardrail.
+        """
+        return Task(
+            config=self.tasks_config["classify_and_extract_task"],
+            agent=self.classifier_extractor_agent(),
+            guardrail=validate_fused_extraction_output,
+            guardrail_max_retries=self._guardrail_max_retries,
+            output_json=FusedExtractionOutput,
+        )
+
+    @crew
+    def crew(self) -> Crew:
+        """Assembles the fused classification and extraction crew."""
+        return Crew(
+            name="Fused classification and extraction crew",
+            agents=[self.classifier_extractor_agent()],
+            tasks=[self.classify_and_extract_task()],
+            verbose=self._verbose,
+        )
@@ -0,0 +1,64 @@
+"""
+Fused Extraction Guardrail Module.
+
+This module validates the single structured response of the FusedExtractionCrew.
+The document type is checked against the DocumentType enum and the nested
+metadata is delegated to the existing CV/Job metadata guardrails, so both
+paths of the flow enforce exactly the same rules.
+"""
+
+import json
+from typing import Any
+
+from crewai import TaskOutput
+
+from src.talent_selection_flow.crews.classification_crew.enums import DocumentType
+from src.talent_selection_flow.crews.metadata_extraction_crew.guardrails import (
+    validate_cvmetadata_schema,
+    validate_jobmetadata_schema,
+)
+from src.utils.logger import logger
+
+
+def validate_fused_extraction_output(result: TaskOutput) -> tuple[bool, Any]:
+    """
+    Validates the JSON format, document type and metadata of a fused extraction.
+
+    Parameters
+    ----------
+    result : TaskOutput
+        The raw output from the fused classification and extraction agent.
+
+    Returns
+    -------
+    tuple[bool, Any]
+        (True, sanitized_json_string) if valid; (False, error_feedback) otherwise.
+    """
+    logger.debug(f"Guardrail input:\n{result.raw}")
+    # 1. Validate JSON
+    try:
+        data = json.loads(result.raw)
+    except json.JSONDecodeError:
+        logger.warning("Guardrail `validate_fused_extraction_output` triggered: invalid JSON format")
+        return (False, "Invalid JSON format. Please fix")
+
+    # 2. Validate document type
+    document_type = str(data.get("document_type", "")).strip().strip(".\"'`").lower()
+    if document_type not in DocumentType._value2member_map_:
+        logger.warning("Guardrail `validate_fused_extraction_output` triggered: invalid document_type")
+        return (False, f"Invalid document_type. Must be one of {'/'.join(DocumentType)}")
+
+    if document_type == DocumentType.OTHER:
+        return (True, json.dumps({"document_type": document_type, "metadata": None}))
+
+    # 3. Validate metadata with the guardrail of the matching extractor crew
+    if not isinstance(data.get("metadata"), dict):
+        logger.warning("Guardrail `validate_fused_extraction_output` triggered: missing metadata")
+        return (False, f"Missing or invalid 'metadata' object for document_type '{document_type}'")
+
+    metadata_guardrail = validate_cvmetadata_schema if document_type == DocumentType.CV else validate_jobmetadata_schema
+    is_valid, metadata = metadata_guardrail(result.model_copy(update={"raw": json.dumps(data["metadata"])}))
+    if not is_valid:
+        return (False, metadata)
+
+    return (True, json.dumps({"document_type": document_type, "metadata": json.loads(metadata)}))
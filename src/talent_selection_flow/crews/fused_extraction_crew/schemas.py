@@ -0,0 +1,26 @@
+"""
+Fused Extraction Schemas.
+
+This module defines the output structure of the FusedExtractionCrew, which
+classifies a document and extracts its metadata in a single LLM response.
+"""
+
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from src.talent_selection_flow.crews.classification_crew.enums import DocumentType
+
+
+class FusedExtractionOutput(BaseModel):
+    """
+    Combined classification and metadata extraction result.
+
+    Attributes:
+        document_type (DocumentType): The categorical classification of the input.
+        metadata (dict[str, Any] | None): The extracted CVMetadata or JobMetadata
+            fields matching `document_type`, or None for unsupported documents.
+    """
+
+    document_type: DocumentType = Field(description="Classification of the document.")
+    metadata: dict[str, Any] | None = Field(description="CV or Job metadata matching the document type.")
@@ -26,6 +26,7 @@ class HRConsultingCrew:
         agents_config (str): Path to the YAML file defining the HR Consultant agent.
         tasks_config (str): Path to the YAML file defining the consulting task.
         _verbose (bool): Whether to log internal agent thought processes.
+        _stream (bool): Whether the crew streams the LLM tokens of its answer.
     """
 
     agents_config = "config/agents.yaml"
@@ -34,14 +35,17 @@ class HRConsultingCrew:
     def __init__(
         self,
         verbose: bool = False,
+        stream: bool = False,
     ) -> None:
         """
         Initializes the HRConsultingCrew.
 
         Args:
             verbose (bool): Enables detailed output of agent reasoning steps.
+            stream (bool): If True, `akickoff` returns a stream of chunks instead of the output.
         """
         self._verbose = verbose
+        self._stream = stream
 
     @agent
     def consultant_agent(self) -> Agent:
@@ -90,4 +94,5 @@ class HRConsultingCrew:
             agents=[self.consultant_agent()],
             tasks=[self.consulting_task()],
             verbose=self._verbose,
+            stream=self._stream,
         )
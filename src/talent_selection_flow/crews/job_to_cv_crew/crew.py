@@ -105,6 +105,23 @@ class JobToCVCrew:
             output_json=InterviewQuestionsOutput,
         )
 
+    @task
+    def generate_interview_questions_from_gaps_task(self) -> Task:
+        """
+        Task: Generate interview questions from a precomputed gap analysis.
+        Standalone variant of 'generate_interview_questions_task' that reads the
+        gap analysis from the '{gap_analysis}' input instead of task context.
+        """
+        task_config = self.tasks_config["generate_interview_questions_from_gaps_task"]
+        return Task(
+            description=task_config["description"],
+            expected_output=task_config["expected_output"],
+            agent=self.interview_question_generator_agent(),
+            guardrail=validate_interviewquestionsoutput_schema,
+            guardrail_max_retries=self._guardrail_max_retries,
+            output_json=InterviewQuestionsOutput,
+        )
+
     @crew
     def crew(self) -> Crew:
         """
@@ -123,3 +140,28 @@ class JobToCVCrew:
             process=Process.sequential,
             verbose=self._verbose,
         )
+
+    def gap_analysis_crew(self) -> Crew:
+        """
+        Assembles a crew running only the gap analysis stage.
+        Used by the per-document pipeline, so a document's questions can start
+        as soon as its own gap analysis passes validation.
+        """
+        return Crew(
+            name="Job to CV gap analysis crew",
+            agents=[self.gap_identifier_agent()],
+            tasks=[self.identify_gaps_task()],
+            verbose=self._verbose,
+        )
+
+    def interview_questions_crew(self) -> Crew:
+        """
+        Assembles a crew running only the interview question stage.
+        Expects the validated gap analysis as the 'gap_analysis' input.
+        """
+        return Crew(
+            name="Job to CV interview questions crew",
+            agents=[self.interview_question_generator_agent()],
+            tasks=[self.generate_interview_questions_from_gaps_task()],
+            verbose=self._verbose,
+        )
@@ -0,0 +1,92 @@
+"""
+Crew Pool Module.
+
+Building a CrewBase crew parses its agents/tasks YAML, maps the config
+variables and creates new Agent, Task and Crew objects. This module keeps a
+process-wide pool of ready-to-run crews instead: each crew configuration is
+built from its YAML once, and leases hand out an idle crew (or a copy of the
+prebuilt one when every crew is busy). A crew is only used by one kickoff at
+a time, so concurrent flows never share agent or task state.
+"""
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from crewai import Crew
+
+PoolKey = tuple[type, str, tuple[tuple[str, Any], ...]]
+
+
+class CrewPool:
+    """
+    Thread-safe pool of reusable crews, keyed by crew class, factory and options.
+
+    Attributes:
+        built (int): Number of crews assembled from their CrewBase class (YAML parsed).
+        copied (int): Number of crews cloned from a prebuilt one.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty pool."""
+        self._lock = threading.Lock()
+        self._templates: dict[PoolKey, Crew] = {}
+        self._idle: dict[PoolKey, list[Crew]] = {}
+        self.built = 0
+        self.copied = 0
+
+    @contextmanager
+    def lease(self, crew_cls: type, factory: str = "crew", **options: Any) -> Iterator[Crew]:
+        """
+        Hands out a crew for exclusive use until the block exits.
+
+        Args:
+            crew_cls (type): The CrewBase class (e.g., ClassificationCrew).
+            factory (str): The method assembling the crew (e.g., 'crew' or 'gap_analysis_crew').
+            **options: Keyword arguments of the crew class (e.g., `verbose`, `guardrail_max_retries`).
+
+        Yields:
+            Crew: A crew that no other lease is using.
+        """
+        key = (crew_cls, factory, tuple(sorted(options.items())))
+        crew = self._acquire(key)
+        try:
+            yield crew
+        finally:
+            with self._lock:
+                self._idle[key].append(crew)
+
+    def _acquire(self, key: PoolKey) -> Crew:
+        """Pops an idle crew for `key`, or builds one if none is available."""
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if idle:
+                return idle.pop()
+            template = self._templates.get(key)
+
+        # Assembling crews is slow, so it happens outside the lock
+        if template is None:
+            crew_cls, factory, options = key
+            crew = getattr(crew_cls(**dict(options)), factory)()
+            with self._lock:
+                self.built += 1
+                self._templates.setdefault(key, crew)
+            # The prebuilt crew is only ever copied, never leased
+            crew = crew.copy()
+        else:
+            crew = template.copy()
+
+        with self._lock:
+            self.copied += 1
+        return crew
+
+    def clear(self) -> None:
+        """Drops every prebuilt and idle crew, e.g., after editing the YAML configs."""
+        with self._lock:
+            self._templates.clear()
+            self._idle.clear()
+
+
+CREW_POOL = CrewPool()
+"""CrewPool: Process-wide pool shared by the flow and the Chainlit app."""
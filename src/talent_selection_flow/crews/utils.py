@@ -5,12 +5,190 @@ This module provides the logic to transform structured analysis data (JSON/Dicti
 into a formatted Markdown report. It supports two main perspectives:
 1. Job Analysis (evaluating multiple CVs for one job).
 2. CV Analysis (evaluating multiple jobs for one candidate).
+
+Each report section has its own renderer, so the flow can stream sections to
+the UI as soon as their data exists (summary after extraction, matches after
+the vector query, gaps and questions per document), while `render_to_markdown`
+assembles the complete report from the same sections.
 """
 
+from collections.abc import Iterator
 from datetime import datetime
 
 from src.talent_selection_flow.crews.classification_crew.enums import DocumentType
 
+# Perspective-specific wording of the report
+_PERSPECTIVES = {
+    DocumentType.JOB: {
+        "intro": "\nThis document provides a comprehensive evaluation of the job role against several targeted "
+        "candidates' cvs. The analysis was performed by an automated multi-agent system (CrewAI) that identifies "
+        "skill gaps, calculates role similarity, and generates tailored interview strategies to bridge the "
+        "identified technical voids.",
+        "summary_title": "## Job summary",
+        "summary_description": "*This section provides a high-level overview of the job role, extracting key "
+        "technical competencies, regional availability, and educational background to establish a baseline for "
+        "comparison.*",
+        "matches_title": "## Matched cvs summary",
+        "matches_description": "*A curated list of candidates' cvs that demonstrate high semantic alignment with the "
+        "job role. Each match includes a 'Similarity Score' (where 1.0 is a perfect match) and a summary of the "
+        "responsibilitiesthe candidate would undertake.*",
+        "doc_label": "CV ID",
+    },
+    DocumentType.CV: {
+        "intro": "\nThis document provides a comprehensive evaluation of the candidate against several targeted job "
+        "roles. The analysis was performed by an automated multi-agent system (CrewAI) that identifies skill gaps, "
+        "calculates role similarity, and generates tailored interview strategies to bridge the identified "
+        "technical voids.",
+        "summary_title": "## Candidate summary",
+        "summary_description": "*This section provides a high-level overview of the candidate's professional "
+        "profile, extracting key technical competencies, regional availability, and educational background to "
+        "establish a baseline for comparison.*",
+        "matches_title": "## Matched jobs summary",
+        "matches_description": "*A curated list of roles that demonstrate high semantic alignment with the "
+        "candidate's profile. Each match includes a 'Similarity Score' (where 1.0 is a perfect match) and a summary "
+        "of the responsibilities the candidate would undertake.*",
+        "doc_label": "Job ID",
+    },
+}
+
+GAPS_HEADER = "\n".join(
+    [
+        "## Gaps analysis",
+        "*An objective technical audit identifying the delta between the candidate's current skillset and the "
+        "job's mandatory requirements.*",
+    ]
+)
+
+QUESTIONS_HEADER = "\n".join(
+    [
+        "## Interview questions",
+        "*Strategic guidance for the hiring team. These questions are algorithmically generated to verify existing "
+        "strengths, probe the specific gaps identified in the previous section, and assess the candidate's "
+        "seniority through behavioral scenarios.*",
+    ]
+)
+
+
+def _label(key: str) -> str:
+    """Turns a snake_case field name into a report label."""
+    return key.replace("_", " ").capitalize()
+
+
+def render_summary(process_type: str, metadata_dict: dict) -> str:
+    """
+    Renders the report title, introduction and the summary of the input document.
+
+    Args:
+        process_type (str): The classification of the input (from DocumentType enum).
+        metadata_dict (dict): Structured metadata of the primary input document.
+
+    Returns:
+        str: The Markdown section.
+    """
+    texts = _PERSPECTIVES[process_type]
+    report = [
+        "# Recruitment Analysis Report",
+        f"*Date: {datetime.today().strftime('%Y-%m-%d')}*",
+        texts["intro"],
+        texts["summary_title"],
+        texts["summary_description"],
+    ]
+    for k, v in metadata_dict.items():
+        report.append(f"- **{_label(k)}**: {v}")
+    return "\n".join(report)
+
+
+def render_matches(process_type: str, related_docs: dict) -> str:
+    """
+    Renders the summary of the documents matched in ChromaDB.
+
+    Args:
+        process_type (str): The classification of the input (from DocumentType enum).
+        related_docs (dict): A dictionary of matching documents retrieved from ChromaDB.
+
+    Returns:
+        str: The Markdown section.
+    """
+    texts = _PERSPECTIVES[process_type]
+    report = [texts["matches_title"], texts["matches_description"]]
+    for k, v in related_docs.items():
+        report.append(f"### {v['title']} (ID: {k})")
+        for k2, v2 in v.items():
+            report.append(f"- **{_label(k2)}**: {v2}")
+    return "\n".join(report)
+
+
+def render_gap_analysis(process_type: str, doc_id: str, gaps: dict) -> str:
+    """
+    Renders the gap analysis of one related document.
+
+    Args:
+        process_type (str): The classification of the input (from DocumentType enum).
+        doc_id (str): The ChromaDB identifier of the related document.
+        gaps (dict): The document's gap analysis (list of skills per category).
+
+    Returns:
+        str: The Markdown section.
+    """
+    report = [f"### {_PERSPECTIVES[process_type]['doc_label']}: {doc_id}"]
+    for k, v in gaps.items():
+        report.append(f"- **{_label(k)}**: {', '.join(v)}")
+    return "\n".join(report)
+
+
+def render_interview_questions(process_type: str, doc_id: str, questions: dict) -> str:
+    """
+    Renders the interview questions generated for one related document.
+
+    Args:
+        process_type (str): The classification of the input (from DocumentType enum).
+        doc_id (str): The ChromaDB identifier of the related document.
+        questions (dict): The document's question/response pairs per category.
+
+    Returns:
+        str: The Markdown section.
+    """
+    report = [f"### {_PERSPECTIVES[process_type]['doc_label']}: {doc_id}"]
+    for k, v in questions.items():
+        report.append(f"- **{_label(k)}**:")
+        for i in v:
+            report.append(f"\n\t → Question: {i['question']}")
+            report.append(f"\n\t ✓ Response: {i['response']}")
+    return "\n".join(report)
+
+
+def iter_report_sections(
+    process_type: str,
+    metadata_dict: dict,
+    related_docs: dict,
+    gap_analysis_output: dict,
+    inverview_questions_output: dict,
+) -> Iterator[str]:
+    """
+    Yields the sections of the Recruitment Analysis Report in reading order.
+
+    Args:
+        process_type (str): The classification of the input (from DocumentType enum).
+        metadata_dict (dict): Structured metadata of the primary input document.
+        related_docs (dict): A dictionary of matching documents retrieved from ChromaDB.
+        gap_analysis_output (dict): JSON-structured gap analysis from the analysis crew.
+        inverview_questions_output (dict): JSON-structured questions from the analysis crew.
+
+    Yields:
+        str: The next Markdown section. Nothing is yielded for unsupported document types.
+    """
+    if process_type not in _PERSPECTIVES:
+        return
+
+    yield render_summary(process_type, metadata_dict)
+    yield render_matches(process_type, related_docs)
+    yield GAPS_HEADER
+    for k, v in gap_analysis_output["docs"].items():
+        yield render_gap_analysis(process_type, k, v)
+    yield QUESTIONS_HEADER
+    for k, v in inverview_questions_output["docs"].items():
+        yield render_interview_questions(process_type, k, v)
+
 
 def render_to_markdown(
     process_type: str,
@@ -37,114 +215,6 @@ def render_to_markdown(
     Returns:
         str: A complete, newline-joined Markdown string ready for export or display.
     """
-    if process_type == DocumentType.JOB:
-        report = [
-            "# Recruitment Analysis Report",
-            f"*Date: {datetime.today().strftime('%Y-%m-%d')}*",
-            "\nThis document provides a comprehensive evaluation of the job role against several targeted candidates' "
-            "cvs. The analysis was performed by an automated multi-agent system (CrewAI) that identifies skill gaps, "
-            "calculates role similarity, and generates tailored interview strategies to bridge the identified "
-            "technical voids.",
-            "## Job summary",
-            "*This section provides a high-level overview of the job role, extracting key technical "
-            "competencies, regional availability, and educational background to establish a baseline for comparison.*",
-        ]
-        # Add candidate info
-        for k, v in metadata_dict.items():
-            report.append(f"- **{k.replace('_', ' ').capitalize()}**: {v}")
-
-        # Add matched cvs summary
-        report.append("## Matched cvs summary")
-        report.append(
-            "*A curated list of candidates' cvs that demonstrate high semantic alignment with the job role. Each match "
-            "includes a 'Similarity Score' (where 1.0 is a perfect match) and a summary of the responsibilities"
-            "the candidate would undertake.*"
-        )
-        for k, v in related_docs.items():
-            report.append(f"### {v['title']} (ID: {k})")
-            for k2, v2 in v.items():
-                report.append(f"- **{k2.replace('_', ' ').capitalize()}**: {v2}")
-
-        # Add gaps analysis
-        report.append("## Gaps analysis")
-        report.append(
-            "*An objective technical audit identifying the delta between the candidate's current skillset and the "
-            "job's mandatory requirements.*"
-        )
-        for k, v in gap_analysis_output["docs"].items():
-            report.append(f"### CV ID: {k}")
-            for k2, v2 in v.items():
-                report.append(f"- **{k2.replace('_', ' ').capitalize()}**: {', '.join(v2)}")
-
-        # Add interview questions
-        report.append("## Interview questions")
-        report.append(
-            "*Strategic guidance for the hiring team. These questions are algorithmically generated to verify existing "
-            "strengths, probe the specific gaps identified in the previous section, and assess the candidate's "
-            "seniority through behavioral scenarios.*"
-        )
-        for k, v in inverview_questions_output["docs"].items():
-            report.append(f"### CV ID: {k}")
-            for k2, v2 in v.items():
-                report.append(f"- **{k2.replace('_', ' ').capitalize()}**:")
-                for i in v2:
-                    report.append(f"\n\t → Question: {i['question']}")
-                    report.append(f"\n\t ✓ Response: {i['response']}")
-
-    elif process_type == DocumentType.CV:
-        report = [
-            "# Recruitment Analysis Report",
-            f"*Date: {datetime.today().strftime('%Y-%m-%d')}*",
-            "\nThis document provides a comprehensive evaluation of the candidate against several targeted job roles. "
-            "The analysis was performed by an automated multi-agent system (CrewAI) that identifies skill gaps, "
-            "calculates role similarity, and generates tailored interview strategies to bridge the identified "
-            "technical voids.",
-            "## Candidate summary",
-            "*This section provides a high-level overview of the candidate's professional profile, extracting key "
-            "technical competencies, regional availability, and educational background to establish a baseline for "
-            "comparison.*",
-        ]
-        # Add candidate info
-        for k, v in metadata_dict.items():
-            report.append(f"- **{k.replace('_', ' ').capitalize()}**: {v}")
-
-        # Add matched jobs summary
-        report.append("## Matched jobs summary")
-        report.append(
-            "*A curated list of roles that demonstrate high semantic alignment with the candidate's profile. Each "
-            "match includes a 'Similarity Score' (where 1.0 is a perfect match) and a summary of the "
-            "responsibilities the candidate would undertake.*"
-        )
-        for k, v in related_docs.items():
-            report.append(f"### {v['title']} (ID: {k})")
-            for k2, v2 in v.items():
-                report.append(f"- **{k2.replace('_', ' ').capitalize()}**: {v2}")
-
-        # Add gaps analysis
-        report.append("## Gaps analysis")
-        report.append(
-            "*An objective technical audit identifying the delta between the candidate's current skillset and the "
-            "job's mandatory requirements.*"
-        )
-        for k, v in gap_analysis_output["docs"].items():
-            report.append(f"### Job ID: {k}")
-            for k2, v2 in v.items():
-                report.append(f"- **{k2.replace('_', ' ').capitalize()}**: {', '.join(v2)}")
-
-        # Add interview questions
-        report.append("## Interview questions")
-        report.append(
-            "*Strategic guidance for the hiring team. These questions are algorithmically generated to verify existing "
-            "strengths, probe the specific gaps identified in the previous section, and assess the candidate's "
-            "seniority through behavioral scenarios.*"
-        )
-        for k, v in inverview_questions_output["docs"].items():
-            report.append(f"### Job ID: {k}")
-            for k2, v2 in v.items():
-                report.append(f"- **{k2.replace('_', ' ').capitalize()}**:")
-                for i in v2:
-                    report.append(f"\n\t → Question: {i['question']}")
-                    report.append(f"\n\t ✓ Response: {i['response']}")
-    else:
-        report = []
-    return "\n".join(report)
+    return "\n".join(
+        iter_report_sections(process_type, metadata_dict, related_docs, gap_analysis_output, inverview_questions_output)
+    )
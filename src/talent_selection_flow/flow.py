@@ -8,18 +8,40 @@ classification, metadata extraction, vector database querying, and
 multi-agent analysis for both CV-to-Job and Job-to-CV scenarios.
 """
 
+import asyncio
+import functools
 import json
-from pathlib import Path
+import time
+from collections.abc import AsyncIterator, Callable, Iterable
 from typing import Any
 
 from crewai.flow.flow import Flow, listen, or_, router, start
+from crewai.flow.persistence import SQLiteFlowPersistence
+from crewai.flow.persistence.base import FlowPersistence
+from pydantic import BaseModel
 
-from src.config.paths import REPORT_OUTPUT_PATH
-from src.constants import GUARDRAIL_MAX_RETRIES
-from src.db_ingestion.chroma_client import query_to_collection
+from src.config.paths import CHROMA_DIR, FLOW_CHECKPOINTS_PATH
+from src.constants import (
+    BATCH_MAX_CONCURRENCY,
+    GUARDRAIL_MAX_RETRIES,
+    INPUT_TOKEN_BUDGET,
+    LOCAL_CLASSIFIER_THRESHOLD,
+    QUERY_MIN_SIMILARITY,
+    QUERY_TOP_K,
+    SKILL_MATCHING_MODE,
+)
+from src.db_ingestion.chroma_client import query_to_collection_async
+from src.llm.token_budget import compact_document, count_tokens, select_fields
+from src.skills.canonicalizer import SKILL_CANONICALIZER
+from src.skills.matcher import SkillIndex, SkillMatchingMode, match_skills
+from src.storage.flow_cache import FlowResultCache
+from src.storage.metadata_cache import MetadataCache
+from src.storage.report_store import ReportStore
 from src.talent_selection_flow.crews.classification_crew.crew import ClassificationCrew
 from src.talent_selection_flow.crews.classification_crew.enums import DocumentType
+from src.talent_selection_flow.crews.classification_crew.local_classifier import classify_locally
 from src.talent_selection_flow.crews.cv_to_job_crew.crew import CVToJobCrew
+from src.talent_selection_flow.crews.fused_extraction_crew.crew import FusedExtractionCrew
 from src.talent_selection_flow.crews.job_to_cv_crew.crew import JobToCVCrew
 from src.talent_selection_flow.crews.metadata_extraction_crew.crews import (
     CVMetadataExtractorCrew,
@@ -30,9 +52,93 @@ from src.talent_selection_flow.crews.metadata_extraction_crew.enums import (
     EmploymentType,
     ExperienceLevel,
 )
-from src.talent_selection_flow.crews.utils import render_to_markdown
-from src.talent_selection_flow.schemas import TalentState
+from src.talent_selection_flow.crews.pool import CREW_POOL
+from src.talent_selection_flow.crews.schemas import GapAnalysis, Questions
+from src.talent_selection_flow.crews.utils import (
+    GAPS_HEADER,
+    QUESTIONS_HEADER,
+    render_gap_analysis,
+    render_interview_questions,
+    render_matches,
+    render_summary,
+    render_to_markdown,
+)
+from src.talent_selection_flow.schemas import BatchResult, TalentState
 from src.utils.logger import logger
+from src.utils.metrics import CrewMetrics, RunMetrics, kickoff_crew, record_compaction, track_run, track_step
+
+# State fields stored alongside cached reports and restored on a hit
+CACHED_STATE_FIELDS = {
+    "input_type",
+    "metadata",
+    "collection_name",
+    "related_docs",
+    "gap_analysis",
+    "interview_questions",
+}
+
+# Header streamed before the first section of each renderer, as in the final report
+SECTION_HEADERS = {
+    render_gap_analysis: GAPS_HEADER,
+    render_interview_questions: QUESTIONS_HEADER,
+}
+
+# Metadata extractor crew per document type
+METADATA_EXTRACTORS = {
+    DocumentType.CV: CVMetadataExtractorCrew,
+    DocumentType.JOB: JobMetadataExtractorCrew,
+}
+
+
+def checkpoint(step: Callable) -> Callable:
+    """
+    Makes a flow step resumable and measures its wall time.
+
+    Once the step succeeds, it is recorded in `state.completed_steps`, its
+    wall time in `state.timings`, and the state is saved to the flow's
+    checkpoint store under the run id. When a run is resumed, completed steps
+    are skipped and return the stored report, so the flow continues from the
+    first step that did not finish.
+
+    Args:
+        step (Callable): A `@start` or `@listen` flow method (sync or async).
+
+    Returns:
+        Callable: The wrapped method. It must be decorated before the flow decorators.
+    """
+    name = step.__name__
+
+    if asyncio.iscoroutinefunction(step):
+
+        @functools.wraps(step)
+        async def async_wrapper(self: "TalentSelectionFlow", *args: Any, **kwargs: Any) -> Any:
+            with track_step(name) as metrics:
+                if name in self.state.completed_steps:
+                    logger.info(f"Skipping step `{name}`, already completed in run `{self.state.id}`")
+                    metrics.status = "skipped"
+                    return self.state.report
+                result = await step(self, *args, **kwargs)
+            self.state.timings[name] = metrics.seconds
+            self.state.completed_steps.append(name)
+            await asyncio.to_thread(self._save_checkpoint, name)
+            return result
+
+        return async_wrapper
+
+    @functools.wraps(step)
+    def sync_wrapper(self: "TalentSelectionFlow", *args: Any, **kwargs: Any) -> Any:
+        with track_step(name) as metrics:
+            if name in self.state.completed_steps:
+                logger.info(f"Skipping step `{name}`, already completed in run `{self.state.id}`")
+                metrics.status = "skipped"
+                return self.state.report
+            result = step(self, *args, **kwargs)
+        self.state.timings[name] = metrics.seconds
+        self.state.completed_steps.append(name)
+        self._save_checkpoint(name)
+        return result
+
+    return sync_wrapper
 
 
 class TalentSelectionFlow(Flow[TalentState]):
@@ -46,49 +152,211 @@ class TalentSelectionFlow(Flow[TalentState]):
     Attributes:
         _guardrail_max_retries (int): Max attempts for self-correction in crews.
         _verbose (bool): Whether to print detailed execution logs.
+        _chroma_client (Any): Optional shared ChromaDB client used by the vector search step.
+        _fused_extraction (bool): Whether classification and metadata extraction run
+            as a single LLM call through the FusedExtractionCrew.
+        _local_classifier_threshold (float | None): Minimum confidence of the local
+            classifier to skip the classification LLM call. None disables the fast path.
+        _speculative_extraction (bool): Whether metadata extraction runs concurrently
+            with the LLM classification.
+        _per_document_analysis (bool): Whether each related document is analysed by
+            its own concurrent gap-analysis-then-questions pipeline.
+        _top_k (int): Maximum number of related documents retrieved from ChromaDB.
+        _min_similarity (float | None): Minimum similarity of a related document to be analysed.
+        _max_similarity_gap (float | None): Similarity drop at which the remaining,
+            weaker matches are dropped. None disables the adaptive cutoff.
+        _skill_matching (SkillMatchingMode): How the local skill matcher is used in the gap analysis.
+        _compact_inputs (bool): Whether crew inputs are compacted before prompting.
+        _input_token_budget (int | None): Maximum tokens of the document passed to the
+            classification and extraction crews, or None to never truncate it.
+        _result_cache (FlowResultCache | None): Cache of complete flow results, or None
+            if caching is disabled.
+        _metadata_cache (MetadataCache | None): Cache of validated metadata extractions,
+            shared with the ChromaDB ingestion, or None if caching is disabled.
+        _checkpoint_store (FlowPersistence | None): Store receiving the state after every
+            step, or None if checkpointing is disabled.
+        _report_store (ReportStore): Store receiving the report of every run, keyed by run id.
+        _sections (asyncio.Queue | None): Receives the report sections as they become
+            available while `stream_report` is running.
+        _streamed_headers (set[str]): Section headers already streamed in this run.
+        _pending_gap_stages (int): Per-document gap analyses still running. Their interview
+            questions are held back meanwhile, so they stream after every gap analysis.
+        _held_questions (dict[str, Questions]): Interview questions waiting for the gap analyses.
+        metrics (RunMetrics | None): Step and crew metrics of the last run.
     """
 
     def __init__(
         self,
         guardrail_max_retries: int = GUARDRAIL_MAX_RETRIES,
         verbose: bool = False,
+        chroma_client: Any | None = None,
+        fused_extraction: bool = False,
+        local_classifier_threshold: float | None = LOCAL_CLASSIFIER_THRESHOLD,
+        speculative_extraction: bool = False,
+        per_document_analysis: bool = False,
+        top_k: int = QUERY_TOP_K,
+        min_similarity: float | None = QUERY_MIN_SIMILARITY,
+        max_similarity_gap: float | None = None,
+        skill_matching: SkillMatchingMode | str = SKILL_MATCHING_MODE,
+        compact_inputs: bool = True,
+        input_token_budget: int | None = INPUT_TOKEN_BUDGET,
+        use_result_cache: bool = True,
+        result_cache: FlowResultCache | None = None,
+        use_metadata_cache: bool = True,
+        metadata_cache: MetadataCache | None = None,
+        use_checkpoints: bool = True,
+        checkpoint_store: FlowPersistence | None = None,
+        report_store: ReportStore | None = None,
+        compress_reports: bool = False,
     ) -> None:
         """
-        Initializes the flow and ensures the output directory exists.
+        Initializes the flow and opens its caches and stores.
 
         Args:
             guardrail_max_retries (int): Retries for agentic guardrails.
             verbose (bool): Enable/disable detailed logging.
+            chroma_client (Any, optional): ChromaDB client to query instead of the one of the default
+                persist directory. Its collection handles are cached in `CHROMA_HANDLES` as well.
+            fused_extraction (bool): If True, classify and extract metadata in one LLM call
+                instead of running the ClassificationCrew and a MetadataExtractorCrew.
+            local_classifier_threshold (float | None): Confidence in [0, 1] above which the
+                local classifier's answer is trusted and the LLM classification is skipped.
+                None always runs the LLM classification.
+            speculative_extraction (bool): If True, start the metadata extraction alongside the
+                LLM classification and keep the one matching the classified type. Trades extra
+                tokens for one less LLM latency. Ignored in fused mode.
+            per_document_analysis (bool): If True, run the gap analysis and interview questions
+                for each related document as its own concurrent pipeline instead of one combined prompt.
+            top_k (int): Maximum number of related documents retrieved from ChromaDB.
+            min_similarity (float | None): Related documents with a lower similarity score are not
+                analysed. None keeps every match.
+            max_similarity_gap (float | None): If set, the matches are cut at the first similarity
+                drop larger than this gap (e.g., 0.15), so only the leading group is analysed.
+            skill_matching (SkillMatchingMode | str): 'refine' gives the local skill match to the gap
+                analysis LLM to confirm or correct, 'fast' uses it as the gap analysis (only the interview
+                questions call the LLM), and 'off' leaves the gap analysis to the LLM alone.
+            compact_inputs (bool): If True, clean the document of PDF boilerplate (and fit it into
+                `input_token_budget`, if set) before classification and extraction, and pass only the
+                fields the analysis tasks use of each related document.
+            input_token_budget (int | None): Opt-in maximum tokens of the compacted document, reached by
+                dropping low-priority sections and then truncating the tail. None (default) keeps the
+                whole cleaned document. Ignored if `compact_inputs` is False.
+            use_result_cache (bool): If True, return the stored report when the same document was
+                already evaluated with the same prompts and collections, and store new reports.
+            result_cache (FlowResultCache, optional): Cache shared across flows. If None and
+                `use_result_cache` is True, the default on-disk cache is used.
+            use_metadata_cache (bool): If True, reuse the metadata already extracted from the same
+                document (by a previous evaluation or by the ChromaDB ingestion) and store new extractions.
+            metadata_cache (MetadataCache, optional): Cache shared across flows. If None and
+                `use_metadata_cache` is True, the default on-disk cache is used.
+            use_checkpoints (bool): If True, save the state after every step so that a failed
+                run can be continued with `resume`.
+            checkpoint_store (FlowPersistence, optional): Checkpoint store shared across flows. If
+                None and `use_checkpoints` is True, the default SQLite store is used.
+            report_store (ReportStore, optional): Report store shared across flows. If None,
+                the default store under the reports directory is used.
+            compress_reports (bool): If True, the default report store gzip-compresses the reports.
+                Ignored when `report_store` is given.
         """
-        super().__init__()
+        if use_checkpoints and checkpoint_store is None:
+            FLOW_CHECKPOINTS_PATH.parent.mkdir(parents=True, exist_ok=True)
+            checkpoint_store = SQLiteFlowPersistence(db_path=str(FLOW_CHECKPOINTS_PATH))
+        self._checkpoint_store = checkpoint_store if use_checkpoints else None
+
+        super().__init__(persistence=self._checkpoint_store)
+        self.metrics: RunMetrics | None = None
         self._guardrail_max_retries = guardrail_max_retries
         self._verbose = verbose
-
-        # Ensure the directory exists
-        Path(REPORT_OUTPUT_PATH).parent.mkdir(parents=True, exist_ok=True)
+        self._chroma_client = chroma_client
+        self._fused_extraction = fused_extraction
+        self._local_classifier_threshold = local_classifier_threshold
+        self._speculative_extraction = speculative_extraction
+        self._per_document_analysis = per_document_analysis
+        self._top_k = top_k
+        self._min_similarity = min_similarity
+        self._max_similarity_gap = max_similarity_gap
+        self._skill_matching = SkillMatchingMode(skill_matching)
+        self._compact_inputs = compact_inputs
+        self._input_token_budget = input_token_budget
+        self._compacted_input: tuple[str, int, int] | None = None
+        self._result_cache = (result_cache or FlowResultCache()) if use_result_cache else None
+        self._cache_key: str | None = None
+        self._metadata_cache = (metadata_cache or MetadataCache()) if use_metadata_cache else None
+        self._report_store = report_store or ReportStore(compress=compress_reports)
+        self._sections: asyncio.Queue[str | None] | None = None
+        self._streamed_headers: set[str] = set()
+        self._pending_gap_stages = 0
+        self._held_questions: dict[str, Questions] = {}
 
     @start()
-    def classify_input(self) -> None:
+    @checkpoint
+    async def classify_input(self) -> None:
         """
         Step 1: Identifies the type of document provided by the user.
 
         Uses the ClassificationCrew to determine if the input is a CV,
-        a Job Description, or something else.
+        a Job Description, or something else. In fused mode, the
+        FusedExtractionCrew also extracts the metadata in the same call.
+
+        A local keyword classifier runs first: when its confidence reaches
+        the configured threshold, its answer is used and no LLM is called.
+        In speculative mode, metadata extraction starts concurrently with
+        the LLM classification (see `_classify_speculatively`).
+
+        Before anything else, the result cache is checked: on a hit, the
+        stored state is restored and the flow jumps to the cached report.
+        Then, if the metadata of the document was already extracted as a
+        single type (e.g., the document was ingested), that type is used.
         """
-        result = (
-            ClassificationCrew(
-                verbose=self._verbose,
-                guardrail_max_retries=self._guardrail_max_retries,
-            )
-            .crew()
-            .kickoff(
-                inputs={
-                    "user_input": self.state.raw_input,
-                    "output_options": "/".join(DocumentType),
-                }
-            )
-        )
-        self.state.input_type = result.raw
+        if self._result_cache is not None and await self._restore_cached_result():
+            return
+
+        if self._metadata_cache is not None and await self._restore_cached_metadata():
+            return
+
+        local_type = DocumentType.OTHER
+        if self._local_classifier_threshold is not None:
+            local_type, confidence = classify_locally(self.state.raw_input)
+            if confidence >= self._local_classifier_threshold:
+                logger.info(f"Local classifier fast path: `{local_type}` (confidence {confidence:.2f})")
+                self.state.input_type = local_type
+                return
+            logger.info(f"Local classifier not confident ({confidence:.2f}), falling back to the LLM")
+
+        if self._fused_extraction:
+            fused_output = await self._cached_extraction(FusedExtractionCrew.__name__)
+            if fused_output is None:
+                with CREW_POOL.lease(
+                    FusedExtractionCrew,
+                    verbose=self._verbose,
+                    guardrail_max_retries=self._guardrail_max_retries,
+                ) as crew:
+                    result = await kickoff_crew(
+                        crew,
+                        inputs={
+                            "user_input": self._crew_input("fused_extraction"),
+                            "output_options": "/".join(DocumentType),
+                            "educationlevel_options": "/".join(EducationLevel),
+                            "employmenttype_options": "/".join(EmploymentType),
+                            "experiencelevel_options": "/".join(ExperienceLevel),
+                        },
+                    )
+                fused_output = json.loads(result.raw)
+                # Kept under the fused crew's own key: the extraction crews and the ingestion never reuse it
+                await self._store_extraction(FusedExtractionCrew.__name__, fused_output)
+            else:
+                logger.info("Metadata cache hit for the fused classification and extraction")
+            self.state.input_type = DocumentType(fused_output["document_type"])
+            self.state.metadata = fused_output["metadata"] or {}
+            return
+
+        if self._speculative_extraction:
+            # Speculate only on the local classifier's lean when it has one
+            candidates = [local_type] if local_type != DocumentType.OTHER else [DocumentType.CV, DocumentType.JOB]
+            await self._classify_speculatively(candidates)
+            return
+
+        self.state.input_type = await self._classify()
 
     @router(classify_input)
     def route_by_type_1(self) -> str:
@@ -96,75 +364,60 @@ class TalentSelectionFlow(Flow[TalentState]):
         Decision Point 1: Routes to metadata extraction or error handling.
 
         Returns:
-            str: "cv_or_job" for valid types, "route_other" for invalid types.
+            str: "route_cached" for cache hits, "cv_or_job" for valid types,
+                "route_other" for invalid types.
         """
+        if self.state.cache_hit:
+            return "route_cached"
         if (self.state.input_type == DocumentType.CV) or (self.state.input_type == DocumentType.JOB):
             return "cv_or_job"
         else:
             return "route_other"
 
     @listen("cv_or_job")
-    def extract_metadata(self) -> Any:
+    @checkpoint
+    async def extract_metadata(self) -> Any:
         """
         Step 2: Extracts structured entities based on the document type.
 
         Uses either CVMetadataExtractorCrew or JobMetadataExtractorCrew
-        to populate the state metadata (skills, experience, etc.).
+        to populate the state metadata (skills, experience, etc.). Skipped
+        when the metadata was already produced during classification
+        (fused mode, metadata cache or a successful speculative extraction).
+        The skills are then rewritten with their canonical names, as in the
+        ingested collections.
         """
-        if self.state.input_type == DocumentType.CV:
-            metadata = (
-                CVMetadataExtractorCrew(
-                    guardrail_max_retries=self._guardrail_max_retries,
-                    verbose=self._verbose,
-                    human_input=False,
-                )
-                .crew()
-                .kickoff(
-                    inputs={
-                        "content": self.state.raw_input,
-                        "educationlevel_options": "/".join(EducationLevel),
-                        "experiencelevel_options": "/".join(ExperienceLevel),
-                    }
-                )
-            )
-        else:
-            metadata = (
-                JobMetadataExtractorCrew(
-                    guardrail_max_retries=self._guardrail_max_retries,
-                    verbose=self._verbose,
-                    human_input=False,
-                )
-                .crew()
-                .kickoff(
-                    inputs={
-                        "content": self.state.raw_input,
-                        "employmenttype_options": "/".join(EmploymentType),
-                        "experiencelevel_options": "/".join(ExperienceLevel),
-                    }
-                )
-            )
-        self.state.metadata = json.loads(metadata.raw)
+        if not self.state.metadata:
+            self.state.metadata, _ = await self._extract_metadata_for(self.state.input_type)
+
+        self.state.metadata = SKILL_CANONICALIZER.canonicalize_metadata(self.state.metadata)
 
     @listen(extract_metadata)
-    def query_to_db(self) -> Any:
+    @checkpoint
+    async def query_to_db(self) -> Any:
         """
         Step 3: Performs semantic search in ChromaDB.
 
         Queries the 'jobs' collection if a CV was provided, or the 'cvs'
         collection if a Job Description was provided.
         """
+        self._emit_section(render_summary(self.state.input_type, self.state.metadata))
         if self.state.input_type == DocumentType.CV:
-            collection_name = "jobs"
+            self.state.collection_name = "jobs"
         else:
-            collection_name = "cvs"
+            self.state.collection_name = "cvs"
 
-        related_docs = query_to_collection(
-            collection_name=collection_name,
+        related_docs = await query_to_collection_async(
+            collection_name=self.state.collection_name,
             query_text=self.state.raw_input,
             country=self.state.metadata.get("country"),
-            top_k=3,
+            top_k=self._top_k,
+            client=self._chroma_client,
+            min_similarity=self._min_similarity,
+            max_similarity_gap=self._max_similarity_gap,
         )
         self.state.related_docs = related_docs
+        self._emit_section(render_matches(self.state.input_type, related_docs))
 
     @router(query_to_db)
     def route_by_type_2(self) -> str:
@@ -181,44 +434,33 @@ class TalentSelectionFlow(Flow[TalentState]):
             return "route_job"
 
     @listen("route_cv")
-    def process_cv(self) -> None:
+    @checkpoint
+    async def process_cv(self) -> None:
         """
         Step 4a: Candidate Analysis.
 
         Matches a candidate against potential jobs using the CVToJobCrew.
         """
-        cv_crew = CVToJobCrew(
-            verbose=self._verbose,
-            guardrail_max_retries=self._guardrail_max_retries,
-        )
-        _ = cv_crew.crew().kickoff(
-            inputs={"structured_cv": self.state.metadata, "related_jobs": self.state.related_docs}
-        )
-        self.state.process_crew = cv_crew
+        await self._run_analysis(CVToJobCrew, profile_key="structured_cv", docs_key="related_jobs")
 
     @listen("route_job")
-    def process_job(self) -> None:
+    @checkpoint
+    async def process_job(self) -> None:
         """
         Step 4b: Job Analysis.
 
         Matches a job description against potential candidates using the JobToCVCrew.
         """
-        job_crew = JobToCVCrew(
-            verbose=self._verbose,
-            guardrail_max_retries=self._guardrail_max_retries,
-        )
-        _ = job_crew.crew().kickoff(
-            inputs={"structured_job": self.state.metadata, "related_cvs": self.state.related_docs}
-        )
-        self.state.process_crew = job_crew
+        await self._run_analysis(JobToCVCrew, profile_key="structured_job", docs_key="related_cvs")
 
     @listen(or_(process_cv, process_job))
-    def render_and_export_report(self) -> str:
+    @checkpoint
+    async def render_and_export_report(self) -> str:
         """
         Step 5: Report Finalization.
 
         Consolidates all metadata, gap analyses, and interview questions
-        into a Markdown report and saves it to disk.
+        into a Markdown report and saves it in the report store under the run id.
 
         Returns:
             str: The full content of the generated report.
@@ -227,14 +469,42 @@ class TalentSelectionFlow(Flow[TalentState]):
             process_type=self.state.input_type,
             metadata_dict=self.state.metadata,
             related_docs=self.state.related_docs,
-            gap_analysis_output=self.state.process_crew.identify_gaps_task().output.json_dict,
-            inverview_questions_output=self.state.process_crew.generate_interview_questions_task().output.json_dict,
+            gap_analysis_output={"docs": {k: v.model_dump() for k, v in self.state.gap_analysis.items()}},
+            inverview_questions_output={"docs": {k: v.model_dump() for k, v in self.state.interview_questions.items()}},
         )
 
-        REPORT_OUTPUT_PATH.write_text(report, encoding="utf-8")
+        self.state.report = report
+        await self._store_report()
+
+        # Partial reports are not cached, so the failed documents are retried next time
+        if self._result_cache is not None and not self.state.failed_docs:
+            await asyncio.to_thread(
+                self._result_cache.put,
+                self._result_cache_key(),
+                collection_name=self.state.collection_name,
+                report=report,
+                state=self.state.model_dump(mode="json", include=CACHED_STATE_FIELDS),
+            )
         return report
 
+    @listen("route_cached")
+    @checkpoint
+    async def return_cached_report(self) -> str:
+        """
+        Cache Hit: Returns the report of a previous identical evaluation.
+
+        The report is also stored under this run id, so every run can be fetched by its id.
+
+        Returns:
+            str: The cached report content.
+        """
+        logger.info("Returning cached report, no crew was run")
+        self._emit_section(self.state.report)
+        await self._store_report()
+        return self.state.report
+
     @listen("route_other")
+    @checkpoint
     def handle_other(self) -> str:
         """
         Error Handler: Triggered when input classification fails.
@@ -244,4 +514,721 @@ class TalentSelectionFlow(Flow[TalentState]):
             "Please, start a new evaluation."
         )
         logger.warning(msg)
+        self.state.report = msg
+        self._emit_section(msg)
         return msg
+
+    async def kickoff_async(self, *args: Any, **kwargs: Any) -> Any:
+        """
+        Runs the flow while collecting its metrics.
+
+        The step timings, crew costs and guardrail retries are available in
+        `self.metrics` and appended as a JSON record to the run metrics file.
+
+        Returns:
+            Any: The flow output.
+        """
+        async with track_run() as metrics:
+            self.metrics = metrics
+            try:
+                return await super().kickoff_async(*args, **kwargs)
+            finally:
+                metrics.run_id = self.state.id
+
+    async def stream_report(self, **kickoff_kwargs: Any) -> AsyncIterator[str]:
+        """
+        Runs the flow and yields the report sections as soon as their data exists.
+
+        The summary is yielded after the metadata extraction, the matches after
+        the vector query, and the gap analysis and interview questions of each
+        document as soon as they pass validation, under the same section headers
+        and in the same order as in the final report (in per-document mode, the
+        questions are held until every gap analysis finished). On a cache hit or
+        an invalid document, the whole report (or the error message) is yielded
+        at once. The complete report is available in `state.report` when the
+        iteration ends.
+
+        Args:
+            **kickoff_kwargs: Arguments forwarded to `kickoff_async` (e.g., `inputs`).
+
+        Yields:
+            str: The next Markdown section.
+        """
+        sections: asyncio.Queue[str | None] = asyncio.Queue()
+        self._sections = sections
+        self._streamed_headers = set()
+
+        async def run() -> Any:
+            try:
+                return await self.kickoff_async(**kickoff_kwargs)
+            finally:
+                sections.put_nowait(None)
+
+        task = asyncio.create_task(run())
+        try:
+            while (section := await sections.get()) is not None:
+                yield section
+            # Re-raises the flow error, if any
+            await task
+        finally:
+            self._sections = None
+            task.cancel()
+
+    async def resume(self, run_id: str) -> Any:
+        """
+        Continues a previous run from its last completed step.
+
+        The state checkpointed under `run_id` is restored, completed steps are
+        skipped and the remaining ones run as usual. Resuming a finished run
+        returns its report without running any step.
+
+        Args:
+            run_id (str): The `state.id` of the run to resume.
+
+        Returns:
+            Any: The flow output, as returned by `kickoff_async`.
+
+        Raises:
+            ValueError: If checkpointing is disabled or no checkpoint exists for `run_id`.
+        """
+        if self._checkpoint_store is None:
+            raise ValueError("Cannot resume a run with checkpointing disabled.")
+        stored_state = await asyncio.to_thread(self._checkpoint_store.load_state, run_id)
+        if stored_state is None:
+            raise ValueError(f"No checkpoint found for run `{run_id}`.")
+
+        logger.info(f"Resuming run `{run_id}` after steps {stored_state.get('completed_steps', [])}")
+        return await self.kickoff_async(inputs={"id": run_id})
+
+    def _save_checkpoint(self, step: str) -> None:
+        """
+        Saves the current state to the checkpoint store, if enabled.
+
+        Args:
+            step (str): Name of the step that just completed.
+        """
+        if self._checkpoint_store is not None:
+            self._checkpoint_store.save_state(flow_uuid=self.state.id, method_name=step, state_data=self._state)
+
+    def _emit_section(self, section: str) -> None:
+        """Hands a rendered report section to `stream_report`, if it is running."""
+        if self._sections is not None:
+            self._sections.put_nowait(section)
+
+    async def _store_report(self) -> None:
+        """Saves the report of this run off the event loop."""
+        record = await self._report_store.asave(
+            self.state.id, self.state.report, raw_input=self.state.raw_input, input_type=self.state.input_type
+        )
+        logger.info(f"Report of run `{record.run_id}` saved to `{self._report_store.root / record.path}`")
+
+    def _input_text(self) -> str:
+        """
+        Returns the raw input as passed to the crews, compacted on first use if enabled.
+
+        Returns:
+            str: The document text to interpolate in the prompts.
+        """
+        if not self._compact_inputs:
+            return self.state.raw_input
+
+        if self._compacted_input is None:
+            self._compacted_input = compact_document(self.state.raw_input, self._input_token_budget)
+        return self._compacted_input[0]
+
+    def _crew_input(self, stage: str) -> str:
+        """
+        Returns the raw input as passed to a crew, and records its compaction.
+
+        Args:
+            stage (str): The crew stage receiving the input, for the token report.
+
+        Returns:
+            str: The document text to interpolate in the prompt.
+        """
+        text = self._input_text()
+        if self._compacted_input is not None:
+            _, tokens_before, tokens_after = self._compacted_input
+            record_compaction(stage, tokens_before, tokens_after)
+        return text
+
+    def _analysis_docs(self, docs: dict[str, Any]) -> dict[str, Any]:
+        """
+        Returns the related documents as passed to the analysis crews.
+
+        Args:
+            docs (dict[str, Any]): Related documents keyed by ID.
+
+        Returns:
+            dict[str, Any]: The documents, reduced to the fields the tasks use if compaction is enabled.
+        """
+        if not self._compact_inputs:
+            return docs
+
+        compacted = select_fields(docs)
+        record_compaction("analysis", count_tokens(str(docs)), count_tokens(str(compacted)))
+        return compacted
+
+    def _result_cache_key(self) -> str:
+        """
+        Returns the result cache key of the raw input, computing it on first use.
+
+        Returns:
+            str: The cache key.
+        """
+        if self._cache_key is None:
+            # Results retrieved from another ChromaDB (e.g., a test or staging client) must not be shared
+            chroma_dir = (
+                self._chroma_client.get_settings().persist_directory
+                if self._chroma_client is not None
+                else str(CHROMA_DIR)
+            )
+            self._cache_key = self._result_cache.make_key(
+                self.state.raw_input,
+                options={
+                    "chroma_dir": chroma_dir,
+                    "per_document_analysis": self._per_document_analysis,
+                    "top_k": self._top_k,
+                    "min_similarity": self._min_similarity,
+                    "max_similarity_gap": self._max_similarity_gap,
+                    "skill_matching": str(self._skill_matching),
+                    "compact_inputs": self._compact_inputs,
+                    "input_token_budget": self._input_token_budget,
+                },
+            )
+        return self._cache_key
+
+    async def _restore_cached_result(self) -> bool:
+        """
+        Looks up the raw input in the result cache and restores the state on a hit.
+
+        Returns:
+            bool: True if a cached result was restored.
+        """
+        cached = await asyncio.to_thread(self._result_cache.get, self._result_cache_key())
+        if cached is None:
+            return False
+
+        report, state = cached
+        restored = TalentState.model_validate(state)
+        for field in state:
+            setattr(self.state, field, getattr(restored, field))
+        self.state.report = report
+        self.state.cache_hit = True
+        logger.info(f"Flow result cache hit for `{self._cache_key[:12]}`")
+        return True
+
+    async def _classify(self) -> DocumentType:
+        """
+        Runs the ClassificationCrew on the raw input.
+
+        Returns:
+            DocumentType: The document type validated by the classifier guardrail.
+        """
+        with CREW_POOL.lease(
+            ClassificationCrew,
+            verbose=self._verbose,
+            guardrail_max_retries=self._guardrail_max_retries,
+        ) as crew:
+            result = await kickoff_crew(
+                crew,
+                inputs={
+                    "user_input": self._crew_input("classification"),
+                    "output_options": "/".join(DocumentType),
+                },
+            )
+        return DocumentType(result.raw)
+
+    async def _restore_cached_metadata(self) -> bool:
+        """
+        Looks up metadata previously extracted from the raw input.
+
+        Only an unambiguous hit (metadata cached for a single document type)
+        is used, since it also settles the classification.
+
+        Returns:
+            bool: True if the input type and metadata were restored.
+        """
+        hits = {}
+        for document_type in METADATA_EXTRACTORS:
+            metadata = await self._cached_metadata(document_type)
+            if metadata is not None:
+                hits[document_type] = metadata
+
+        if len(hits) != 1:
+            return False
+
+        self.state.input_type, self.state.metadata = next(iter(hits.items()))
+        logger.info(f"Metadata cache hit: `{self.state.input_type}`, skipping classification and extraction")
+        return True
+
+    async def _extract_metadata_for(
+        self,
+        document_type: DocumentType,
+        store: bool = True,
+        metrics: CrewMetrics | None = None,
+    ) -> tuple[dict[str, Any], int]:
+        """
+        Extracts the metadata of the raw input with the crew matching `document_type`.
+
+        The metadata cache is consulted first, and new extractions are stored in it.
+
+        Args:
+            document_type (DocumentType): Either CV or JOB.
+            store (bool): If False, a new extraction is not stored in the metadata cache
+                (e.g., while the document type is unconfirmed).
+            metrics (CrewMetrics, optional): Record of the extraction kickoff, filled even if
+                the extraction is cancelled.
+
+        Returns:
+            tuple[dict[str, Any], int]: The validated metadata and the tokens spent
+                extracting it (0 on a cache hit).
+        """
+        metadata = await self._cached_metadata(document_type)
+        if metadata is not None:
+            logger.info(f"Metadata cache hit for `{document_type}` extraction")
+            return metadata, 0
+
+        if document_type == DocumentType.CV:
+            options = {
+                "educationlevel_options": "/".join(EducationLevel),
+                "experiencelevel_options": "/".join(ExperienceLevel),
+            }
+        else:
+            options = {
+                "employmenttype_options": "/".join(EmploymentType),
+                "experiencelevel_options": "/".join(ExperienceLevel),
+            }
+
+        with CREW_POOL.lease(
+            METADATA_EXTRACTORS[document_type],
+            guardrail_max_retries=self._guardrail_max_retries,
+            verbose=self._verbose,
+            human_input=False,
+        ) as crew:
+            result = await kickoff_crew(
+                crew, inputs={"content": self._crew_input("metadata_extraction"), **options}, metrics=metrics
+            )
+        metadata = json.loads(result.raw)
+        if store:
+            await self._store_metadata(document_type, metadata)
+        return metadata, result.token_usage.total_tokens
+
+    async def _cached_metadata(self, document_type: DocumentType) -> dict[str, Any] | None:
+        """
+        Looks up metadata extracted from the raw input for `document_type`.
+
+        Args:
+            document_type (DocumentType): Either CV or JOB.
+
+        Returns:
+            dict[str, Any] | None: The validated metadata, or None if it was never extracted
+                (or the metadata cache is disabled).
+        """
+        return await self._cached_extraction(METADATA_EXTRACTORS[document_type].__name__)
+
+    async def _store_metadata(self, document_type: DocumentType, metadata: dict[str, Any]) -> None:
+        """
+        Stores validated metadata in the metadata cache, if enabled.
+
+        Args:
+            document_type (DocumentType): Either CV or JOB, selecting the extractor the entry belongs to.
+            metadata (dict[str, Any]): The validated metadata.
+        """
+        await self._store_extraction(METADATA_EXTRACTORS[document_type].__name__, metadata)
+
+    async def _cached_extraction(self, crew_type: str) -> dict[str, Any] | None:
+        """
+        Looks up the output of an extraction crew on the raw input.
+
+        Entries are keyed by the exact text the crew saw. The text sent by this
+        flow (compacted with its settings) is looked up first, then the full raw
+        input: an extraction of the whole document (e.g., from the ingestion)
+        saw at least as much of it.
+
+        Args:
+            crew_type (str): Name of the crew class that produced the entry.
+
+        Returns:
+            dict[str, Any] | None: The validated output, or None if the crew never ran on the
+                input (or the metadata cache is disabled).
+        """
+        if self._metadata_cache is None:
+            return None
+
+        for text in dict.fromkeys([self._input_text(), self.state.raw_input]):
+            output = await asyncio.to_thread(self._metadata_cache.get, text, crew_type)
+            if output is not None:
+                return output
+        return None
+
+    async def _store_extraction(self, crew_type: str, output: dict[str, Any]) -> None:
+        """
+        Stores the validated output of an extraction crew in the metadata cache, if enabled.
+
+        The entry is keyed by the text the crew actually saw, so the extraction of a
+        compacted document is never served for the full document (e.g., to the
+        ingestion) or under other compaction settings.
+
+        Args:
+            crew_type (str): Name of the crew class that produced the output.
+            output (dict[str, Any]): The validated output.
+        """
+        if self._metadata_cache is not None:
+            await asyncio.to_thread(self._metadata_cache.put, self._input_text(), crew_type, output)
+
+    async def _classify_speculatively(self, candidates: list[DocumentType]) -> None:
+        """
+        Classifies the input while speculatively extracting metadata for `candidates`.
+
+        The extraction matching the classified type is kept and fills the state
+        metadata, saving one LLM latency; it is only stored in the metadata cache
+        once the classification confirms its type. The other extractions are
+        cancelled as soon as the type is known, and the tokens they already spent
+        are added to `state.speculative_tokens` before the step returns.
+
+        Args:
+            candidates (list[DocumentType]): Document types to extract metadata for.
+        """
+        spend = {t: CrewMetrics(crew="") for t in candidates}
+        extractions = {
+            t: asyncio.create_task(self._extract_metadata_for(t, store=False, metrics=spend[t])) for t in candidates
+        }
+        try:
+            self.state.input_type = await self._classify()
+        except BaseException:
+            for task in extractions.values():
+                task.cancel()
+            await asyncio.gather(*extractions.values(), return_exceptions=True)
+            raise
+
+        discarded = [t for t in candidates if t != self.state.input_type]
+        for document_type in discarded:
+            extractions[document_type].cancel()
+
+        if self.state.input_type in extractions:
+            try:
+                metadata, _ = await extractions[self.state.input_type]
+                await self._store_metadata(self.state.input_type, metadata)
+                self.state.metadata = metadata
+            except Exception as e:
+                # Leave the metadata empty so `extract_metadata` retries on the regular path
+                logger.warning(f"Speculative `{self.state.input_type}` extraction failed, retrying serially: {e}")
+
+        # Wait for the cancellations, so the spend of every kickoff is recorded before the step returns
+        await asyncio.gather(*(extractions[t] for t in discarded), return_exceptions=True)
+        wasted_tokens = sum(spend[t].prompt_tokens + spend[t].completion_tokens for t in discarded)
+        if wasted_tokens:
+            self.state.speculative_tokens += wasted_tokens
+            logger.info(f"Discarded speculative extractions spent {wasted_tokens} extra tokens")
+
+    async def _run_analysis(self, crew_cls: type, profile_key: str, docs_key: str) -> None:
+        """
+        Runs the gap analysis and interview question stages over the related documents.
+
+        By default, all related documents go into a single crew kickoff where the
+        question task waits for the gap analysis of every document. In
+        per-document mode, each document runs its own two-stage pipeline
+        concurrently (see `_analyse_document`): its questions start as soon as
+        its own gap analysis passes validation, and a guardrail retry only redoes
+        that document. Either way, the results are stored as typed models keyed
+        by document ID, and documents that fail are left out of the report.
+
+        The local skill matcher precomputes the matched and missing skills of
+        every document. In refine mode, the gap analysis prompt receives them to
+        confirm or correct; in fast mode, they are the gap analysis, and only the
+        interview questions call the LLM.
+
+        Args:
+            crew_cls (type): Either CVToJobCrew or JobToCVCrew.
+            profile_key (str): Input name of the structured profile in the crew's tasks.
+            docs_key (str): Input name of the related documents in the crew's tasks.
+        """
+        # A resumed or re-run analysis starts over: drop the results and errors of an earlier attempt
+        self.state.gap_analysis = {}
+        self.state.interview_questions = {}
+        self.state.failed_docs = {}
+        if not self.state.related_docs:
+            logger.warning("No related document passed the similarity cutoff, skipping the analysis crews")
+            # The final report keeps both (empty) sections
+            self._emit_documents(render_gap_analysis, {})
+            self._emit_documents(render_interview_questions, {})
+            return
+
+        local_gaps = self._local_gap_analysis(self.state.related_docs)
+        options = {"verbose": self._verbose, "guardrail_max_retries": self._guardrail_max_retries}
+        inputs = {profile_key: self.state.metadata, docs_key: self._analysis_docs(self.state.related_docs)}
+
+        if not self._per_document_analysis and self._skill_matching == SkillMatchingMode.FAST:
+            self.state.gap_analysis = local_gaps
+            self._emit_documents(render_gap_analysis, local_gaps)
+            with CREW_POOL.lease(crew_cls, factory="interview_questions_crew", **options) as crew:
+                result = await kickoff_crew(crew, inputs={**inputs, "gap_analysis": _dump_docs(local_gaps)})
+            self.state.interview_questions = _parse_docs(result.json_dict, Questions)
+            self._emit_documents(render_interview_questions, self.state.interview_questions)
+            return
+
+        if not self._per_document_analysis:
+            with CREW_POOL.lease(crew_cls, **options) as crew:
+                result = await kickoff_crew(crew, inputs={**inputs, "skill_match": self._skill_match_input(local_gaps)})
+            self.state.gap_analysis = _parse_docs(result.tasks_output[0].json_dict, GapAnalysis)
+            self.state.interview_questions = _parse_docs(result.tasks_output[1].json_dict, Questions)
+            self._emit_documents(render_gap_analysis, self.state.gap_analysis)
+            self._emit_documents(render_interview_questions, self.state.interview_questions)
+            return
+
+        self._pending_gap_stages = len(self.state.related_docs)
+        self._held_questions = {}
+        outcomes = await asyncio.gather(
+            *(
+                self._analyse_document(crew_cls, profile_key, docs_key, doc_id, doc, local_gaps.get(doc_id))
+                for doc_id, doc in self.state.related_docs.items()
+            ),
+            return_exceptions=True,
+        )
+
+        for doc_id, outcome in zip(self.state.related_docs, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Analysis failed for `doc_id={doc_id}` due to error: {outcome}")
+                self.state.failed_docs[doc_id] = str(outcome)
+
+        if self.state.related_docs and not self.state.gap_analysis:
+            raise RuntimeError(f"Analysis failed for every related document: {self.state.failed_docs}")
+
+    async def _analyse_document(
+        self,
+        crew_cls: type,
+        profile_key: str,
+        docs_key: str,
+        doc_id: str,
+        doc: dict[str, Any],
+        local_gaps: GapAnalysis | None = None,
+    ) -> None:
+        """
+        Runs the gap analysis and then the interview questions for a single document.
+
+        Each stage stores its validated result in the state as soon as it
+        finishes, so the report can be assembled from whatever completed even
+        if a later stage fails.
+
+        Args:
+            crew_cls (type): Either CVToJobCrew or JobToCVCrew.
+            profile_key (str): Input name of the structured profile in the crew's tasks.
+            docs_key (str): Input name of the related documents in the crew's tasks.
+            doc_id (str): The ChromaDB identifier of the related document.
+            doc (dict[str, Any]): The related document's metadata and similarity.
+            local_gaps (GapAnalysis, optional): The document's local skill match, if computed.
+        """
+        options = {"verbose": self._verbose, "guardrail_max_retries": self._guardrail_max_retries}
+        inputs = {profile_key: self.state.metadata, docs_key: self._analysis_docs({doc_id: doc})}
+
+        try:
+            if self._skill_matching == SkillMatchingMode.FAST and local_gaps is not None:
+                self.state.gap_analysis[doc_id] = local_gaps
+            else:
+                skill_match = self._skill_match_input({doc_id: local_gaps} if local_gaps else {})
+                with CREW_POOL.lease(crew_cls, factory="gap_analysis_crew", **options) as crew:
+                    gaps_result = await kickoff_crew(crew, inputs={**inputs, "skill_match": skill_match})
+                gaps = _select_document_entry(gaps_result.json_dict, doc_id)
+                self.state.gap_analysis[doc_id] = GapAnalysis.model_validate(gaps)
+            self._emit_documents(render_gap_analysis, {doc_id: self.state.gap_analysis[doc_id]})
+        finally:
+            self._finish_gap_stage()
+
+        with CREW_POOL.lease(crew_cls, factory="interview_questions_crew", **options) as crew:
+            questions_result = await kickoff_crew(
+                crew,
+                inputs={**inputs, "gap_analysis": _dump_docs({doc_id: self.state.gap_analysis[doc_id]})},
+            )
+        self.state.interview_questions[doc_id] = Questions.model_validate(
+            _select_document_entry(questions_result.json_dict, doc_id)
+        )
+        if self._pending_gap_stages:
+            self._held_questions[doc_id] = self.state.interview_questions[doc_id]
+        else:
+            self._emit_documents(render_interview_questions, {doc_id: self.state.interview_questions[doc_id]})
+
+    def _finish_gap_stage(self) -> None:
+        """Counts a finished (or failed) per-document gap analysis, and streams the held questions after the last."""
+        self._pending_gap_stages -= 1
+        if not self._pending_gap_stages and self._held_questions:
+            self._emit_documents(render_interview_questions, self._held_questions)
+            self._held_questions = {}
+
+    def _local_gap_analysis(self, docs: dict[str, Any]) -> dict[str, GapAnalysis]:
+        """
+        Matches the skills of the input against the related documents without an LLM.
+
+        A job is matched against all its related CVs at once through a `SkillIndex`;
+        a CV is matched against the required skills of each related job.
+
+        Args:
+            docs (dict[str, Any]): Related documents keyed by ID.
+
+        Returns:
+            dict[str, GapAnalysis]: The matched and missing required skills per document ID,
+                empty if skill matching is disabled.
+        """
+        if self._skill_matching == SkillMatchingMode.OFF:
+            return {}
+
+        skills = self.state.metadata.get("skills")
+        if self.state.input_type == DocumentType.JOB:
+            return SkillIndex({doc_id: doc.get("skills") for doc_id, doc in docs.items()}).match(skills)
+        return {doc_id: match_skills(skills, doc.get("skills")) for doc_id, doc in docs.items()}
+
+    def _skill_match_input(self, local_gaps: dict[str, GapAnalysis]) -> str:
+        """Formats the local skill match for the gap analysis prompt."""
+        return _dump_docs(local_gaps) if local_gaps else "Not available."
+
+    def _emit_documents(self, render: Callable[[str, str, dict], str], docs: dict[str, BaseModel]) -> None:
+        """
+        Hands the rendered section of each document to `stream_report`, if it is running.
+
+        The header of the report section (e.g., `GAPS_HEADER`) is streamed first, once per run.
+
+        Args:
+            render (Callable[[str, str, dict], str]): `render_gap_analysis` or `render_interview_questions`.
+            docs (dict[str, BaseModel]): The validated results to render, keyed by document ID.
+        """
+        header = SECTION_HEADERS[render]
+        if header not in self._streamed_headers:
+            self._streamed_headers.add(header)
+            self._emit_section(header)
+        for doc_id, model in docs.items():
+            self._emit_section(render(self.state.input_type, doc_id, model.model_dump()))
+
+    @classmethod
+    async def evaluate_many(
+        cls,
+        documents: Iterable[str | tuple[str, str | Callable[[], str]]],
+        max_concurrency: int = BATCH_MAX_CONCURRENCY,
+        guardrail_max_retries: int = GUARDRAIL_MAX_RETRIES,
+        verbose: bool = False,
+        **flow_kwargs: Any,
+    ) -> AsyncIterator[BatchResult]:
+        """
+        Evaluates a batch of documents with bounded concurrency.
+
+        Each document runs in its own flow instance, but all flows share the
+        cached ChromaDB handles, the result and metadata caches, the report store and
+        the module-level LLM clients. Documents are pulled lazily from
+        `documents`, so at most `max_concurrency` flows are in flight at any
+        time, and results are yielded in completion order as soon as each flow
+        finishes. A document that fails to load or to evaluate yields a result
+        with `error` set instead of aborting the batch.
+
+        Args:
+            documents (Iterable[str | tuple[str, str | Callable[[], str]]]): Raw documents, either
+                as plain strings (identified by their position) or as `(doc_id, raw_input)` pairs.
+                `raw_input` may be a blocking loader returning the text, which then runs in a worker
+                thread (e.g., PDF conversion).
+            max_concurrency (int): Maximum number of flows running at the same time.
+            guardrail_max_retries (int): Retries for agentic guardrails.
+            verbose (bool): Enable/disable detailed logging.
+            **flow_kwargs: Additional options forwarded to every flow (e.g., `fused_extraction`).
+
+        Yields:
+            BatchResult: The outcome of one document, as soon as it is available.
+        """
+        if max_concurrency < 1:
+            raise ValueError("`max_concurrency` must be a positive integer.")
+
+        flow_kwargs.setdefault("result_cache", FlowResultCache())
+        flow_kwargs.setdefault("metadata_cache", MetadataCache())
+        if "report_store" not in flow_kwargs:
+            flow_kwargs["report_store"] = ReportStore(compress=flow_kwargs.pop("compress_reports", False))
+        pending = ((doc[0], doc[1]) if isinstance(doc, tuple) else (str(i), doc) for i, doc in enumerate(documents))
+        results: asyncio.Queue[BatchResult | None] = asyncio.Queue()
+
+        async def evaluate(doc_id: str, raw_input: str | Callable[[], str]) -> BatchResult:
+            flow = None
+            start = time.perf_counter()
+            try:
+                if callable(raw_input):
+                    raw_input = await asyncio.to_thread(raw_input)
+                flow = cls(guardrail_max_retries=guardrail_max_retries, verbose=verbose, **flow_kwargs)
+                report = await flow.kickoff_async(inputs={"raw_input": raw_input})
+                result = BatchResult(
+                    doc_id=doc_id, run_id=flow.state.id, input_type=flow.state.input_type, report=report
+                )
+            except Exception as e:
+                logger.error(f"Batch evaluation failed for `doc_id={doc_id}` due to error: {e}")
+                result = BatchResult(doc_id=doc_id, error=str(e))
+                if flow is not None:
+                    result.run_id, result.input_type = flow.state.id, flow.state.input_type
+            result.elapsed_seconds = round(time.perf_counter() - start, 3)
+            return result
+
+        async def worker() -> None:
+            try:
+                # Workers share the same lazy iterator, so no document is evaluated twice
+                for doc_id, raw_input in pending:
+                    await results.put(await evaluate(doc_id, raw_input))
+            finally:
+                # The consumer waits for one sentinel per worker, even if `documents` raised
+                results.put_nowait(None)
+
+        workers = [asyncio.create_task(worker()) for _ in range(max_concurrency)]
+        finished = 0
+        try:
+            while finished < len(workers):
+                item = await results.get()
+                if item is None:
+                    finished += 1
+                    continue
+                yield item
+            # Propagates an error raised by the `documents` iterable itself
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+
+
+def _parse_docs(output: dict[str, Any], model: type[BaseModel]) -> dict[str, BaseModel]:
+    """
+    Converts a validated `{"docs": {...}}` crew output into typed results per document.
+
+    Args:
+        output (dict[str, Any]): The task's JSON output.
+        model (type[BaseModel]): The per-document schema (GapAnalysis or Questions).
+
+    Returns:
+        dict[str, BaseModel]: The parsed result of each document, keyed by document ID.
+    """
+    return {doc_id: model.model_validate(entry) for doc_id, entry in output["docs"].items()}
+
+
+def _dump_docs(docs: dict[str, BaseModel]) -> str:
+    """
+    Serializes per-document results in the `{"docs": {...}}` shape the crews use.
+
+    Args:
+        docs (dict[str, BaseModel]): Validated results keyed by document ID.
+
+    Returns:
+        str: The JSON string.
+    """
+    return json.dumps({"docs": {doc_id: model.model_dump() for doc_id, model in docs.items()}})
+
+
+def _select_document_entry(output: dict[str, Any], doc_id: str) -> dict[str, Any]:
+    """
+    Extracts the entry of a single-document crew output.
+
+    The LLM occasionally rewrites the document key (e.g., 'JOB_ID' instead of
+    the actual id). Since the crew only saw one document, its single entry is
+    used in that case.
+
+    Args:
+        output (dict[str, Any]): A validated `{"docs": {...}}` crew output.
+        doc_id (str): The expected document identifier.
+
+    Returns:
+        dict[str, Any]: The analysis entry for `doc_id`.
+    """
+    docs = output["docs"]
+    if doc_id not in docs and len(docs) == 1:
+        logger.warning(f"Analysis returned key `{next(iter(docs))}` instead of `{doc_id}`, remapping it.")
+        return next(iter(docs.values()))
+    return docs[doc_id]
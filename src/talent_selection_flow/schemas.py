@@ -7,10 +7,12 @@ consistency across multiple asynchronous steps.
 """
 
 from typing import Any
+from uuid import uuid4
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from src.talent_selection_flow.crews.classification_crew.enums import DocumentType
+from src.talent_selection_flow.crews.schemas import GapAnalysis, Questions
 
 
 class TalentState(BaseModel):
@@ -19,23 +21,67 @@ class TalentState(BaseModel):
 
     This state object is passed between different tasks in the flow,
     storing raw user inputs, classified types, retrieved documents from
-    ChromaDB, and the final evaluation report.
+    ChromaDB, and the final evaluation report. It only holds plain, typed
+    results (no crew, agent or LLM objects), so it is cheap to copy and can
+    be pickled or JSON-dumped for checkpoints, queues and caches.
 
     Attributes:
+        id (str): The run identifier, used as checkpoint key.
         raw_input (str): The original text or markdown content provided by
             the user (e.g., a resume or job description).
         input_type (DocumentType): The categorical classification of the
             input (e.g., CV, JOB_DESCRIPTION, or OTHER).
         metadata (dict[str, Any]): Extracted structured data such as
             candidate name, skills, or job title.
+        collection_name (str): The ChromaDB collection queried for related documents.
         related_docs (dict[str, Any]): Semantic search results from
             the vector database (e.g., matching jobs for a CV).
-        process_crew (Any): A reference to the specific crew instance
-            or execution context currently handling the state.
+        gap_analysis (dict[str, GapAnalysis]): Gap analysis per related document ID.
+        interview_questions (dict[str, Questions]): Interview questions per related document ID.
+        failed_docs (dict[str, str]): Related documents whose analysis failed,
+            mapped to the error message. They are left out of the report.
+        speculative_tokens (int): Tokens spent by discarded speculative
+            metadata extractions before they were cancelled.
+        report (str): The rendered Markdown report.
+        cache_hit (bool): Whether the report was served from the flow result cache.
+        completed_steps (list[str]): Flow steps already completed, skipped when
+            the run is resumed.
+        timings (dict[str, float]): Wall time in seconds of each completed step.
     """
 
+    id: str = Field(default_factory=lambda: str(uuid4()))
     raw_input: str = ""
     input_type: DocumentType = DocumentType.OTHER
     metadata: dict[str, Any] = {}
+    collection_name: str = ""
     related_docs: dict[str, Any] = {}
-    process_crew: Any = None
+    gap_analysis: dict[str, GapAnalysis] = {}
+    interview_questions: dict[str, Questions] = {}
+    failed_docs: dict[str, str] = {}
+    speculative_tokens: int = 0
+    report: str = ""
+    cache_hit: bool = False
+    completed_steps: list[str] = []
+    timings: dict[str, float] = {}
+
+
+class BatchResult(BaseModel):
+    """
+    Outcome of a single document evaluated through `TalentSelectionFlow.evaluate_many`.
+
+    Attributes:
+        doc_id (str): Identifier of the document within the batch.
+        run_id (str | None): The flow run identifier, to resume failed evaluations.
+        input_type (DocumentType): The classification assigned by the flow.
+        report (str | None): The rendered Markdown report, or the flow's message
+            for unsupported documents. None if the evaluation failed.
+        error (str | None): The error message if the evaluation raised.
+        elapsed_seconds (float): Wall time spent evaluating the document.
+    """
+
+    doc_id: str
+    run_id: str | None = None
+    input_type: DocumentType = DocumentType.OTHER
+    report: str | None = None
+    error: str | None = None
+    elapsed_seconds: float = 0.0
@@ -0,0 +1,68 @@
+"""
+Content Hashing Utilities.
+
+This module provides stable fingerprints used as cache and index keys across
+the application: normalized document content hashes and version stamps of
+the prompt/config files that shape the LLM outputs.
+"""
+
+import hashlib
+import re
+import unicodedata
+from collections.abc import Iterable
+from pathlib import Path
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalizes a document so that cosmetic differences do not change its hash.
+
+    Applies Unicode NFKC normalization and collapses every whitespace run
+    (including the line breaks and indentation introduced by PDF extraction)
+    into a single space.
+
+    Args:
+        text (str): The raw document text.
+
+    Returns:
+        str: The normalized text.
+    """
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+def content_hash(text: str) -> str:
+    """
+    Computes the SHA-256 hex digest of a normalized document.
+
+    Args:
+        text (str): The raw document text.
+
+    Returns:
+        str: The hex digest of the normalized text.
+    """
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+def files_fingerprint(paths: Iterable[Path], extra: Iterable[str] = ()) -> str:
+    """
+    Computes a short version stamp from the content of a set of files.
+
+    Used to version caches by the YAML prompt configurations, so editing a
+    prompt automatically invalidates the results it produced.
+
+    Args:
+        paths (Iterable[Path]): The files to fingerprint. Order does not matter.
+        extra (Iterable[str]): Additional values mixed into the stamp (e.g., the LLM model names).
+
+    Returns:
+        str: The first 16 hex characters of the combined SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(paths):
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    for value in extra:
+        digest.update(value.encode("utf-8"))
+    return digest.hexdigest()[:16]
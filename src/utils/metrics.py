@@ -0,0 +1,465 @@
+"""
+Flow Run Metrics.
+
+This module records where the time and tokens of every TalentSelectionFlow run
+go: wall time per flow step, wall time, LLM calls and prompt/completion tokens
+per crew kickoff, and the guardrails that rejected an output (each rejection
+costs one retry). Measurements are collected into the `RunMetrics` of the run
+in progress (tracked with a context variable, so concurrent flows do not mix),
+appended as one JSON record per run to `RUN_METRICS_PATH`, and aggregated in
+an in-process registry exposed in the Prometheus text format, with p50/p95
+quantiles over a sliding window of recent observations.
+"""
+
+import asyncio
+import copy
+import threading
+import time
+from collections import defaultdict, deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+from crewai import BaseLLM, Crew, CrewOutput
+from crewai.events import LLMGuardrailCompletedEvent, crewai_event_bus
+from crewai.types.streaming import CrewStreamingOutput, StreamChunkType
+from crewai.types.usage_metrics import UsageMetrics
+from pydantic import BaseModel, Field
+
+from src.config.paths import RUN_METRICS_PATH
+from src.constants import METRICS_WINDOW
+from src.utils.logger import logger
+
+
+class StepMetrics(BaseModel):
+    """
+    Wall time of one flow step.
+
+    Attributes:
+        step (str): The flow method name.
+        seconds (float): Wall time spent in the step.
+        status (str): 'ok', 'error' or 'skipped' (completed in a previous attempt of the run).
+    """
+
+    step: str
+    seconds: float = 0.0
+    status: str = "ok"
+
+
+class CrewMetrics(BaseModel):
+    """
+    Cost of one crew kickoff.
+
+    Attributes:
+        crew (str): The crew name.
+        tasks (list[str]): Names of the crew's tasks.
+        seconds (float): Wall time of the kickoff.
+        llm_calls (int): Successful LLM requests, including guardrail retries.
+        prompt_tokens (int): Prompt tokens spent.
+        completion_tokens (int): Completion tokens spent.
+        status (str): 'ok', 'error' or 'cancelled'.
+    """
+
+    crew: str
+    tasks: list[str] = []
+    seconds: float = 0.0
+    llm_calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    status: str = "ok"
+
+
+class PromptCompaction(BaseModel):
+    """
+    Size of a crew input before and after it was compacted to the token budget.
+
+    Attributes:
+        stage (str): The crew stage receiving the input (e.g., 'classification').
+        tokens_before (int): Tokens of the original input.
+        tokens_after (int): Tokens of the compacted input.
+    """
+
+    stage: str
+    tokens_before: int
+    tokens_after: int
+
+
+class RunMetrics(BaseModel):
+    """
+    Metrics of one flow run, exported as a JSON record.
+
+    Attributes:
+        run_id (str): The flow state id.
+        started_at (datetime): When the run started (UTC).
+        seconds (float): Total wall time of the run.
+        status (str): 'running', 'ok' or 'error'.
+        steps (list[StepMetrics]): Flow steps, in completion order.
+        crews (list[CrewMetrics]): Crew kickoffs, in completion order.
+        guardrail_retries (dict[str, int]): Rejected outputs per guardrail function.
+        compactions (list[PromptCompaction]): Input token counts before and after compaction, per stage.
+    """
+
+    run_id: str = ""
+    started_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    seconds: float = 0.0
+    status: str = "running"
+    steps: list[StepMetrics] = []
+    crews: list[CrewMetrics] = []
+    guardrail_retries: dict[str, int] = {}
+    compactions: list[PromptCompaction] = []
+
+    @property
+    def llm_calls(self) -> int:
+        """Total LLM requests of the run."""
+        return sum(c.llm_calls for c in self.crews)
+
+    @property
+    def total_tokens(self) -> int:
+        """Total prompt and completion tokens of the run."""
+        return sum(c.prompt_tokens + c.completion_tokens for c in self.crews)
+
+
+_CURRENT_RUN: ContextVar[RunMetrics | None] = ContextVar("current_run_metrics", default=None)
+_GUARDRAIL_FEEDBACK: ContextVar[list[str] | None] = ContextVar("guardrail_feedback", default=None)
+
+
+class MetricsRegistry:
+    """
+    Thread-safe, in-process aggregation of run metrics.
+
+    Durations are kept as Prometheus summaries whose quantiles are computed
+    over the last `window` observations of each series, counters are
+    cumulative since the process started.
+    """
+
+    QUANTILES = (0.5, 0.95)
+
+    def __init__(self, window: int = METRICS_WINDOW) -> None:
+        """
+        Initializes an empty registry.
+
+        Args:
+            window (int): Number of recent observations used for the quantiles of each series.
+        """
+        self._lock = threading.Lock()
+        self._window = window
+        self._help: dict[str, tuple[str, str]] = {}
+        self._samples: dict[str, dict[tuple, deque]] = defaultdict(dict)
+        self._sums: dict[str, dict[tuple, list[float]]] = defaultdict(dict)
+        self._counters: dict[str, dict[tuple, float]] = defaultdict(lambda: defaultdict(float))
+
+    def observe(self, name: str, help_text: str, value: float, **labels: str) -> None:
+        """Records a duration observation in a summary series."""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._help[name] = ("summary", help_text)
+            self._samples[name].setdefault(key, deque(maxlen=self._window)).append(value)
+            totals = self._sums[name].setdefault(key, [0.0, 0])
+            totals[0] += value
+            totals[1] += 1
+
+    def inc(self, name: str, help_text: str, value: float = 1, **labels: str) -> None:
+        """Increments a counter series."""
+        with self._lock:
+            self._help[name] = ("counter", help_text)
+            self._counters[name][tuple(sorted(labels.items()))] += value
+
+    def render(self) -> str:
+        """
+        Renders every series in the Prometheus text exposition format.
+
+        Returns:
+            str: The exposition text.
+        """
+        lines: list[str] = []
+        with self._lock:
+            for name, (kind, help_text) in sorted(self._help.items()):
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+                if kind == "counter":
+                    for key, value in self._counters[name].items():
+                        lines.append(f"{name}{_labels(key)} {value:g}")
+                    continue
+
+                for key, samples in self._samples[name].items():
+                    ordered = sorted(samples)
+                    for q in self.QUANTILES:
+                        value = ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+                        lines.append(f"{name}{_labels(key + (('quantile', str(q)),))} {value:.6f}")
+                    total, count = self._sums[name][key]
+                    lines.append(f"{name}_sum{_labels(key)} {total:.6f}")
+                    lines.append(f"{name}_count{_labels(key)} {count}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(key: tuple) -> str:
+    """Formats a sorted label tuple as a Prometheus label set."""
+    if not key:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in key) + "}"
+
+
+REGISTRY = MetricsRegistry()
+"""MetricsRegistry: Process-wide registry served by `serve_metrics`."""
+
+_EXPORT_LOCK = threading.Lock()
+
+
+def current_run() -> RunMetrics | None:
+    """Returns the metrics of the flow run in progress, if any."""
+    return _CURRENT_RUN.get()
+
+
+@asynccontextmanager
+async def track_run(export_path: Path | None = RUN_METRICS_PATH) -> AsyncIterator[RunMetrics]:
+    """
+    Collects the metrics of a flow run.
+
+    Steps, crews and guardrail retries recorded inside the block are attached
+    to the yielded `RunMetrics`. On exit, the run is aggregated into the
+    registry and appended as a JSON line to `export_path`.
+
+    Args:
+        export_path (Path, optional): JSONL file receiving the run record. None disables the export.
+
+    Yields:
+        RunMetrics: The metrics of the run. The caller is expected to set `run_id`.
+    """
+    run = RunMetrics()
+    token = _CURRENT_RUN.set(run)
+    start = time.perf_counter()
+    try:
+        yield run
+        run.status = "ok"
+    except BaseException:
+        run.status = "error"
+        raise
+    finally:
+        _CURRENT_RUN.reset(token)
+        run.seconds = round(time.perf_counter() - start, 3)
+        await asyncio.to_thread(_finish_run, run, export_path)
+
+
+def _finish_run(run: RunMetrics, export_path: Path | None) -> None:
+    """Waits for pending event handlers, aggregates the run and exports its record."""
+    # Guardrail events are handled in the event bus thread pool
+    crewai_event_bus.flush(timeout=5.0)
+
+    REGISTRY.observe("talent_flow_run_seconds", "Wall time of flow runs.", run.seconds, status=run.status)
+    logger.info(
+        f"Run `{run.run_id}` {run.status} in {run.seconds}s: {run.llm_calls} LLM calls, "
+        f"{run.total_tokens} tokens, guardrail retries {run.guardrail_retries or 'none'}"
+    )
+
+    if export_path is not None:
+        export_path.parent.mkdir(parents=True, exist_ok=True)
+        with _EXPORT_LOCK, export_path.open("a", encoding="utf-8") as f:
+            f.write(run.model_dump_json() + "\n")
+
+
+@contextmanager
+def track_step(step: str) -> Iterator[StepMetrics]:
+    """
+    Measures the wall time of a flow step.
+
+    Args:
+        step (str): The flow method name.
+
+    Yields:
+        StepMetrics: The step record; set `status` to 'skipped' for steps not actually run.
+    """
+    metrics = StepMetrics(step=step)
+    start = time.perf_counter()
+    try:
+        yield metrics
+    except BaseException:
+        metrics.status = "error"
+        raise
+    finally:
+        metrics.seconds = round(time.perf_counter() - start, 3)
+        REGISTRY.observe(
+            "talent_flow_step_seconds", "Wall time of flow steps.", metrics.seconds, step=step, status=metrics.status
+        )
+        if (run := current_run()) is not None:
+            run.steps.append(metrics)
+
+
+def _private_llms(crew: Crew) -> list[BaseLLM]:
+    """
+    Gives the agents of a crew their own LLM copies, with token counters starting at zero.
+
+    crewai reports the usage of a kickoff as the sum of the counters of the
+    agents' LLMs, which are module-level instances shared by every crew (and by
+    `Crew.copy`), so they only ever grow. Agents sharing an LLM keep sharing one
+    copy, so their calls are not counted twice.
+
+    Args:
+        crew (Crew): The crew about to be kicked off.
+
+    Returns:
+        list[BaseLLM]: The distinct LLMs the crew now uses.
+    """
+    copies: dict[int, BaseLLM] = {}
+    for agent in crew.agents:
+        if not isinstance(agent.llm, BaseLLM):
+            continue
+        llm = copies.get(id(agent.llm))
+        if llm is None:
+            llm = copies[id(agent.llm)] = copy.copy(agent.llm)
+            llm._token_usage = dict.fromkeys(agent.llm._token_usage, 0)
+        agent.llm = llm
+        # An agent that already ran keeps calling the LLM of its executor
+        if agent.agent_executor is not None:
+            agent.agent_executor.llm = llm
+    return list(copies.values())
+
+
+async def kickoff_crew(
+    crew: Crew,
+    inputs: dict[str, Any],
+    on_token: Callable[[str], Awaitable[Any]] | None = None,
+    metrics: CrewMetrics | None = None,
+) -> CrewOutput:
+    """
+    Kicks off a crew asynchronously and records its wall time, LLM calls and tokens.
+
+    The crew must not be kicked off concurrently (e.g., lease it from `CREW_POOL`).
+
+    Args:
+        crew (Crew): The assembled crew.
+        inputs (dict[str, Any]): The kickoff inputs.
+        on_token (Callable, optional): Awaited with every text chunk of a streaming
+            crew (`stream=True`), e.g., to forward LLM tokens to the UI.
+        metrics (CrewMetrics, optional): Record to fill instead of a new one, e.g., to read
+            the spend of a kickoff that is cancelled or fails.
+
+    Returns:
+        CrewOutput: The crew output, whose `token_usage` is the usage of this kickoff only.
+    """
+    metrics = metrics or CrewMetrics(crew="")
+    metrics.crew = crew.name or "crew"
+    metrics.tasks = [t.name or "" for t in crew.tasks]
+    llms = _private_llms(crew)
+    usage = UsageMetrics()
+    start = time.perf_counter()
+    try:
+        # Native async execution: no executor thread is held during the LLM round-trips
+        output = await crew.akickoff(inputs=inputs)
+        if isinstance(output, CrewStreamingOutput):
+            async for chunk in output:
+                if on_token is not None and chunk.chunk_type == StreamChunkType.TEXT:
+                    await on_token(chunk.content)
+            output = output.result
+    except asyncio.CancelledError:
+        metrics.status = "cancelled"
+        raise
+    except BaseException:
+        metrics.status = "error"
+        raise
+    finally:
+        # Failed and cancelled kickoffs are recorded too: their LLM calls were spent all the same
+        for llm in llms:
+            usage.add_usage_metrics(llm.get_token_usage_summary())
+        metrics.llm_calls = usage.successful_requests
+        metrics.prompt_tokens = usage.prompt_tokens
+        metrics.completion_tokens = usage.completion_tokens
+        metrics.seconds = round(time.perf_counter() - start, 3)
+        REGISTRY.observe("talent_flow_crew_seconds", "Wall time of crew kickoffs.", metrics.seconds, crew=metrics.crew)
+        REGISTRY.inc("talent_flow_llm_calls_total", "LLM requests.", metrics.llm_calls, crew=metrics.crew)
+        REGISTRY.inc("talent_flow_tokens_total", "LLM tokens.", metrics.prompt_tokens, crew=metrics.crew, kind="prompt")
+        REGISTRY.inc(
+            "talent_flow_tokens_total", "LLM tokens.", metrics.completion_tokens, crew=metrics.crew, kind="completion"
+        )
+        if (run := current_run()) is not None:
+            run.crews.append(metrics)
+
+    output.token_usage = usage
+    return output
+
+
+def record_compaction(stage: str, tokens_before: int, tokens_after: int) -> None:
+    """
+    Records the input token counts of a crew stage before and after compaction.
+
+    Args:
+        stage (str): The crew stage receiving the input (e.g., 'classification').
+        tokens_before (int): Tokens of the original input.
+        tokens_after (int): Tokens of the compacted input.
+    """
+    logger.info(f"Prompt input of `{stage}`: {tokens_before} -> {tokens_after} tokens")
+    REGISTRY.inc("talent_flow_input_tokens_total", "Crew input tokens.", tokens_before, stage=stage, kind="before")
+    REGISTRY.inc("talent_flow_input_tokens_total", "Crew input tokens.", tokens_after, stage=stage, kind="after")
+    if (run := current_run()) is not None:
+        run.compactions.append(PromptCompaction(stage=stage, tokens_before=tokens_before, tokens_after=tokens_after))
+
+
+@asynccontextmanager
+async def collect_guardrail_feedback() -> AsyncIterator[list[str]]:
+    """
+    Collects the feedback of the guardrails that reject task outputs inside the block.
+
+    Yields:
+        list[str]: The feedback messages, complete once the block exits.
+    """
+    feedback: list[str] = []
+    token = _GUARDRAIL_FEEDBACK.set(feedback)
+    try:
+        yield feedback
+    finally:
+        _GUARDRAIL_FEEDBACK.reset(token)
+        # Guardrail events are handled in the event bus thread pool
+        await asyncio.to_thread(crewai_event_bus.flush, 5.0)
+
+
+@crewai_event_bus.on(LLMGuardrailCompletedEvent)
+def _on_guardrail_completed(source: Any, event: LLMGuardrailCompletedEvent) -> None:
+    """Counts a retry for the guardrail that rejected a task output."""
+    if event.success:
+        return
+
+    guardrail = getattr(event.from_task, "guardrail", None)
+    name = getattr(guardrail, "__name__", None) or str(guardrail)
+    REGISTRY.inc("talent_flow_guardrail_retries_total", "Task outputs rejected by a guardrail.", guardrail=name)
+    # Handlers run with a copy of the emitting context, so this is the run that called the crew
+    if (run := current_run()) is not None:
+        run.guardrail_retries[name] = run.guardrail_retries.get(name, 0) + 1
+    if (feedback := _GUARDRAIL_FEEDBACK.get()) is not None and event.error:
+        feedback.append(event.error)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """Serves the registry on `/metrics`."""
+
+    def do_GET(self) -> None:  # noqa: N802
+        if self.path.rstrip("/") != "/metrics":
+            self.send_error(404)
+            return
+        body = REGISTRY.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Silences the default per-request stderr logging."""
+
+
+def serve_metrics(port: int, host: str = "0.0.0.0") -> ThreadingHTTPServer:
+    """
+    Serves the Prometheus text endpoint at `http://host:port/metrics` in a daemon thread.
+
+    Args:
+        port (int): Port to listen on.
+        host (str): Interface to bind.
+
+    Returns:
+        ThreadingHTTPServer: The running server (call `shutdown()` to stop it).
+    """
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    logger.info(f"Serving Prometheus metrics on http://{host}:{port}/metrics")
+    return server
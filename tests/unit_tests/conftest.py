@@ -1,16 +1,26 @@
+import os
 import sys
 from pathlib import Path
 
 import pytest
 
 # Define the absolute path to the root of the project directory
-PROJECT_ROOT_DIR = Path.cwd().resolve().parents[2]
+PROJECT_ROOT_DIR = Path(__file__).resolve().parents[2]
 
 # Define the paths to the source, tests and data directories
 SRC_DIR = PROJECT_ROOT_DIR / "src"
 
-# Add the source directory to the system path for module imports
-sys.path.append(str(SRC_DIR))
+# Add the project root to the system path, so the source modules are imported as `src.<module>`
+sys.path.insert(0, str(PROJECT_ROOT_DIR))
+
+# The LLM configuration is built at import time from the environment: use placeholder models, the model cost map
+# bundled with litellm (instead of downloading it) and no telemetry
+os.environ.setdefault("LLM_GROQ_MODEL", "groq/test-model")
+os.environ.setdefault("LLM_GEMINI_MODEL", "gemini/test-model")
+os.environ.setdefault("LLM_OPENROUTER_MODEL", "openrouter/test-model")
+os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
 
 
 @pytest.fixture
@@ -0,0 +1,52 @@
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+from src.db_ingestion import chroma_client
+from src.db_ingestion.chroma_client import ChromaHandleCache, query_to_collection
+from tests.unit_tests.base_test_case import BaseTestCase
+
+
+class TestExplicitClientHandlesAreCached(BaseTestCase):
+    def given(self) -> None:
+        self.built_embedding_fns: list[object] = []
+        self.opened: list[tuple[Any, str, Any]] = []
+        self.client = object()
+
+        def get_embedding_function() -> object:
+            self.built_embedding_fns.append(object())
+            return self.built_embedding_fns[-1]
+
+        def get_collection(client: Any, collection_name: str, embedding_fn: Any | None = None) -> Any:
+            self.opened.append((client, collection_name, embedding_fn))
+            return SimpleNamespace(query=lambda **kwargs: {"ids": [[]], "distances": [[]], "metadatas": [[]]})
+
+        fakes = {
+            "CHROMA_HANDLES": ChromaHandleCache(),
+            "QUERY_EMBEDDINGS": SimpleNamespace(embed=lambda query_text, embedding_fn: [0.0, 1.0]),
+            "get_embedding_function": get_embedding_function,
+            "get_collection": get_collection,
+        }
+        for name, fake in fakes.items():
+            patcher = patch.object(chroma_client, name, fake)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def when(self) -> None:
+        for _ in range(3):
+            query_to_collection("cvs", "Python developer", country="", client=self.client)
+        self.refreshed = chroma_client.CHROMA_HANDLES.refresh("cvs", client=self.client)
+
+    def then(self) -> None:
+        # One handle and embedding function for the three queries, and new ones after the refresh
+        self.assertEqual(len(self.built_embedding_fns), 2)
+        self.assertEqual(
+            self.opened,
+            [(self.client, "cvs", self.built_embedding_fns[0]), (self.client, "cvs", self.built_embedding_fns[1])],
+        )
+        self.assertIs(chroma_client.CHROMA_HANDLES.embedding_function(), self.built_embedding_fns[1])
+
+    def test_queries_with_an_explicit_client_reuse_the_embedding_function(self) -> None:
+        self.given()
+        self.when()
+        self.then()
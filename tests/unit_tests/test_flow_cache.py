@@ -0,0 +1,146 @@
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from src.storage import flow_cache, metadata_cache
+from src.storage.flow_cache import FlowResultCache, crews_version
+from src.storage.metadata_cache import MetadataCache, extractor_version
+from tests.unit_tests.base_test_case import BaseTestCase
+
+DOCUMENT = "# Senior Python Developer\nWe are looking for a backend engineer."
+OPTIONS = {"top_k": 3, "chroma_dir": "/data/chroma"}
+
+
+class FlowCacheTestCase(BaseTestCase):
+    """Stores a flow result in a temporary cache, under the key of `DOCUMENT` and `OPTIONS`."""
+
+    def given(self) -> None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.cache = FlowResultCache(Path(tmp_dir.name) / "flow_results.sqlite3")
+        self.stored_key = self.cache.make_key(DOCUMENT, options=OPTIONS)
+        self.cache.put(self.stored_key, "jobs", "# Report", {"input_type": "job"})
+
+
+class TestFlowCacheHitWithSameKey(FlowCacheTestCase):
+    def when(self) -> None:
+        self.key = self.cache.make_key(DOCUMENT, options=dict(OPTIONS))
+        self.result = self.cache.get(self.key)
+
+    def then(self) -> None:
+        self.assertEqual(self.key, self.stored_key)
+        self.assertEqual(self.result, ("# Report", {"input_type": "job"}))
+
+    def test_same_document_and_options_hit(self) -> None:
+        self.given()
+        self.when()
+        self.then()
+
+
+class TestFlowCacheMissWhenModelChanges(FlowCacheTestCase):
+    def when(self) -> None:
+        with patch.object(flow_cache, "CONFIGURED_MODELS", ("openrouter/another-model",)):
+            self.key = self.cache.make_key(DOCUMENT, options=OPTIONS)
+        self.result = self.cache.get(self.key)
+
+    def then(self) -> None:
+        self.assertNotEqual(self.key, self.stored_key)
+        self.assertIsNone(self.result)
+
+    def test_switching_the_llm_model_misses(self) -> None:
+        self.given()
+        self.when()
+        self.then()
+
+
+class TestFlowCacheMissWhenCrewsChange(FlowCacheTestCase):
+    def when(self) -> None:
+        with patch.object(flow_cache, "crews_version", return_value="edited-guardrail"):
+            self.key = self.cache.make_key(DOCUMENT, options=OPTIONS)
+        self.result = self.cache.get(self.key)
+
+    def then(self) -> None:
+        self.assertNotEqual(self.key, self.stored_key)
+        self.assertIsNone(self.result)
+
+    def test_editing_the_crews_misses(self) -> None:
+        self.given()
+        self.when()
+        self.then()
+
+
+class TestFlowCacheMissWhenPersistDirChanges(FlowCacheTestCase):
+    def when(self) -> None:
+        self.key = self.cache.make_key(DOCUMENT, options={**OPTIONS, "chroma_dir": "/tmp/staging-chroma"})
+        self.result = self.cache.get(self.key)
+
+    def then(self) -> None:
+        self.assertNotEqual(self.key, self.stored_key)
+        self.assertIsNone(self.result)
+
+    def test_another_chroma_persist_dir_misses(self) -> None:
+        self.given()
+        self.when()
+        self.then()
+
+
+class TestCrewsVersionCoversPythonSources(BaseTestCase):
+    def given(self) -> None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.crews_dir = Path(tmp_dir.name) / "crews"
+        (self.crews_dir / "some_crew" / "config").mkdir(parents=True)
+        (self.crews_dir / "some_crew" / "config" / "tasks.yaml").write_text("task: {description: Analyse}")
+        (self.crews_dir / "some_crew" / "guardrails.py").write_text("MAX_SKILLS = 20\n")
+        self.skills_dir = Path(tmp_dir.name) / "skills"
+        self.skills_dir.mkdir()
+        (self.skills_dir / "taxonomy.py").write_text("SKILL_ALIASES = {}\n")
+
+        self.addCleanup(crews_version.cache_clear)
+        for name, path in (("CREWS_DIR", self.crews_dir), ("SKILLS_DIR", self.skills_dir)):
+            patcher = patch.object(flow_cache, name, path)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def when(self) -> None:
+        crews_version.cache_clear()
+        self.before = crews_version()
+        (self.crews_dir / "some_crew" / "guardrails.py").write_text("MAX_SKILLS = 30\n")
+        crews_version.cache_clear()
+        self.after_guardrail = crews_version()
+        (self.skills_dir / "taxonomy.py").write_text("SKILL_ALIASES = {'k8s': 'Kubernetes'}\n")
+        crews_version.cache_clear()
+        self.after_taxonomy = crews_version()
+
+    def then(self) -> None:
+        self.assertNotEqual(self.before, self.after_guardrail)
+        self.assertNotEqual(self.after_guardrail, self.after_taxonomy)
+
+    def test_editing_a_guardrail_or_the_taxonomy_changes_the_version(self) -> None:
+        self.given()
+        self.when()
+        self.then()
+
+
+class TestMetadataCacheMissWhenModelChanges(BaseTestCase):
+    def given(self) -> None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.addCleanup(extractor_version.cache_clear)
+        self.cache = MetadataCache(Path(tmp_dir.name) / "metadata.sqlite3")
+        self.cache.put(DOCUMENT, "JobMetadataExtractorCrew", {"skills": "Python"})
+
+    def when(self) -> None:
+        self.same_model = self.cache.get(DOCUMENT, "JobMetadataExtractorCrew")
+        with patch.object(metadata_cache, "CONFIGURED_MODELS", ("openrouter/another-model",)):
+            extractor_version.cache_clear()
+            self.other_model = self.cache.get(DOCUMENT, "JobMetadataExtractorCrew")
+
+    def then(self) -> None:
+        self.assertEqual(self.same_model, {"skills": "Python"})
+        self.assertIsNone(self.other_model)
+
+    def test_switching_the_llm_model_misses(self) -> None:
+        self.given()
+        self.when()
+        self.then()
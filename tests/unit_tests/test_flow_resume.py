@@ -0,0 +1,86 @@
+import asyncio
+import tempfile
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from crewai.flow.persistence import SQLiteFlowPersistence
+
+from src.storage.flow_cache import FlowResultCache
+from src.storage.report_store import ReportStore
+from src.talent_selection_flow.crews.classification_crew.enums import DocumentType
+from src.talent_selection_flow.crews.schemas import GapAnalysis, Questions
+from src.talent_selection_flow.flow import TalentSelectionFlow
+from src.talent_selection_flow.schemas import TalentState
+from tests.unit_tests.base_test_case import BaseTestCase
+
+RUN_ID = "run-with-failed-document"
+
+
+async def analyse_document(
+    flow: TalentSelectionFlow,
+    crew_cls: type,
+    profile_key: str,
+    docs_key: str,
+    doc_id: str,
+    doc: dict[str, Any],
+    local_gaps: GapAnalysis | None = None,
+) -> None:
+    """Stands in for the per-document crews: every document is analysed successfully."""
+    flow.state.gap_analysis[doc_id] = GapAnalysis(matched_skills=["Python"], missing_must_have=[])
+    flow.state.interview_questions[doc_id] = Questions(
+        matched_skill_questions=[],
+        gap_probing_questions=[],
+        ambiguity_clarification_questions=[],
+        seniority_questions=[],
+    )
+
+
+class TestResumeAfterFailedDocument(BaseTestCase):
+    def given(self) -> None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        tmp_path = Path(tmp_dir.name)
+
+        self.checkpoint_store = SQLiteFlowPersistence(str(tmp_path / "flow_states.sqlite3"))
+        self.result_cache = FlowResultCache(tmp_path / "flow_results.sqlite3")
+
+        # Checkpoint of an earlier attempt: the vector query completed, and `cv-2` failed in the analysis
+        state = TalentState(
+            id=RUN_ID,
+            raw_input="# Backend developer\nWe are looking for a Python developer.",
+            input_type=DocumentType.JOB,
+            metadata={"title": "Backend developer", "skills": "Python"},
+            collection_name="cvs",
+            related_docs={
+                "cv-1": {"title": "Python developer", "skills": "Python", "similarity": 0.91},
+                "cv-2": {"title": "Go developer", "skills": "Go, Python", "similarity": 0.84},
+            },
+            failed_docs={"cv-2": "LLM request timed out"},
+            completed_steps=["classify_input", "extract_metadata", "query_to_db"],
+        )
+        self.checkpoint_store.save_state(flow_uuid=RUN_ID, method_name="query_to_db", state_data=state)
+
+        self.flow = TalentSelectionFlow(
+            per_document_analysis=True,
+            skill_matching="off",
+            use_metadata_cache=False,
+            result_cache=self.result_cache,
+            checkpoint_store=self.checkpoint_store,
+            report_store=ReportStore(tmp_path / "reports"),
+        )
+
+    def when(self) -> None:
+        with patch.object(TalentSelectionFlow, "_analyse_document", analyse_document):
+            asyncio.run(self.flow.resume(RUN_ID))
+
+    def then(self) -> None:
+        self.assertEqual(self.flow.state.failed_docs, {})
+        self.assertEqual(set(self.flow.state.gap_analysis), {"cv-1", "cv-2"})
+        self.assertIn("cv-2", self.flow.state.report)
+        self.assertIsNotNone(self.result_cache.get(self.flow._result_cache_key()))
+
+    def test_resumed_analysis_drops_the_earlier_errors_and_caches_the_report(self) -> None:
+        self.given()
+        self.when()
+        self.then()
@@ -0,0 +1,73 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from src.db_ingestion import pipeline
+from src.db_ingestion.pipeline import TokenBucket, diff_corpus
+from tests.unit_tests.base_test_case import BaseTestCase
+
+
+class TestDiffCorpus(BaseTestCase):
+    def given(self) -> None:
+        self.corpus_hashes = {"cv-new": "a1", "cv-changed": "b2", "cv-same": "c1", "cv-unhashed": "d1"}
+        # `cv-unhashed` was stored before content hashes were recorded
+        self.stored_hashes = {"cv-changed": "b1", "cv-same": "c1", "cv-unhashed": None, "cv-removed": "e1"}
+
+    def when(self) -> None:
+        self.diff = diff_corpus(self.corpus_hashes, self.stored_hashes)
+
+    def then(self) -> None:
+        self.assertEqual(self.diff.new, ["cv-new"])
+        self.assertEqual(self.diff.changed, ["cv-changed", "cv-unhashed"])
+        self.assertEqual(self.diff.unchanged, ["cv-same"])
+        self.assertEqual(self.diff.missing, ["cv-removed"])
+
+    def test_documents_are_split_into_new_changed_unchanged_and_removed(self) -> None:
+        self.given()
+        self.when()
+        self.then()
+
+
+class TestTokenBucketRefill(BaseTestCase):
+    def given(self) -> None:
+        # A fake clock, advanced by the waits of the bucket
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+        async def sleep(seconds: float) -> None:
+            self.sleeps.append(seconds)
+            self.now += seconds
+
+        clock = SimpleNamespace(monotonic=lambda: self.now)
+        for target, name, fake in ((pipeline, "time", clock), (pipeline.asyncio, "sleep", sleep)):
+            patcher = patch.object(target, name, fake)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.bucket = TokenBucket(rate_per_minute=60)
+
+    def when(self) -> None:
+        async def run() -> None:
+            await self.bucket.acquire(60)
+            self.now += 30
+            await self.bucket.acquire(45)
+            self.after_wait = self.bucket.tokens
+            self.now += 600
+            self.bucket.debit(-10)
+            self.after_idle = self.bucket.tokens
+            self.bucket.debit(70)
+            await self.bucket.acquire(500)
+
+        asyncio.run(run())
+
+    def then(self) -> None:
+        # 30 tokens accrued in 30 seconds, so 15 more were awaited; a larger request waits for a full bucket
+        self.assertAlmostEqual(self.sleeps[0], 15)
+        self.assertAlmostEqual(self.after_wait, 0)
+        self.assertEqual(self.after_idle, 60)
+        self.assertAlmostEqual(sum(self.sleeps[1:]), 70)
+        self.assertAlmostEqual(self.bucket.tokens, 0)
+
+    def test_tokens_refill_at_the_rate_up_to_the_capacity(self) -> None:
+        self.given()
+        self.when()
+        self.then()
@@ -0,0 +1,121 @@
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+from src.db_ingestion import chroma_client
+from src.db_ingestion.chroma_client import filter_by_similarity, query_to_collection, reshape_chroma_results
+from tests.unit_tests.base_test_case import BaseTestCase
+
+
+def chroma_output(distances: dict[str, float], country: str = "Spain") -> dict[str, Any]:
+    """Builds a raw `collection.query` output with the given cosine distances, in ranking order."""
+    return {
+        "ids": [list(distances)],
+        "distances": [list(distances.values())],
+        "metadatas": [[{"title": doc_id, "country": country} for doc_id in distances]],
+    }
+
+
+class FakeCollection:
+    """
+    Collection returning synthetic distances, with a separate ranking for the country-filtered search.
+
+    Attributes:
+        queries (list[dict[str, Any]]): The `n_results` and `where` arguments of every query.
+    """
+
+    def __init__(self, local: dict[str, float], worldwide: dict[str, float]) -> None:
+        self.local = local
+        self.worldwide = worldwide
+        self.queries: list[dict[str, Any]] = []
+
+    def query(self, query_embeddings: list[list[float]], n_results: int, where: dict | None = None) -> dict:
+        self.queries.append({"n_results": n_results, "where": where})
+        distances = self.local if where else self.worldwide
+        return chroma_output(dict(list(distances.items())[:n_results]))
+
+
+class TestMinSimilarityDropsWeakMatches(BaseTestCase):
+    def given(self) -> None:
+        self.results = reshape_chroma_results(chroma_output({"job-1": 0.1, "job-2": 0.3, "job-3": 0.6}))
+
+    def when(self) -> None:
+        self.kept = filter_by_similarity(self.results, min_similarity=0.6)
+
+    def then(self) -> None:
+        self.assertEqual(list(self.kept), ["job-1", "job-2"])
+
+    def test_matches_below_the_minimum_similarity_are_dropped(self) -> None:
+        self.given()
+        self.when()
+        self.then()
+
+
+class TestMaxSimilarityGapCutsTheTail(BaseTestCase):
+    def given(self) -> None:
+        # Similarities 0.9, 0.85 and 0.8, then a drop of 0.4 to 0.4 and 0.38
+        self.results = reshape_chroma_results(
+            chroma_output({"job-1": 0.1, "job-2": 0.15, "job-3": 0.2, "job-4": 0.6, "job-5": 0.62})
+        )
+
+    def when(self) -> None:
+        self.kept = filter_by_similarity(self.results, max_similarity_gap=0.2)
+        self.unfiltered = filter_by_similarity(self.results)
+
+    def then(self) -> None:
+        self.assertEqual(list(self.kept), ["job-1", "job-2", "job-3"])
+        self.assertEqual(list(self.unfiltered), list(self.results))
+
+    def test_results_are_cut_at_the_first_large_similarity_drop(self) -> None:
+        self.given()
+        self.when()
+        self.then()
+
+
+class QueryTestCase(BaseTestCase):
+    """Runs `query_to_collection` against a `FakeCollection` instead of the ChromaDB handles."""
+
+    local: dict[str, float] = {}
+    worldwide: dict[str, float] = {}
+
+    def given(self) -> None:
+        self.collection = FakeCollection(self.local, self.worldwide)
+        handles = SimpleNamespace(collection=lambda *args, **kwargs: self.collection, embedding_function=lambda: None)
+        embeddings = SimpleNamespace(embed=lambda query_text, embedding_fn: [0.0, 1.0])
+        for name, fake in (("CHROMA_HANDLES", handles), ("QUERY_EMBEDDINGS", embeddings)):
+            patcher = patch.object(chroma_client, name, fake)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+class TestQueryKeepsTopK(QueryTestCase):
+    worldwide = {"cv-1": 0.1, "cv-2": 0.12, "cv-3": 0.14, "cv-4": 0.16}
+
+    def when(self) -> None:
+        self.results = query_to_collection("cvs", "Python developer", country="", top_k=2, min_similarity=None)
+
+    def then(self) -> None:
+        self.assertEqual(self.collection.queries, [{"n_results": 2, "where": None}])
+        self.assertEqual(list(self.results), ["cv-1", "cv-2"])
+
+    def test_at_most_top_k_matches_are_returned(self) -> None:
+        self.given()
+        self.when()
+        self.then()
+
+
+class TestQueryFallsBackWhenNothingPasses(QueryTestCase):
+    local = {"cv-local": 0.7}
+    worldwide = {"cv-1": 0.1, "cv-local": 0.7}
+
+    def when(self) -> None:
+        self.results = query_to_collection("cvs", "Python developer", country="Spain", top_k=5, min_similarity=0.5)
+
+    def then(self) -> None:
+        self.assertEqual([query["where"] for query in self.collection.queries], [{"country": "Spain"}, None])
+        self.assertEqual(list(self.results), ["cv-1"])
+
+    def test_worldwide_search_runs_when_no_country_match_passes_the_cutoff(self) -> None:
+        self.given()
+        self.when()
+        self.then()
@@ -0,0 +1,84 @@
+from src.skills.matcher import SkillIndex, match_skills
+from src.talent_selection_flow.crews.schemas import GapAnalysis
+from tests.unit_tests.base_test_case import BaseTestCase
+
+
+class TestMatchedAndMissingSkills(BaseTestCase):
+    def given(self) -> None:
+        self.candidate = "python3, Postgres, k8s, Python scripting, Excel"
+        self.required = "Python, PostgreSQL, Kubernetes, Terraform, Go"
+
+    def when(self) -> None:
+        self.gaps = match_skills(self.candidate, self.required)
+
+    def then(self) -> None:
+        self.assertEqual(self.gaps.matched_skills, ["Python", "PostgreSQL", "Kubernetes"])
+        self.assertEqual(self.gaps.missing_must_have, ["Terraform", "Go"])
+
+    def test_aliases_evidence_the_required_skills_and_the_others_are_missing(self) -> None:
+        self.given()
+        self.when()
+        self.then()
+
+
+class TestEvidenceIsDirectional(BaseTestCase):
+    def given(self) -> None:
+        self.index = SkillIndex({"uses-github": "GitHub, Docker", "uses-git": "Git, Containerization"})
+
+    def when(self) -> None:
+        self.git_required = self.index.match("Git, Containerization")
+        self.github_required = self.index.match("GitHub, Docker")
+
+    def then(self) -> None:
+        # GitHub evidences Git and Docker evidences containerization...
+        self.assertEqual(self.git_required["uses-github"].matched_skills, ["Git", "Containerization"])
+        self.assertEqual(self.git_required["uses-git"].matched_skills, ["Git", "Containerization"])
+        # ... but not the other way around
+        self.assertEqual(self.github_required["uses-git"].missing_must_have, ["GitHub", "Docker"])
+        self.assertEqual(self.github_required["uses-github"].matched_skills, ["GitHub", "Docker"])
+
+    def test_a_related_skill_only_evidences_the_broader_one(self) -> None:
+        self.given()
+        self.when()
+        self.then()
+
+
+class TestEmptySkills(BaseTestCase):
+    def given(self) -> None:
+        self.index = SkillIndex({"no-skills": None, "empty": "", "python": "Python"})
+
+    def when(self) -> None:
+        self.nothing_required = self.index.match(None)
+        self.coverage = self.index.coverage("")
+        self.no_candidate_skills = match_skills(None, "Python, SQL")
+
+    def then(self) -> None:
+        empty = GapAnalysis(matched_skills=[], missing_must_have=[])
+        self.assertEqual(self.nothing_required, {"no-skills": empty, "empty": empty, "python": empty})
+        self.assertEqual(self.coverage, {"no-skills": 1.0, "empty": 1.0, "python": 1.0})
+        self.assertEqual(self.no_candidate_skills.matched_skills, [])
+        self.assertEqual(self.no_candidate_skills.missing_must_have, ["Python", "SQL"])
+
+    def test_missing_skills_fields_match_nothing_and_require_nothing(self) -> None:
+        self.given()
+        self.when()
+        self.then()
+
+
+class TestRelatedSkillsEvidenceTheBroaderOne(BaseTestCase):
+    def given(self) -> None:
+        self.candidate = "T-SQL, Continuous Integration, analytics, Neural Networks"
+        self.required = "Microsoft SQL Server, CI/CD, Data Analysis, Deep Learning"
+
+    def when(self) -> None:
+        self.broader_required = match_skills(self.candidate, self.required)
+        self.narrower_required = match_skills(self.required, self.candidate)
+
+    def then(self) -> None:
+        self.assertEqual(self.broader_required.missing_must_have, [])
+        self.assertEqual(self.narrower_required.matched_skills, [])
+
+    def test_narrower_skills_evidence_the_broader_required_ones_only(self) -> None:
+        self.given()
+        self.when()
+        self.then()
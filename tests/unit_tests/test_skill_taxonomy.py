@@ -0,0 +1,72 @@
+from src.skills.taxonomy import canonical_skill, split_skills
+from tests.unit_tests.base_test_case import BaseTestCase
+
+
+class TestSplitSkills(BaseTestCase):
+    def given(self) -> None:
+        self.fields = {
+            "flattened": "Python, SQL;Docker | Git\n• Linux,, ",
+            "split": ["Python ", "", "  ", "SQL"],
+            "empty": "",
+            "missing": None,
+        }
+
+    def when(self) -> None:
+        self.skills = {name: split_skills(field) for name, field in self.fields.items()}
+
+    def then(self) -> None:
+        self.assertEqual(self.skills["flattened"], ["Python", "SQL", "Docker", "Git", "Linux"])
+        self.assertEqual(self.skills["split"], ["Python", "SQL"])
+        self.assertEqual(self.skills["empty"], [])
+        self.assertEqual(self.skills["missing"], [])
+
+    def test_skills_fields_are_split_at_every_separator(self) -> None:
+        self.given()
+        self.when()
+        self.then()
+
+
+class TestCanonicalSkill(BaseTestCase):
+    def given(self) -> None:
+        self.skills = ["python3.11", "Postgres", "K8s", "Python (advanced)", "C#", "C++", "Node.js", "GitHub"]
+
+    def when(self) -> None:
+        self.canonical = [canonical_skill(skill) for skill in self.skills]
+
+    def then(self) -> None:
+        self.assertEqual(
+            self.canonical,
+            [
+                ("python", "Python"),
+                ("postgresql", "PostgreSQL"),
+                ("kubernetes", "Kubernetes"),
+                ("python", "Python"),
+                ("c#", "C#"),
+                ("c++", "C++"),
+                ("node.js", "Node.js"),
+                ("github", "GitHub"),
+            ],
+        )
+
+    def test_aliases_versions_and_qualifiers_resolve_to_the_canonical_name(self) -> None:
+        self.given()
+        self.when()
+        self.then()
+
+
+class TestRelatedSkillsAreNotAliases(BaseTestCase):
+    def given(self) -> None:
+        self.skills = ["Analytics", "Project Planning", "People Management", "Neural Networks", "Scrum Master"]
+        self.skills += ["T-SQL", "Continuous Integration", "TS"]
+
+    def when(self) -> None:
+        self.canonical = [canonical_skill(skill) for skill in self.skills]
+
+    def then(self) -> None:
+        # Broader, narrower or ambiguous skills keep their own wording
+        self.assertEqual(self.canonical, [(skill.lower(), skill) for skill in self.skills])
+
+    def test_related_skills_keep_their_own_name(self) -> None:
+        self.given()
+        self.when()
+        self.then()
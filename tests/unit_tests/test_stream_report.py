@@ -0,0 +1,94 @@
+import asyncio
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+from src.talent_selection_flow import flow as flow_module
+from src.talent_selection_flow.crews.classification_crew.enums import DocumentType
+from src.talent_selection_flow.crews.cv_to_job_crew.crew import CVToJobCrew
+from src.talent_selection_flow.crews.utils import iter_report_sections
+from src.talent_selection_flow.flow import TalentSelectionFlow
+from tests.unit_tests.base_test_case import BaseTestCase
+
+RELATED_DOCS = {
+    "job-1": {"title": "Backend developer", "skills": "Python", "similarity": 0.91},
+    "job-2": {"title": "Data engineer", "skills": "Python, Spark", "similarity": 0.84},
+}
+
+
+@contextmanager
+def lease(*args: Any, **kwargs: Any) -> Any:
+    """Stands in for `CREW_POOL.lease`: the crew itself is never used by `kickoff_crew`."""
+    yield None
+
+
+async def kickoff_crew(crew: Any, inputs: dict[str, Any]) -> SimpleNamespace:
+    """Stands in for the per-document crews: the gap analysis of `job-1` is the slowest stage."""
+    (doc_id,) = inputs["jobs"]
+    if "skill_match" in inputs:
+        await asyncio.sleep(0.05 if doc_id == "job-1" else 0)
+        entry = {"matched_skills": ["Python"], "missing_must_have": []}
+    else:
+        entry = {
+            "matched_skill_questions": [
+                {"question": f"How did you use Python at {doc_id}?", "response": "In production."}
+            ],
+            "gap_probing_questions": [],
+            "ambiguity_clarification_questions": [],
+            "seniority_questions": [],
+        }
+    return SimpleNamespace(json_dict={"docs": {doc_id: entry}})
+
+
+class TestPerDocumentStreamMatchesReport(BaseTestCase):
+    def given(self) -> None:
+        self.flow = TalentSelectionFlow(
+            per_document_analysis=True,
+            skill_matching="off",
+            use_metadata_cache=False,
+            result_cache=None,
+            checkpoint_store=None,
+        )
+        self.flow.state.input_type = DocumentType.CV
+        self.flow.state.metadata = {"skills": "Python"}
+        self.flow.state.related_docs = dict(RELATED_DOCS)
+
+    def when(self) -> None:
+        async def run() -> list[str]:
+            sections: asyncio.Queue[str | None] = asyncio.Queue()
+            self.flow._sections = sections
+            await self.flow._run_analysis(CVToJobCrew, "cv", "jobs")
+            sections.put_nowait(None)
+            return [section async for section in _drain(sections)]
+
+        with (
+            patch.object(flow_module.CREW_POOL, "lease", lease),
+            patch.object(flow_module, "kickoff_crew", kickoff_crew),
+        ):
+            self.streamed = asyncio.run(run())
+
+    def then(self) -> None:
+        state = self.flow.state
+        report_sections = list(
+            iter_report_sections(
+                state.input_type,
+                state.metadata,
+                state.related_docs,
+                {"docs": {k: v.model_dump() for k, v in state.gap_analysis.items()}},
+                {"docs": {k: v.model_dump() for k, v in state.interview_questions.items()}},
+            )
+        )
+        # The summary and the matches are streamed by the earlier steps
+        self.assertEqual(self.streamed, report_sections[2:])
+
+    def test_streamed_analysis_has_the_headers_and_order_of_the_report(self) -> None:
+        self.given()
+        self.when()
+        self.then()
+
+
+async def _drain(sections: asyncio.Queue[str | None]) -> Any:
+    """Yields the queued sections up to the end marker."""
+    while (section := await sections.get()) is not None:
+        yield section
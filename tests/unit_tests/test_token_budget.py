@@ -0,0 +1,45 @@
+from src.constants import INPUT_TOKEN_BUDGET
+from src.llm.token_budget import compact_document, count_tokens
+from tests.unit_tests.base_test_case import BaseTestCase
+
+EXPERIENCE = "Python developer with ten years of experience in backend services. " * 600
+DOCUMENT = f"# Jane Doe\n\n{EXPERIENCE}\n\n-----\n\n![photo](photo.png)\n\n# References\nAvailable on request"
+
+
+class TestDefaultCompactionIsLossless(BaseTestCase):
+    def given(self) -> None:
+        self.budget = INPUT_TOKEN_BUDGET
+
+    def when(self) -> None:
+        self.compacted, self.tokens_before, self.tokens_after = compact_document(DOCUMENT, self.budget)
+
+    def then(self) -> None:
+        self.assertIsNone(self.budget)
+        self.assertNotIn("![photo]", self.compacted)
+        self.assertIn(EXPERIENCE.strip(), self.compacted)
+        self.assertIn("# References\nAvailable on request", self.compacted)
+        self.assertLess(self.tokens_after, self.tokens_before)
+
+    def test_long_documents_are_cleaned_but_never_truncated_by_default(self) -> None:
+        self.given()
+        self.when()
+        self.then()
+
+
+class TestOptInBudgetTruncates(BaseTestCase):
+    def given(self) -> None:
+        self.budget = 500
+
+    def when(self) -> None:
+        self.compacted, _, self.tokens_after = compact_document(DOCUMENT, self.budget)
+
+    def then(self) -> None:
+        self.assertLessEqual(self.tokens_after, self.budget)
+        self.assertEqual(count_tokens(self.compacted), self.tokens_after)
+        self.assertNotIn("# References", self.compacted)
+        self.assertTrue(self.compacted.startswith("# Jane Doe"))
+
+    def test_an_explicit_budget_drops_low_priority_sections_and_the_tail(self) -> None:
+        self.given()
+        self.when()
+        self.then()